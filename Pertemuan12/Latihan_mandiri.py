@@ -1,9 +1,22 @@
 # -------------------------- Sistem Validasi Registrasi Mahasiswa -------------------------- 
 from abc import ABC, abstractmethod
+from array import array
+from dataclasses import dataclass
+from itertools import compress
+from typing import Iterable, Sequence
+import argparse
 import logging
+import os
+import sys
+import time
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "bersama"))  # modul bersama: money, wal, metrics, profiler
+from instrumentasi import AKTIF as INSTRUMENTASI, SPANS, event
+from jadwal import JadwalIndex, SesiKuliah
+import profiler as profiling
 
 # Konfigurasi dasar logging
 logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
+LOGGER = logging.getLogger('REGISTRASI')
 
 class Mahasiswa:
     """
@@ -12,11 +25,73 @@ class Mahasiswa:
         nim (str): Nomor Induk Mahasiswa.
         sks_diambil (int): Jumlah SKS yang diambil mahasiswa pada semester ini.
         matkul_prasyarat (bool): Status pemenuhan mata kuliah prasyarat.
+        kelas_diambil (Sequence[str]): Kode kelas (sesi jadwal) yang dipilih mahasiswa.
     """
-    def __init__(self, nim: str, sks_diambil: int, matkul_prasyarat: bool = True):
+    def __init__(self, nim: str, sks_diambil: int, matkul_prasyarat: bool = True, kelas_diambil: Sequence[str] = ()):
         self.nim = nim
         self.sks_diambil = sks_diambil
         self.matkul_prasyarat = matkul_prasyarat
+        self.kelas_diambil = kelas_diambil
+
+class MahasiswaBatch:
+    """
+    Tabel kolumnar (struct-of-arrays) berisi satu angkatan mahasiswa.
+    Setiap kolom disimpan dalam satu array bertipe sehingga aturan validasi
+    dapat memproses seluruh kolom sekaligus tanpa membuat objek Mahasiswa per baris.
+    Args:
+        nim (Sequence[str]): Kolom NIM.
+        sks_diambil (Sequence[int]): Kolom SKS yang diambil (list, array, atau NumPy array).
+        matkul_prasyarat (Sequence[bool]): Kolom status prasyarat.
+        kelas_diambil (Sequence[Sequence[str]] | None): Kolom kelas pilihan (opsional).
+    """
+    def __init__(
+        self,
+        nim: Sequence[str],
+        sks_diambil: Sequence[int],
+        matkul_prasyarat: Sequence[bool],
+        kelas_diambil: Sequence[Sequence[str]] | None = None,
+    ):
+        if not (len(nim) == len(sks_diambil) == len(matkul_prasyarat)):
+            raise ValueError("Panjang semua kolom MahasiswaBatch harus sama.")
+        if kelas_diambil is not None and len(kelas_diambil) != len(nim):
+            raise ValueError("Panjang semua kolom MahasiswaBatch harus sama.")
+        self.nim = list(nim)
+        self.sks_diambil = array('i', sks_diambil)
+        self.matkul_prasyarat = array('b', matkul_prasyarat)
+        self.kelas_diambil = list(kelas_diambil) if kelas_diambil is not None else None
+
+    @classmethod
+    def from_mahasiswa(cls, daftar_mhs: Sequence[Mahasiswa]) -> "MahasiswaBatch":
+        """Membangun batch kolumnar dari daftar objek Mahasiswa."""
+        return cls(
+            [m.nim for m in daftar_mhs],
+            [m.sks_diambil for m in daftar_mhs],
+            [m.matkul_prasyarat for m in daftar_mhs],
+            [m.kelas_diambil for m in daftar_mhs],
+        )
+
+    def __len__(self) -> int:
+        return len(self.nim)
+
+    def row(self, i: int) -> Mahasiswa:
+        """Mengembalikan baris ke-i sebagai objek Mahasiswa (untuk jalur per-baris)."""
+        kelas = self.kelas_diambil[i] if self.kelas_diambil is not None else ()
+        return Mahasiswa(self.nim[i], self.sks_diambil[i], bool(self.matkul_prasyarat[i]), kelas)
+
+@dataclass
+class RegistrationBatchResult:
+    """
+    Hasil registrasi satu batch.
+    Args:
+        diterima (list[bool]): Mask hasil registrasi per baris.
+        gagal_oleh (list[str | None]): Nama aturan pertama yang gagal per baris (None jika lolos).
+    """
+    diterima: list[bool]
+    gagal_oleh: list[str | None]
+
+    @property
+    def jumlah_diterima(self) -> int:
+        return sum(self.diterima)
 
 # 2. Implementasi DIP/OCP: Abstraksi IValidationRule
 class IValidationRule(ABC):
@@ -30,6 +105,19 @@ class IValidationRule(ABC):
         """
         pass
 
+    def validate_batch(self, batch: MahasiswaBatch, indeks: Sequence[int]) -> list[bool]:
+        """
+        Memvalidasi baris-baris batch pada posisi `indeks`.
+        Implementasi default adalah jalur per-baris (memanggil validate untuk tiap baris);
+        aturan yang punya bentuk kolumnar cukup meng-override method ini.
+        Args:
+            batch (MahasiswaBatch): Batch kolumnar mahasiswa.
+            indeks (Sequence[int]): Posisi baris yang masih perlu divalidasi.
+        Returns:
+            list[bool]: Mask hasil validasi, sejajar dengan `indeks`.
+        """
+        return [self.validate(batch.row(i)) for i in indeks]
+
 # 2. Implementasi DIP/OCP: Kelas Konkrit (Rules)
 class SksLimitRule(IValidationRule):
     """Aturan validasi Batas SKS (Memenuhi SRP)."""
@@ -39,21 +127,39 @@ class SksLimitRule(IValidationRule):
         Memeriksa apakah SKS yang diambil melebihi batas 24 SKS.
         """
         if data.sks_diambil > self.SKS_LIMIT:
-            logging.warning(f"GAGAL : Batas SKS terlampaui ({data.sks_diambil} > {self.SKS_LIMIT}).")
+            event(LOGGER, logging.WARNING, "rule.sks_terlampaui", "GAGAL : Batas SKS terlampaui (%d > %d).",
+                  data.sks_diambil, self.SKS_LIMIT, nim=data.nim)
             return False
-        logging.info("SUKSES : Batas SKS terpenuhi.")
+        if INSTRUMENTASI:
+            event(LOGGER, logging.INFO, "rule.sks_ok", "SUKSES : Batas SKS terpenuhi.")
         return True
 
+    def validate_batch(self, batch: MahasiswaBatch, indeks: Sequence[int]) -> list[bool]:
+        """Versi kolumnar: membandingkan seluruh kolom SKS dengan batas sekaligus."""
+        limit = self.SKS_LIMIT
+        sks = batch.sks_diambil
+        if len(indeks) == len(sks):
+            return [s <= limit for s in sks]
+        return [sks[i] <= limit for i in indeks]
+
 class PrerequisiteRule(IValidationRule):
     """Aturan validasi Prasyarat Mata Kuliah (Memenuhi SRP)."""
     def validate(self, data: Mahasiswa) -> bool:
         """Memeriksa status pemenuhan mata kuliah prasyarat."""
         if not data.matkul_prasyarat:
-            logging.warning("GAGAL : Mata kuliah prasyarat belum dipenuhi.")
+            event(LOGGER, logging.WARNING, "rule.prasyarat_gagal", "GAGAL : Mata kuliah prasyarat belum dipenuhi.", nim=data.nim)
             return False
-        logging.info("SUKSES : Prasyarat terpenuhi.")
+        if INSTRUMENTASI:
+            event(LOGGER, logging.INFO, "rule.prasyarat_ok", "SUKSES : Prasyarat terpenuhi.")
         return True
 
+    def validate_batch(self, batch: MahasiswaBatch, indeks: Sequence[int]) -> list[bool]:
+        """Versi kolumnar: membaca kolom status prasyarat secara langsung."""
+        prasyarat = batch.matkul_prasyarat
+        if len(indeks) == len(prasyarat):
+            return [p != 0 for p in prasyarat]
+        return [prasyarat[i] != 0 for i in indeks]
+
 
 # 3. Implementasi SRP: Kelas Koordinator
 class RegistrationService:
@@ -74,51 +180,303 @@ class RegistrationService:
             mhs (Mahasiswa): Objek Mahasiswa yang akan didaftarkan.
         Returns:
             bool: True jika registrasi sukses, False jika gagal."""
-        logging.info(f"\n--- Memulai Proses Registrasi untuk NIM: {mhs.nim} ---")
-        
+        if INSTRUMENTASI:
+            return self._register_mhs_terinstrumentasi(mhs)
+
         # Iterasi melalui daftar aturan (Delegasi tugas, memenuhi OCP dan DIP)
         for rule in self.validation_rules:
-            if not rule.validate(mhs):
-                logging.warning(f"REGISTRASI GAGAL! Dibatalkan oleh aturan {type(rule).__name__}.")
+            if not self._jalankan_rule(rule, mhs):
+                nama_rule = type(rule).__name__
+                event(LOGGER, logging.WARNING, "registrasi.gagal", "REGISTRASI GAGAL! Dibatalkan oleh aturan %s.",
+                      nama_rule, nim=mhs.nim, rule=nama_rule)
                 return False
-        
-        logging.info(f"\nREGISTRASI SUKSES! Mahasiswa dengan NIM {mhs.nim} terdaftar.")
         return True
 
+    def _register_mhs_terinstrumentasi(self, mhs: Mahasiswa) -> bool:
+        """Jalur register_mhs dengan event log dan span durasi per aturan."""
+        mulai_registrasi = time.perf_counter_ns()
+        event(LOGGER, logging.INFO, "registrasi.mulai", "\n--- Memulai Proses Registrasi untuk NIM: %s ---", mhs.nim)
+        hasil = True
+        for rule in self.validation_rules:
+            nama_rule = type(rule).__name__
+            mulai = time.perf_counter_ns()
+            ok = self._jalankan_rule(rule, mhs)
+            SPANS.record(nama_rule, time.perf_counter_ns() - mulai)
+            if not ok:
+                event(LOGGER, logging.WARNING, "registrasi.gagal", "REGISTRASI GAGAL! Dibatalkan oleh aturan %s.",
+                      nama_rule, nim=mhs.nim, rule=nama_rule)
+                hasil = False
+                break
+
+        if hasil:
+            event(LOGGER, logging.INFO, "registrasi.sukses", "\nREGISTRASI SUKSES! Mahasiswa dengan NIM %s terdaftar.", mhs.nim)
+        SPANS.record("RegistrationService.register_mhs", time.perf_counter_ns() - mulai_registrasi)
+        return hasil
+
+    def register_many(self, batch: MahasiswaBatch) -> RegistrationBatchResult:
+        """Menjalankan registrasi untuk satu batch kolumnar sekaligus.
+        Setiap aturan dipanggil sekali per batch (bukan sekali per mahasiswa) dan hanya
+        menerima baris yang masih lolos, sehingga urutan short-circuit sama dengan register_mhs.
+        Args:
+            batch (MahasiswaBatch): Batch kolumnar mahasiswa.
+        Returns:
+            RegistrationBatchResult: Mask diterima dan aturan pertama yang gagal per baris."""
+        n = len(batch)
+        diterima = [True] * n
+        gagal_oleh: list[str | None] = [None] * n
+        indeks: Sequence[int] = range(n)
+
+        for rule in self.validation_rules:
+            if not indeks:
+                break
+            mask = self._jalankan_rule_batch(rule, batch, indeks)
+            nama_rule = type(rule).__name__
+            for i, ok in zip(indeks, mask):
+                if not ok:
+                    diterima[i] = False
+                    gagal_oleh[i] = nama_rule
+            indeks = list(compress(indeks, mask))
+
+        if INSTRUMENTASI:
+            event(LOGGER, logging.INFO, "registrasi.batch", "REGISTRASI BATCH: %d dari %d mahasiswa terdaftar.", len(indeks), n)
+        return RegistrationBatchResult(diterima=diterima, gagal_oleh=gagal_oleh)
+
+    def _jalankan_rule(self, rule: IValidationRule, mhs: Mahasiswa) -> bool:
+        """Hook satu aturan untuk satu mahasiswa; subclass dapat menambahkan pengukuran di sini."""
+        return rule.validate(mhs)
+
+    def _jalankan_rule_batch(self, rule: IValidationRule, batch: MahasiswaBatch, indeks: Sequence[int]) -> list[bool]:
+        """Hook satu aturan untuk baris batch yang masih lolos; pasangan batch dari _jalankan_rule."""
+        return rule.validate_batch(batch, indeks)
+
+# 3b. Mode Pipeline Teroptimasi: urutan aturan adaptif
+@dataclass
+class RuleStats:
+    """
+    Statistik eksekusi satu aturan validasi.
+    Args:
+        panggilan (int): Jumlah mahasiswa yang diperiksa oleh aturan.
+        ditolak (int): Jumlah mahasiswa yang ditolak oleh aturan.
+        total_ns (int): Total waktu eksekusi aturan (nanodetik).
+    """
+    nama: str
+    panggilan: int = 0
+    ditolak: int = 0
+    total_ns: int = 0
+
+    @property
+    def ns_per_call(self) -> float:
+        return self.total_ns / self.panggilan if self.panggilan else 0.0
+
+    @property
+    def rejection_rate(self) -> float:
+        return self.ditolak / self.panggilan if self.panggilan else 0.0
+
+    @property
+    def rank(self) -> float:
+        """Biaya per penolakan (ns / peluang tolak). Semakin kecil, semakin layak dijalankan lebih dulu."""
+        if self.panggilan == 0:
+            return 0.0  # Belum pernah diukur: jalankan lebih awal agar segera punya data
+        if self.ditolak == 0:
+            return float('inf')
+        return self.ns_per_call / self.rejection_rate
+
+class AdaptiveRegistrationService(RegistrationService):
+    """
+    RegistrationService yang mengukur biaya (ns per panggilan) dan tingkat penolakan
+    setiap aturan, lalu menyusun ulang aturan agar biaya ekspektasi per mahasiswa minimal.
+    Aturan diurutkan naik berdasarkan biaya / peluang tolak, sehingga aturan murah yang
+    sering menolak dijalankan lebih dulu. Aturan yang di-pin tetap di posisi aslinya.
+    """
+    def __init__(
+        self,
+        validation_rules: list[IValidationRule],
+        pinned_rules: Iterable[IValidationRule] = (),
+        reorder_interval: int = 1000,
+    ):
+        """Inisiasi service adaptif.
+        Args:
+            validation_rules (list[IValidationRule]): Daftar aturan validasi awal.
+            pinned_rules (Iterable[IValidationRule]): Aturan yang urutannya tidak boleh diubah.
+            reorder_interval (int): Jumlah registrasi di antara dua kali penyusunan ulang.
+        """
+        super().__init__(list(validation_rules))
+        self.pinned_rules = {id(rule) for rule in pinned_rules}
+        self.reorder_interval = reorder_interval
+        self._stats = {id(rule): RuleStats(type(rule).__name__) for rule in self.validation_rules}
+        self._sejak_reorder = 0
+
+    def register_mhs(self, mhs: Mahasiswa) -> bool:
+        """Sama seperti RegistrationService.register_mhs; statistik dicatat lewat _jalankan_rule."""
+        hasil = super().register_mhs(mhs)
+        self._catat_registrasi(1)
+        return hasil
+
+    def register_many(self, batch: MahasiswaBatch) -> RegistrationBatchResult:
+        """Sama seperti RegistrationService.register_many; statistik dicatat lewat _jalankan_rule_batch."""
+        hasil = super().register_many(batch)
+        self._catat_registrasi(len(batch))
+        return hasil
+
+    def _jalankan_rule(self, rule: IValidationRule, mhs: Mahasiswa) -> bool:
+        stats = self._stats_untuk(rule)
+        mulai = time.perf_counter_ns()
+        ok = rule.validate(mhs)
+        stats.total_ns += time.perf_counter_ns() - mulai
+        stats.panggilan += 1
+        if not ok:
+            stats.ditolak += 1
+        return ok
+
+    def _jalankan_rule_batch(self, rule: IValidationRule, batch: MahasiswaBatch, indeks: Sequence[int]) -> list[bool]:
+        stats = self._stats_untuk(rule)
+        mulai = time.perf_counter_ns()
+        mask = rule.validate_batch(batch, indeks)
+        stats.total_ns += time.perf_counter_ns() - mulai
+        stats.panggilan += len(indeks)
+        stats.ditolak += len(indeks) - sum(1 for ok in mask if ok)
+        return mask
+
+    def _stats_untuk(self, rule: IValidationRule) -> RuleStats:
+        # Aturan yang ditambahkan setelah inisiasi tetap mendapat entri statistik
+        stats = self._stats.get(id(rule))
+        if stats is None:
+            stats = self._stats[id(rule)] = RuleStats(type(rule).__name__)
+        return stats
+
+    def _catat_registrasi(self, jumlah: int):
+        self._sejak_reorder += jumlah
+        if self._sejak_reorder >= self.reorder_interval:
+            self.reorder()
+
+    def reorder(self):
+        """Menyusun ulang aturan yang tidak di-pin berdasarkan rank; aturan pinned tidak berpindah posisi."""
+        bebas = sorted(
+            (rule for rule in self.validation_rules if id(rule) not in self.pinned_rules),
+            key=lambda rule: self._stats_untuk(rule).rank,
+        )
+        urutan_bebas = iter(bebas)
+        self.validation_rules = [
+            rule if id(rule) in self.pinned_rules else next(urutan_bebas)
+            for rule in self.validation_rules
+        ]
+        self._sejak_reorder = 0
+        if INSTRUMENTASI:
+            event(LOGGER, logging.INFO, "registrasi.reorder", "Urutan aturan diperbarui: %s",
+                  [type(rule).__name__ for rule in self.validation_rules])
+
+    def statistics(self) -> list[RuleStats]:
+        """Mengembalikan statistik setiap aturan sesuai urutan eksekusi saat ini."""
+        return [self._stats_untuk(rule) for rule in self.validation_rules]
+
 # 4. Challenge (Pembuktian OCP): Rule baru ditambahkan
 class JadwalBentrokRule(IValidationRule):
     """Aturan validasi Jadwal Bentrok. Memperluas sistem tanpa mengubah RegistrationService (OCP)."""
+    def __init__(self, jadwal: JadwalIndex):
+        """
+        Args:
+            jadwal (JadwalIndex): Indeks seluruh sesi kuliah yang dipakai untuk mendeteksi bentrok.
+        """
+        self.jadwal = jadwal
+
     def validate(self, data: Mahasiswa) -> bool:
-        """Simulasi logika pendeteksi bentrok jadwal."""
-        if data.nim == '24111': # Simulasi bentrok jadwal untuk NIM Haris
-            logging.warning("GAGAL : Terdeteksi bentrok jadwal mata kuliah.")
+        """Memeriksa apakah ada kelas pilihan mahasiswa yang waktunya beririsan."""
+        try:
+            bentrok = self.jadwal.cari_bentrok(data.kelas_diambil)
+        except KeyError as e:
+            event(LOGGER, logging.WARNING, "rule.kelas_tidak_dikenal", "GAGAL : Kelas %s tidak terdaftar di jadwal.",
+                  e.args[0], nim=data.nim)
             return False
-        logging.info("SUKSES : Tidak ada bentrok jadwal.")
+        if bentrok is not None:
+            event(LOGGER, logging.WARNING, "rule.jadwal_bentrok", "GAGAL : Terdeteksi bentrok jadwal antara %s dan %s.",
+                  bentrok[0].kode, bentrok[1].kode, nim=data.nim)
+            return False
+        if INSTRUMENTASI:
+            event(LOGGER, logging.INFO, "rule.jadwal_ok", "SUKSES : Tidak ada bentrok jadwal.")
         return True
 
+    def validate_batch(self, batch: MahasiswaBatch, indeks: Sequence[int]) -> list[bool]:
+        """Versi kolumnar: langsung memakai kolom kelas pilihan tanpa membuat objek Mahasiswa."""
+        if batch.kelas_diambil is None:
+            return [True] * len(indeks)
+        kelas = batch.kelas_diambil
+        jadwal = self.jadwal
+        hasil = []
+        for i in indeks:
+            try:
+                hasil.append(not jadwal.ada_bentrok(kelas[i]))
+            except KeyError:
+                hasil.append(False)
+        return hasil
+
+
+class ProfiledRegistrationService:
+    """
+    Decorator RegistrationService (termasuk AdaptiveRegistrationService): register_mhs dan
+    register_many dijalankan lewat Profiler, sehingga ikut terekam saat jendela profiling
+    dibuka (flag --profile-start atau sinyal SIGUSR1) tanpa restart proses.
+    """
+    def __init__(self, service: RegistrationService, profiler: profiling.Profiler):
+        self.service = service
+        self.profiler = profiler
+
+    def register_mhs(self, mhs: Mahasiswa) -> bool:
+        return self.profiler.jalankan(self.service.register_mhs, mhs)
+
+    def register_many(self, batch: MahasiswaBatch) -> RegistrationBatchResult:
+        return self.profiler.jalankan(self.service.register_many, batch)
+
 
 # --- PROGRAM UTAMA & DEMONSTRASI ---
 
-# 1. Setup Data Mahasiswa
-Haris = Mahasiswa("24111", 26, True) # Gagal karena SKS (26) dan Jadwal Bentrok (NIM 24111)
-Fikriadi = Mahasiswa("0244", 20, False) # Gagal karena Prasyarat (False)
-Rafa = Mahasiswa("1049", 23, True) # Semua aturan sukses
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Demo validasi registrasi mahasiswa.")
+    profiling.tambah_argumen(parser)
+    profiler = profiling.dari_argumen(parser.parse_args())
+
+    # 0. Setup Jadwal Kuliah
+    jadwal = JadwalIndex([
+        SesiKuliah.dari_jam("INF2143-A", "Senin", "08:00", "09:40", "R101"),
+        SesiKuliah.dari_jam("INF2145-A", "Senin", "09:00", "10:40", "R102"),
+        SesiKuliah.dari_jam("INF2147-B", "Selasa", "13:00", "14:40", "R101"),
+    ])
+
+    # 1. Setup Data Mahasiswa
+    Haris = Mahasiswa("24111", 26, True, ["INF2143-A", "INF2145-A"]) # Gagal karena SKS (26) dan Jadwal Bentrok (Senin 09:00)
+    Fikriadi = Mahasiswa("0244", 20, False) # Gagal karena Prasyarat (False)
+    Rafa = Mahasiswa("1049", 23, True, ["INF2143-A", "INF2147-B"]) # Semua aturan sukses
+
+    # 2. Inisiasi Set Aturan LENGKAP, Termasuk Rule Challenge
+    daftar_aturan = [
+        SksLimitRule(), 
+        PrerequisiteRule(),
+        JadwalBentrokRule(jadwal) # <-- Rule baru, di inject (Pembuktian OCP)
+    ]
+
+    # 3. Setup Layanan dengan Injection
+    reg_service = RegistrationService(validation_rules=daftar_aturan)
+    if profiler is not None:
+        reg_service = ProfiledRegistrationService(reg_service, profiler)
+
+    print("Perobaan 1: Gagal karena SKS terdeteksi bentrok")
+    reg_service.register_mhs(Haris) 
 
-# 2. Inisiasi Set Aturan LENGKAP, Termasuk Rule Challenge
-daftar_aturan = [
-    SksLimitRule(), 
-    PrerequisiteRule(),
-    JadwalBentrokRule() # <-- Rule baru, di inject (Pembuktian OCP)
-]
+    print("\nPerobaan 2: Gagal karena Prasyarat")
+    reg_service.register_mhs(Fikriadi)
 
-# 3. Setup Layanan dengan Injection
-reg_service = RegistrationService(validation_rules=daftar_aturan)
+    print("\nPerobaan 3: Registrasi Sukses")
+    reg_service.register_mhs(Rafa)
 
-print("Perobaan 1: Gagal karena SKS terdeteksi bentrok")
-reg_service.register_mhs(Haris) 
+    print("\nPercobaan 4: Registrasi Batch (kolumnar)")
+    angkatan = MahasiswaBatch.from_mahasiswa([Haris, Fikriadi, Rafa])
+    hasil_batch = reg_service.register_many(angkatan)
+    print(f"Diterima: {hasil_batch.diterima} | Gagal oleh: {hasil_batch.gagal_oleh}")
 
-print("\nPerobaan 2: Gagal karena Prasyarat")
-reg_service.register_mhs(Fikriadi)
+    print("\nPercobaan 5: Pipeline adaptif (urutan aturan dioptimasi dari statistik)")
+    adaptive_service = AdaptiveRegistrationService(daftar_aturan, reorder_interval=3)
+    (ProfiledRegistrationService(adaptive_service, profiler) if profiler is not None else adaptive_service).register_many(angkatan)
+    for stats in adaptive_service.statistics():
+        print(f"{stats.nama:<18} panggilan={stats.panggilan} tolak={stats.rejection_rate:.0%} biaya={stats.ns_per_call:.0f} ns")
 
-print("\nPerobaan 3: Registrasi Sukses")
-reg_service.register_mhs(Rafa)
\ No newline at end of file
+    if profiler is not None:
+        profiler.stop()
@@ -0,0 +1,40 @@
+# -------------------------- Benchmark Overhead Instrumentasi --------------------------
+# Mengukur biaya register_mhs dengan INFO nonaktif pada tiga mode:
+#   1. instrumentasi aktif (default), 2. INSTRUMENTASI=0, 3. python -O.
+# Cara menjalankan: python benchmark_instrumentasi.py [jumlah_panggilan]
+import logging
+import os
+import subprocess
+import sys
+import time
+
+def ukur_register(n: int) -> float:
+    """Menjalankan register_mhs n kali dan mengembalikan ns per panggilan."""
+    from Latihan_mandiri import Mahasiswa, RegistrationService, SksLimitRule, PrerequisiteRule
+    # INFO dimatikan seperti di produksi; WARNING tetap aktif tetapi tidak ada mahasiswa yang gagal
+    logging.getLogger().setLevel(logging.WARNING)
+    service = RegistrationService([SksLimitRule(), PrerequisiteRule()])
+    mhs = Mahasiswa("1049", 23, True)
+    mulai = time.perf_counter_ns()
+    for _ in range(n):
+        service.register_mhs(mhs)
+    return (time.perf_counter_ns() - mulai) / n
+
+def main(n: int = 500_000):
+    mode = [
+        ("instrumentasi aktif", [], {}),
+        ("INSTRUMENTASI=0", [], {"INSTRUMENTASI": "0"}),
+        ("python -O", ["-O"], {}),
+    ]
+    for nama, flag, env in mode:
+        keluaran = subprocess.run(
+            [sys.executable, *flag, __file__, "--anak", str(n)],
+            env={**os.environ, **env}, capture_output=True, text=True, check=True,
+        )
+        print(f"{nama:<20}: {float(keluaran.stdout):.0f} ns/panggilan")
+
+if __name__ == "__main__":
+    if len(sys.argv) > 2 and sys.argv[1] == "--anak":
+        print(ukur_register(int(sys.argv[2])))
+    else:
+        main(int(sys.argv[1]) if len(sys.argv) > 1 else 500_000)
@@ -0,0 +1,72 @@
+# -------------------------- Benchmark Deteksi Bentrok Jadwal --------------------------
+# Membandingkan cek bentrok naif (semua pasangan, O(k^2)) dengan JadwalIndex (sweep-line).
+# Cara menjalankan: python benchmark_jadwal.py [jumlah_sesi] [jumlah_mahasiswa]
+import logging
+import random
+import sys
+import time
+
+from jadwal import JadwalIndex, SesiKuliah
+
+def buat_jadwal(n_sesi: int, seed: int = 7) -> list[SesiKuliah]:
+    """Membuat jadwal sintetis: 6 hari, jam 07:00-18:00, durasi 50-150 menit, 200 ruangan."""
+    rng = random.Random(seed)
+    daftar = []
+    for i in range(n_sesi):
+        mulai = rng.randrange(7 * 60, 18 * 60, 10)
+        daftar.append(SesiKuliah(f"K{i:05d}", rng.randrange(6), mulai, mulai + rng.choice((50, 100, 150)), f"R{rng.randrange(200):03d}"))
+    return daftar
+
+def pilih_tanpa_bentrok(jadwal: JadwalIndex, daftar: list[SesiKuliah], k: int, rng: random.Random) -> list[SesiKuliah]:
+    """Memilih k sesi acak yang tidak saling bentrok (kasus umum registrasi yang valid)."""
+    pilihan: list[SesiKuliah] = []
+    while len(pilihan) < k:
+        kandidat = rng.choice(daftar)
+        if kandidat not in pilihan and not jadwal.ada_bentrok([s.kode for s in pilihan] + [kandidat.kode]):
+            pilihan.append(kandidat)
+    return pilihan
+
+def bentrok_naif(daftar_sesi: list[SesiKuliah]) -> bool:
+    for i, a in enumerate(daftar_sesi):
+        for b in daftar_sesi[i + 1:]:
+            if a.bertumpuk(b):
+                return True
+    return False
+
+def bentrok_ruang_naif(daftar_sesi: list[SesiKuliah]) -> int:
+    jumlah = 0
+    for i, a in enumerate(daftar_sesi):
+        for b in daftar_sesi[i + 1:]:
+            if a.ruang == b.ruang and a.hari == b.hari and a.mulai < b.selesai and b.mulai < a.selesai:
+                jumlah += 1
+    return jumlah
+
+def ukur(fungsi) -> tuple[float, object]:
+    mulai = time.perf_counter()
+    hasil = fungsi()
+    return time.perf_counter() - mulai, hasil
+
+def main(n_sesi: int = 10_000, n_mhs: int = 100_000):
+    logging.disable(logging.CRITICAL)
+    daftar = buat_jadwal(n_sesi)
+    t_muat, jadwal = ukur(lambda: JadwalIndex(daftar))
+    print(f"Memuat {n_sesi:,} sesi ke JadwalIndex: {t_muat * 1000:.1f} ms")
+
+    # Registrasi valid tidak punya bentrok, sehingga cek naif harus memeriksa semua pasangan
+    rng = random.Random(1)
+    for k in (8, 24):
+        pola = [pilih_tanpa_bentrok(jadwal, daftar, k, rng) for _ in range(1000)]
+        pilihan = [pola[i % len(pola)] for i in range(n_mhs)]
+        kode = [[s.kode for s in p] for p in pilihan]
+        t_naif, hasil_naif = ukur(lambda: [bentrok_naif(p) for p in pilihan])
+        t_index, hasil_index = ukur(lambda: [jadwal.ada_bentrok(p) for p in kode])
+        assert hasil_naif == hasil_index, "Hasil JadwalIndex berbeda dengan cek naif!"
+        print(f"k={k:<3} {n_mhs:,} mahasiswa | naif: {t_naif:.3f} s | index: {t_index:.3f} s | speedup {t_naif / t_index:.1f}x")
+
+    t_naif, jumlah_naif = ukur(lambda: bentrok_ruang_naif(daftar))
+    t_index, pasangan = ukur(jadwal.bentrok_ruang)
+    print(f"Bentrok ruang ({n_sesi:,} sesi) | naif: {t_naif:.3f} s ({jumlah_naif} pasangan) | "
+          f"index: {t_index * 1000:.1f} ms ({len(pasangan)} sesi bentrok) | speedup {t_naif / t_index:.0f}x")
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
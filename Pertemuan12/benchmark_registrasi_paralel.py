@@ -0,0 +1,53 @@
+# -------------------------- Benchmark Registrasi Ter-shard --------------------------
+# Membandingkan RegistrationService.register_many (satu proses) dengan ShardedRegistrationService
+# pada 1, 2, 4, ... worker sampai jumlah CPU. Data memakai aturan jadwal bentrok agar
+# pekerjaan per mahasiswa cukup berat dibanding biaya IPC.
+# Cara menjalankan: python benchmark_registrasi_paralel.py [jumlah_mahasiswa] [chunk_size]
+import logging
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "bersama"))  # modul bersama: money, wal, metrics, profiler
+from benchmark_jadwal import buat_jadwal
+from jadwal import JadwalIndex
+from Latihan_mandiri import MahasiswaBatch, RegistrationService, SksLimitRule, PrerequisiteRule, JadwalBentrokRule
+from registrasi_paralel import ShardedRegistrationService
+
+def buat_data(n: int, kode_kelas: list[str], seed: int = 42) -> MahasiswaBatch:
+    """Batch sintetis: NIM acak, SKS 12-30, 90% memenuhi prasyarat, 6-8 kelas pilihan per mahasiswa."""
+    rng = random.Random(seed)
+    return MahasiswaBatch(
+        [f"{rng.randrange(10**10):010d}" for _ in range(n)],
+        [rng.randint(12, 30) for _ in range(n)],
+        [rng.random() < 0.9 for _ in range(n)],
+        [rng.sample(kode_kelas, rng.randint(6, 8)) for _ in range(n)],
+    )
+
+def main(n: int = 200_000, chunk_size: int = 20_000):
+    logging.disable(logging.CRITICAL)
+    daftar_sesi = buat_jadwal(5_000)
+    aturan = [SksLimitRule(), PrerequisiteRule(), JadwalBentrokRule(JadwalIndex(daftar_sesi))]
+    batch = buat_data(n, [s.kode for s in daftar_sesi])
+    cpu = os.cpu_count() or 1
+    print(f"Jumlah mahasiswa : {n:,} | chunk {chunk_size:,} | CPU {cpu}")
+
+    mulai = time.perf_counter()
+    acuan = RegistrationService(aturan).register_many(batch)
+    t_serial = time.perf_counter() - mulai
+    print(f"{'register_many':<22}: {t_serial:.3f} s ({t_serial / n * 1e9:,.0f} ns/mhs)")
+
+    daftar_workers = sorted({w for w in (1, 2, 4, 8, 16, 32) if w <= cpu} | {cpu})
+    for workers in daftar_workers:
+        with ShardedRegistrationService(aturan, workers=workers, chunk_size=chunk_size) as service:
+            # Pemanasan: proses worker dan initializer tidak ikut diukur
+            service.register_many(MahasiswaBatch(batch.nim[:100], [20] * 100, [True] * 100))
+            mulai = time.perf_counter()
+            hasil = service.register_many(batch)
+            t = time.perf_counter() - mulai
+        assert hasil == acuan, "Hasil sharded berbeda dengan register_many!"
+        print(f"{f'sharded {workers} worker':<22}: {t:.3f} s ({t / n * 1e9:,.0f} ns/mhs) | speedup {t_serial / t:.2f}x")
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:3]))
@@ -0,0 +1,53 @@
+# -------------------------- Benchmark Memori MahasiswaStore --------------------------
+# Membandingkan byte per mahasiswa antara list objek Mahasiswa dan MahasiswaStore,
+# serta waktu membuka kembali store dari file memory-mapped.
+# Cara menjalankan: python benchmark_store.py [jumlah_mahasiswa]
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "bersama"))  # modul bersama: money, wal, metrics, profiler
+from Latihan_mandiri import Mahasiswa
+from mahasiswa_store import MahasiswaStore
+
+def ukur_memori(fungsi) -> tuple[int, object]:
+    """Mengembalikan (byte yang dialokasikan, hasil) dari pemanggilan fungsi."""
+    tracemalloc.start()
+    hasil = fungsi()
+    terpakai, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return terpakai, hasil
+
+def main(n: int = 1_000_000):
+    rng = random.Random(3)
+    data = [(f"{i:010d}", rng.randint(12, 30), rng.random() < 0.9) for i in range(n)]
+    # NIM dibuat sebelum pengukuran agar kedua sisi tidak menghitung string sumber
+    b_objek, daftar_mhs = ukur_memori(lambda: [Mahasiswa(nim, sks, pra) for nim, sks, pra in data])
+    # Store menyalin NIM ke kolom byte, sehingga string sumber boleh dibuang setelahnya
+    b_store, store = ukur_memori(lambda: _isi_store(data))
+
+    print(f"Jumlah mahasiswa    : {n:,}")
+    print(f"list[Mahasiswa]     : {b_objek / n:.1f} byte/mahasiswa (tanpa string NIM)")
+    print(f"MahasiswaStore      : {b_store / n:.1f} byte/mahasiswa (termasuk NIM)")
+    print(f"Data kolom murni    : {store.nbytes / n:.1f} byte/mahasiswa")
+
+    path = os.path.join(tempfile.mkdtemp(), "mahasiswa.bin")
+    store.save(path)
+    mulai = time.perf_counter()
+    with MahasiswaStore.open(path) as dibuka:
+        t_buka = time.perf_counter() - mulai
+        assert dibuka[n - 1].nim == daftar_mhs[n - 1].nim
+    print(f"Buka ulang (mmap)   : {t_buka * 1000:.2f} ms untuk {os.path.getsize(path) / 1e6:.1f} MB")
+    os.remove(path)
+
+def _isi_store(data) -> MahasiswaStore:
+    store = MahasiswaStore()
+    for nim, sks, pra in data:
+        store.append(nim, sks, pra)
+    return store
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
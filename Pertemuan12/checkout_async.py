@@ -0,0 +1,176 @@
+# -------------------------- Checkout Asinkron (asyncio) --------------------------
+from abc import ABC, abstractmethod
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Iterable
+import asyncio
+import logging
+import os
+import sys
+import time
+import weakref
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "bersama"))  # modul bersama: money, wal, metrics, profiler
+from instrumentasi import AKTIF as INSTRUMENTASI, SPANS, event
+from refactor_solid import Order, IPaymentProcessor, INotificationService
+
+LOGGER = logging.getLogger('CheckoutAsync')
+
+# --- ABSTRAKSI ASINKRON (Kontrak untuk OCP/DIP) ---
+class IAsyncPaymentProcessor(ABC):
+    """Kontrak: Prosesor pembayaran asinkron harus punya coroutine 'process'."""
+    @abstractmethod
+    async def process(self, order: Order) -> bool:
+        pass
+
+class IAsyncNotificationService(ABC):
+    """Kontrak: Layanan notifikasi asinkron harus punya coroutine 'send'."""
+    @abstractmethod
+    async def send(self, order: Order):
+        pass
+
+# --- ADAPTER: Implementasi sinkron dijalankan di thread pool ---
+class ThreadPoolPaymentAdapter(IAsyncPaymentProcessor):
+    """
+    Membungkus IPaymentProcessor sinkron (misalnya CreditCardProcessor, QrisProcessor)
+    agar dipanggil di thread pool dan tidak memblokir event loop.
+    """
+    def __init__(self, processor: IPaymentProcessor, executor: Executor | None = None):
+        self.processor = processor
+        self.executor = executor
+
+    async def process(self, order: Order) -> bool:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, self.processor.process, order)
+
+class ThreadPoolNotifierAdapter(IAsyncNotificationService):
+    """Membungkus INotificationService sinkron (misalnya EmailNotifier) agar dijalankan di thread pool."""
+    def __init__(self, notifier: INotificationService, executor: Executor | None = None):
+        self.notifier = notifier
+        self.executor = executor
+
+    async def send(self, order: Order):
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(self.executor, self.notifier.send, order)
+
+# --- KELAS KOORDINATOR ASINKRON ---
+class AsyncCheckoutService:
+    """
+    Versi asinkron CheckoutService.
+    Pembayaran di-await, sedangkan notifikasi diserahkan ke background task sehingga
+    pengiriman email yang lambat tidak menahan checkout berikutnya. Jumlah checkout yang
+    berjalan bersamaan dibatasi oleh semaphore.
+    Satu service boleh dipakai dari beberapa event loop (misalnya asyncio.run berulang):
+    semaphore dibuat per loop, jadi max_concurrency berlaku untuk setiap loop.
+    """
+    def __init__(
+        self,
+        payment_processor: IAsyncPaymentProcessor | IPaymentProcessor,
+        notifier: IAsyncNotificationService | INotificationService,
+        max_concurrency: int = 100,
+        executor: Executor | None = None,
+    ):
+        """
+        Args:
+            payment_processor: Prosesor pembayaran asinkron, atau sinkron yang otomatis dibungkus adapter.
+            notifier: Layanan notifikasi asinkron, atau sinkron yang otomatis dibungkus adapter.
+            max_concurrency (int): Batas checkout yang berjalan bersamaan.
+            executor (Executor | None): Thread pool untuk adapter sinkron (default: pool milik service).
+        """
+        self._executor_milik_sendiri = executor is None and not (
+            isinstance(payment_processor, IAsyncPaymentProcessor) and isinstance(notifier, IAsyncNotificationService)
+        )
+        if self._executor_milik_sendiri:
+            executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix='checkout')
+        self.executor = executor
+        if not isinstance(payment_processor, IAsyncPaymentProcessor):
+            payment_processor = ThreadPoolPaymentAdapter(payment_processor, executor)
+        if not isinstance(notifier, IAsyncNotificationService):
+            notifier = ThreadPoolNotifierAdapter(notifier, executor)
+        self.payment_processor = payment_processor
+        self.notifier = notifier
+        self.max_concurrency = max_concurrency
+        self._semaphores: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore] = weakref.WeakKeyDictionary()
+        self._notifikasi: set[asyncio.Task] = set()
+
+    async def run_checkout_async(self, order: Order) -> bool:
+        """
+        Menjalankan checkout satu pesanan.
+        Args:
+            order (Order): Objek Pesanan yang akan diproses.
+        Returns:
+            bool: True jika pembayaran sukses (notifikasi tetap berjalan di background).
+        """
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            # asyncio.Semaphore terikat ke loop pertama yang menunggu di dalamnya
+            semaphore = self._semaphores.setdefault(loop, asyncio.Semaphore(self.max_concurrency))
+        async with semaphore:
+            if INSTRUMENTASI:
+                event(LOGGER, logging.INFO, 'checkout.mulai', 'Memulai checkout untuk %s. Total: %s',
+                      order.customer_name, order.total_price)
+                mulai = time.perf_counter_ns()
+            payment_success = await self.payment_processor.process(order) # Delegasi 1
+            if INSTRUMENTASI:
+                SPANS.record('AsyncCheckoutService.payment', time.perf_counter_ns() - mulai)
+
+        if not payment_success:
+            event(LOGGER, logging.ERROR, 'checkout.gagal', 'Pembayaran gagal. Transaksi dibatalkan.',
+                  customer=order.customer_name)
+            return False
+
+        order.status = 'paid'
+        task = asyncio.create_task(self._kirim_notifikasi(order)) # Delegasi 2 (background)
+        self._notifikasi.add(task)
+        task.add_done_callback(self._notifikasi.discard)
+        if INSTRUMENTASI:
+            event(LOGGER, logging.INFO, 'checkout.sukses', 'Checkout Sukses. Status pesanan: PAID')
+        return True
+
+    async def run_many(self, orders: Iterable[Order]) -> list[bool]:
+        """Menjalankan banyak checkout bersamaan (dibatasi max_concurrency); hasil sesuai urutan input."""
+        return await asyncio.gather(*(self.run_checkout_async(order) for order in orders))
+
+    async def _kirim_notifikasi(self, order: Order):
+        mulai = time.perf_counter_ns()
+        try:
+            await self.notifier.send(order)
+        except Exception:
+            # Kegagalan notifikasi tidak membatalkan pesanan yang sudah dibayar
+            LOGGER.exception('Notifikasi untuk %s gagal dikirim.', order.customer_name)
+        if INSTRUMENTASI:
+            SPANS.record('AsyncCheckoutService.notifier', time.perf_counter_ns() - mulai)
+
+    async def drain(self):
+        """Menunggu semua notifikasi background milik event loop yang sedang berjalan selesai."""
+        loop = asyncio.get_running_loop()
+        while tugas := [t for t in self._notifikasi if t.get_loop() is loop]:
+            await asyncio.gather(*tugas)
+
+    async def aclose(self):
+        """Menunggu notifikasi selesai lalu mematikan thread pool milik service."""
+        await self.drain()
+        if self._executor_milik_sendiri:
+            self.executor.shutdown(wait=True)
+
+
+# --- PROGRAM UTAMA ---
+if __name__ == '__main__':
+    from refactor_solid import CreditCardProcessor
+
+    class EmailLambat(INotificationService):
+        """Simulasi SMTP lambat (0.5 detik per email)."""
+        def send(self, order: Order):
+            time.sleep(0.5)
+            print(f'Notif: Email konfirmasi terkirim ke {order.customer_name}.')
+
+    async def demo():
+        service = AsyncCheckoutService(CreditCardProcessor(), EmailLambat(), max_concurrency=10)
+        orders = [Order(f'Pelanggan-{i}', 100000 + i) for i in range(20)]
+        mulai = time.perf_counter()
+        hasil = await service.run_many(orders)
+        print(f'{sum(hasil)} checkout selesai dalam {time.perf_counter() - mulai:.2f} s (notifikasi masih berjalan)')
+        await service.aclose()
+        print(f'Semua notifikasi terkirim setelah {time.perf_counter() - mulai:.2f} s')
+
+    asyncio.run(demo())
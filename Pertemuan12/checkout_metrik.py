@@ -0,0 +1,34 @@
+# -------------------------- Metrik Checkout (Latensi & Hasil per Prosesor) --------------------------
+from metrics import MeteredCall, MetricsRegistry, REGISTRY
+from refactor_solid import Order, CheckoutService, IPaymentProcessor
+
+class MeteredPaymentProcessor(IPaymentProcessor):
+    """
+    Versi Order dari services.MeteredPaymentProcessor (Pertemuan13): mencatat latensi dan
+    hasil (ok/declined/error) per nama prosesor dengan metrik yang sama.
+    Args:
+        inner (IPaymentProcessor): Prosesor yang diukur (CreditCardProcessor, QrisProcessor, ...).
+        registry (MetricsRegistry): Tujuan metrik; default registry global.
+        name (str | None): Nilai label `processor`; default nama kelas prosesor.
+    """
+    def __init__(self, inner: IPaymentProcessor, registry: MetricsRegistry = REGISTRY, name: str | None = None):
+        self.inner = inner
+        self.name = name or type(inner).__name__
+        self._meter = MeteredCall(registry, "payment", "Latensi IPaymentProcessor.process.",
+                                  "Jumlah pembayaran per hasil.", {"processor": self.name}, gagal="declined")
+
+    def process(self, order: Order) -> bool:
+        return self._meter(self.inner.process, order)
+
+class MeteredCheckoutService:
+    """
+    Decorator untuk CheckoutService (termasuk IdempotentCheckoutService): mencatat latensi
+    run_checkout end-to-end dan jumlah checkout per hasil (ok/failed/error), tanpa mengubah service-nya.
+    """
+    def __init__(self, service: CheckoutService, registry: MetricsRegistry = REGISTRY):
+        self.service = service
+        self._meter = MeteredCall(registry, "checkout", "Latensi CheckoutService.run_checkout.",
+                                  "Jumlah checkout per hasil.")
+
+    def run_checkout(self, order: Order) -> bool:
+        return self._meter(self.service.run_checkout, order)
@@ -0,0 +1,113 @@
+# -------------------------- Checkout Idempoten (Cache Hasil + Coalescing) --------------------------
+from collections import OrderedDict
+from concurrent.futures import Future
+import logging
+import threading
+import time
+
+from refactor_solid import Order, CheckoutService, IPaymentProcessor, INotificationService
+from wal import TransactionJournal
+
+LOGGER = logging.getLogger('Idempotensi')
+
+class CheckoutResultCache:
+    """
+    Cache hasil checkout per idempotency key dengan batas ukuran (LRU) dan masa berlaku (TTL).
+    Args:
+        max_size (int): Jumlah kunci maksimum; kunci yang paling lama tidak dipakai dibuang lebih dulu.
+        ttl (float): Masa berlaku hasil dalam detik.
+    """
+    def __init__(self, max_size: int = 10_000, ttl: float = 24 * 3600):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._data: OrderedDict[str, tuple[float, bool]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> bool | None:
+        """Mengembalikan hasil tersimpan, atau None jika tidak ada / sudah kedaluwarsa."""
+        with self._lock:
+            entri = self._data.get(key)
+            if entri is None or entri[0] < time.monotonic():
+                if entri is not None:
+                    del self._data[key]
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return entri[1]
+
+    def put(self, key: str, hasil: bool):
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, hasil)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+class IdempotentCheckoutService(CheckoutService):
+    """
+    CheckoutService yang aman terhadap retry.
+    - Retry dengan idempotency_key yang sama mengembalikan hasil tersimpan tanpa memanggil prosesor.
+    - Checkout duplikat yang berjalan bersamaan digabung: hanya satu panggilan per kunci
+      yang sampai ke prosesor, sisanya menunggu hasil panggilan tersebut.
+    """
+    def __init__(
+        self,
+        payment_processor: IPaymentProcessor,
+        notifier: INotificationService,
+        cache: CheckoutResultCache | None = None,
+        journal: TransactionJournal | None = None,
+    ):
+        super().__init__(payment_processor, notifier, journal)
+        self.cache = cache if cache is not None else CheckoutResultCache()
+        self._in_flight: dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+    def run_checkout(self, order: Order) -> bool:
+        """
+        Menjalankan checkout satu kali per idempotency_key.
+        Args:
+            order (Order): Objek Pesanan yang akan diproses.
+        Returns:
+            bool: Hasil checkout (dari cache jika kunci sudah pernah diproses).
+        """
+        key = order.idempotency_key
+        with self._lock:
+            hasil = self.cache.get(key)
+            if hasil is None:
+                future = self._in_flight.get(key)
+                pemimpin = future is None
+                if pemimpin:
+                    future = self._in_flight[key] = Future()
+
+        if hasil is not None:
+            LOGGER.info('Retry untuk kunci %s: memakai hasil tersimpan.', key)
+            return self._terapkan(order, hasil)
+        if not pemimpin:
+            LOGGER.info('Checkout duplikat untuk kunci %s: menunggu panggilan yang sedang berjalan.', key)
+            return self._terapkan(order, future.result())
+
+        try:
+            hasil = super().run_checkout(order)
+        except BaseException as e:
+            # Error tidak di-cache, sehingga retry berikutnya boleh mencoba lagi
+            with self._lock:
+                del self._in_flight[key]
+            future.set_exception(e)
+            raise
+        with self._lock:
+            self.cache.put(key, hasil)
+            del self._in_flight[key]
+        future.set_result(hasil)
+        return hasil
+
+    @staticmethod
+    def _terapkan(order: Order, hasil: bool) -> bool:
+        # Salinan Order dari retry ikut mencerminkan status pesanan yang sudah dibayar
+        if hasil:
+            order.status = 'paid'
+        return hasil
@@ -0,0 +1,106 @@
+# -------------------------- Instrumentasi Terstruktur (Event & Span) --------------------------
+# Lapisan instrumentasi ringan untuk jalur panas (aturan validasi dan checkout):
+# - event(): log terstruktur yang diformat secara lazy dan hanya jika level aktif.
+# - SpanRecorder: agregasi durasi (jumlah, total, maks) per nama span.
+# Event INFO dan span dimatikan dengan environment variable INSTRUMENTASI=0 atau dengan
+# menjalankan Python dalam mode optimasi (python -O), sehingga jalur panas hanya
+# memeriksa satu konstanta modul. Event WARNING/ERROR (aturan gagal, pembayaran gagal)
+# selalu dikirim: hanya terjadi di jalur gagal dan tetap difilter oleh level logger.
+from contextlib import contextmanager
+from dataclasses import dataclass
+import logging
+import os
+import threading
+import time
+
+AKTIF = __debug__ and os.environ.get("INSTRUMENTASI", "1") != "0"
+
+def event(logger: logging.Logger, level: int, nama: str, pesan: str, *args, **fields):
+    """
+    Mengirim event terstruktur. Pesan memakai format %-style sehingga string hanya
+    dibangun oleh logging jika level tersebut aktif.
+    Args:
+        logger (logging.Logger): Logger tujuan.
+        level (int): Level logging (logging.INFO, logging.WARNING, ...).
+        nama (str): Nama event yang stabil untuk filter/analisis, misalnya "checkout.gagal".
+        pesan (str): Template pesan %-style.
+        *args: Argumen template pesan.
+        **fields: Field terstruktur tambahan, tersedia di record sebagai `record.fields`.
+    """
+    if logger.isEnabledFor(level):
+        logger.log(level, pesan, *args, extra={"event": nama, "fields": fields})
+
+@dataclass
+class SpanStats:
+    """Statistik agregat satu span."""
+    jumlah: int = 0
+    total_ns: int = 0
+    maks_ns: int = 0
+
+    @property
+    def rata_rata_ns(self) -> float:
+        return self.total_ns / self.jumlah if self.jumlah else 0.0
+
+class SpanRecorder:
+    """
+    Menyimpan statistik durasi per nama span.
+    Setiap thread menulis ke dict miliknya sendiri (tanpa lock di jalur panas);
+    snapshot() menggabungkan data semua thread.
+    """
+    def __init__(self):
+        self._lokal = threading.local()
+        self._per_thread: list[dict[str, list[int]]] = []
+        self._lock = threading.Lock()
+
+    def _data_thread(self) -> dict[str, list[int]]:
+        data: dict[str, list[int]] = {}
+        self._lokal.data = data
+        with self._lock:
+            self._per_thread.append(data)
+        return data
+
+    def record(self, nama: str, durasi_ns: int):
+        try:
+            data = self._lokal.data
+        except AttributeError:
+            data = self._data_thread()
+        stats = data.get(nama)
+        if stats is None:
+            stats = data[nama] = [0, 0, 0]  # [jumlah, total_ns, maks_ns]
+        stats[0] += 1
+        stats[1] += durasi_ns
+        if durasi_ns > stats[2]:
+            stats[2] = durasi_ns
+
+    def snapshot(self) -> dict[str, SpanStats]:
+        """Gabungan statistik semua thread saat ini."""
+        hasil: dict[str, SpanStats] = {}
+        with self._lock:
+            semua = list(self._per_thread)
+        for data in semua:
+            for nama, (jumlah, total_ns, maks_ns) in list(data.items()):
+                agregat = hasil.setdefault(nama, SpanStats())
+                agregat.jumlah += jumlah
+                agregat.total_ns += total_ns
+                agregat.maks_ns = max(agregat.maks_ns, maks_ns)
+        return hasil
+
+    def reset(self):
+        with self._lock:
+            for data in self._per_thread:
+                data.clear()
+
+# Recorder global yang dipakai modul-modul Pertemuan12
+SPANS = SpanRecorder()
+
+@contextmanager
+def span(nama: str, recorder: SpanRecorder = SPANS):
+    """Context manager untuk mengukur satu blok kode. Tidak mencatat apa pun jika instrumentasi mati."""
+    if not AKTIF:
+        yield
+        return
+    mulai = time.perf_counter_ns()
+    try:
+        yield
+    finally:
+        recorder.record(nama, time.perf_counter_ns() - mulai)
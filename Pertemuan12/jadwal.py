@@ -0,0 +1,148 @@
+# -------------------------- Indeks Jadwal Kuliah (Deteksi Bentrok) --------------------------
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from typing import Iterable
+import logging
+
+LOGGER = logging.getLogger('JADWAL')
+
+HARI = ("Senin", "Selasa", "Rabu", "Kamis", "Jumat", "Sabtu", "Minggu")
+MENIT_PER_HARI = 24 * 60
+
+@dataclass(frozen=True)
+class SesiKuliah:
+    """
+    Satu sesi kelas pada jadwal mingguan.
+    Args:
+        kode (str): Kode kelas unik, misalnya "INF2143-A".
+        hari (int): Indeks hari (0 = Senin ... 6 = Minggu).
+        mulai (int): Jam mulai dalam menit sejak 00:00.
+        selesai (int): Jam selesai dalam menit sejak 00:00 (eksklusif).
+        ruang (str): Kode ruangan.
+    """
+    kode: str
+    hari: int
+    mulai: int
+    selesai: int
+    ruang: str
+
+    @classmethod
+    def dari_jam(cls, kode: str, hari: str, mulai: str, selesai: str, ruang: str) -> "SesiKuliah":
+        """Membuat sesi dari nama hari dan jam berformat "HH:MM"."""
+        return cls(kode, HARI.index(hari), _ke_menit(mulai), _ke_menit(selesai), ruang)
+
+    def bertumpuk(self, other: "SesiKuliah") -> bool:
+        """True jika dua sesi berada di hari yang sama dan rentang waktunya beririsan."""
+        return self.hari == other.hari and self.mulai < other.selesai and other.mulai < self.selesai
+
+def _ke_menit(jam: str) -> int:
+    hh, mm = jam.split(":")
+    return int(hh) * 60 + int(mm)
+
+class JadwalIndex:
+    """
+    Indeks sweep-line untuk seluruh sesi kuliah.
+    Sesi dikelompokkan per hari dan diurutkan berdasarkan jam mulai, sehingga:
+    - cek bentrok untuk k kelas pilihan mahasiswa cukup O(k log k) (bukan O(k^2) pasangan), dan
+    - pencarian sesi yang beririsan dengan suatu rentang waktu cukup O(log n + m).
+    """
+    def __init__(self, daftar_sesi: Iterable[SesiKuliah] = ()):
+        self._sesi: dict[str, SesiKuliah] = {}
+        # Rentang absolut dalam menit sejak Senin 00:00, agar sweep cukup membandingkan integer
+        self._rentang: dict[str, tuple[int, int]] = {}
+        self._per_hari: dict[int, list[SesiKuliah]] = {}
+        self._mulai_per_hari: dict[int, list[int]] = {}
+        self._durasi_maks = 0
+        self.tambah_banyak(daftar_sesi)
+
+    def __len__(self) -> int:
+        return len(self._sesi)
+
+    def __contains__(self, kode: str) -> bool:
+        return kode in self._sesi
+
+    def get(self, kode: str) -> SesiKuliah | None:
+        return self._sesi.get(kode)
+
+    def tambah(self, sesi: SesiKuliah):
+        """Menambahkan satu sesi ke indeks."""
+        self._daftarkan(sesi)
+        mulai = self._mulai_per_hari.setdefault(sesi.hari, [])
+        posisi = bisect_right(mulai, sesi.mulai)
+        mulai.insert(posisi, sesi.mulai)
+        self._per_hari.setdefault(sesi.hari, []).insert(posisi, sesi)
+
+    def tambah_banyak(self, daftar_sesi: Iterable[SesiKuliah]):
+        """Memuat banyak sesi sekaligus; indeks per hari diurutkan sekali di akhir."""
+        for sesi in daftar_sesi:
+            self._daftarkan(sesi)
+            self._per_hari.setdefault(sesi.hari, []).append(sesi)
+        for hari, daftar in self._per_hari.items():
+            daftar.sort(key=lambda s: s.mulai)
+            self._mulai_per_hari[hari] = [s.mulai for s in daftar]
+        LOGGER.info("JadwalIndex memuat %d sesi.", len(self._sesi))
+
+    def _daftarkan(self, sesi: SesiKuliah):
+        if not 0 <= sesi.mulai < sesi.selesai <= MENIT_PER_HARI:
+            raise ValueError(f"Sesi {sesi.kode} memiliki rentang waktu tidak valid.")
+        if sesi.kode in self._sesi:
+            raise ValueError(f"Kode sesi {sesi.kode} sudah terdaftar.")
+        self._sesi[sesi.kode] = sesi
+        awal = sesi.hari * MENIT_PER_HARI
+        self._rentang[sesi.kode] = (awal + sesi.mulai, awal + sesi.selesai)
+        self._durasi_maks = max(self._durasi_maks, sesi.selesai - sesi.mulai)
+
+    def cari_bentrok(self, kode_kelas: Iterable[str]) -> tuple[SesiKuliah, SesiKuliah] | None:
+        """
+        Mencari pasangan sesi yang bentrok dalam satu set kelas pilihan.
+        Args:
+            kode_kelas (Iterable[str]): Kode kelas yang diambil mahasiswa.
+        Returns:
+            tuple[SesiKuliah, SesiKuliah] | None: Pasangan bentrok pertama, atau None jika aman.
+        Raises:
+            KeyError: Jika ada kode kelas yang tidak terdaftar di indeks.
+        """
+        rentang = self._rentang
+        urut = sorted((rentang[k] + (k,) for k in set(kode_kelas)))
+        # Sweep: cukup simpan sesi dengan jam selesai terakhir
+        selesai_maks, kode_maks = -1, None
+        for mulai, selesai, kode in urut:
+            if mulai < selesai_maks:
+                return self._sesi[kode_maks], self._sesi[kode]
+            if selesai > selesai_maks:
+                selesai_maks, kode_maks = selesai, kode
+        return None
+
+    def ada_bentrok(self, kode_kelas: Iterable[str]) -> bool:
+        """True jika ada minimal satu pasangan kelas yang bentrok."""
+        rentang = self._rentang
+        urut = sorted([rentang[k] for k in set(kode_kelas)])
+        for (_, selesai_sebelum), (mulai, _) in zip(urut, urut[1:]):
+            # Cukup bandingkan pasangan bersebelahan: jika ada irisan, pasangan pertama
+            # yang beririsan dalam urutan jam mulai pasti bersebelahan.
+            if mulai < selesai_sebelum:
+                return True
+        return False
+
+    def sesi_beririsan(self, hari: int, mulai: int, selesai: int) -> list[SesiKuliah]:
+        """Semua sesi pada `hari` yang beririsan dengan rentang [mulai, selesai)."""
+        daftar = self._per_hari.get(hari, [])
+        daftar_mulai = self._mulai_per_hari.get(hari, [])
+        # Sesi yang beririsan pasti dimulai dalam [mulai - durasi_maks, selesai)
+        kiri = bisect_left(daftar_mulai, mulai - self._durasi_maks + 1)
+        kanan = bisect_left(daftar_mulai, selesai)
+        return [s for s in daftar[kiri:kanan] if s.selesai > mulai]
+
+    def bentrok_ruang(self) -> list[tuple[SesiKuliah, SesiKuliah]]:
+        """Mendeteksi sesi yang memakai ruangan sama pada waktu beririsan.
+        Setiap sesi yang bentrok dilaporkan berpasangan dengan sesi sebelumnya yang ditimpanya."""
+        hasil = []
+        for daftar in self._per_hari.values():
+            aktif_per_ruang: dict[str, SesiKuliah] = {}
+            for s in daftar:
+                sebelum = aktif_per_ruang.get(s.ruang)
+                if sebelum is not None and s.mulai < sebelum.selesai:
+                    hasil.append((sebelum, s))
+                if sebelum is None or s.selesai > sebelum.selesai:
+                    aktif_per_ruang[s.ruang] = s
+        return hasil
@@ -0,0 +1,202 @@
+# -------------------------- Penyimpanan Mahasiswa Kolumnar (Struct-of-Arrays) --------------------------
+from array import array
+from typing import Iterable, Iterator, Sequence
+import mmap
+import struct
+
+from Latihan_mandiri import Mahasiswa, MahasiswaBatch
+
+# Header file: magic, jumlah mahasiswa, lebar kolom NIM
+_HEADER = struct.Struct("<4sQI")
+_MAGIC_V1 = b"MHS1"  # Tanpa kolom kelas (file lama tetap bisa dibuka)
+_MAGIC = b"MHS2"
+# Header tambahan MHS2: jumlah kode kelas di kolom datar, panjang tabel kode (byte UTF-8)
+_HEADER_KELAS = struct.Struct("<QQ")
+
+class MahasiswaView:
+    """
+    View ringan (tanpa __dict__) ke satu baris MahasiswaStore.
+    Memiliki atribut yang sama dengan Mahasiswa sehingga bisa langsung diberikan ke
+    implementasi IValidationRule maupun RegistrationService.register_mhs.
+    """
+    __slots__ = ("_store", "_indeks")
+
+    def __init__(self, store: "MahasiswaStore", indeks: int):
+        self._store = store
+        self._indeks = indeks
+
+    @property
+    def nim(self) -> str:
+        return self._store.nim_at(self._indeks)
+
+    @property
+    def sks_diambil(self) -> int:
+        return self._store._sks[self._indeks]
+
+    @property
+    def matkul_prasyarat(self) -> bool:
+        return self._store._prasyarat[self._indeks] != 0
+
+    @property
+    def kelas_diambil(self) -> tuple[str, ...]:
+        return self._store.kelas_at(self._indeks)
+
+    def __repr__(self) -> str:
+        return f"MahasiswaView(nim={self.nim!r}, sks_diambil={self.sks_diambil}, matkul_prasyarat={self.matkul_prasyarat})"
+
+class MahasiswaStore:
+    """
+    Menyimpan NIM, SKS, status prasyarat, dan kelas pilihan dalam array bertipe (struct-of-arrays):
+    NIM sebagai byte ASCII lebar tetap, SKS sebagai uint16, prasyarat sebagai uint8, dan kelas
+    sebagai ID kode (uint32, satu kolom datar) dengan offset awal per mahasiswa (uint32);
+    teks kode kelas disimpan sekali di tabel kode.
+    Store dapat disimpan ke file lalu dibuka kembali lewat memory-map tanpa parsing ulang.
+    Args:
+        lebar_nim (int): Jumlah byte maksimum untuk satu NIM.
+    """
+    def __init__(self, lebar_nim: int = 12):
+        self.lebar_nim = lebar_nim
+        self._nim = bytearray()
+        self._sks = array('H')
+        self._prasyarat = array('B')
+        self._kelas = array('I')            # ID kode kelas semua mahasiswa, bersambung
+        self._kelas_awal = array('I', [0])  # Kelas mahasiswa i = _kelas[_kelas_awal[i]:_kelas_awal[i + 1]]
+        self._kode: list[str] = []
+        self._id_kode: dict[str, int] = {}
+        self._mmap: mmap.mmap | None = None
+        self._view: memoryview | None = None
+
+    # --- Penambahan Data ---
+    def append(self, nim: str, sks_diambil: int, matkul_prasyarat: bool = True, kelas_diambil: Sequence[str] = ()):
+        """Menambahkan satu mahasiswa (beserta kode kelas pilihannya) ke akhir store."""
+        if self._mmap is not None:
+            raise TypeError("MahasiswaStore yang dibuka dari file bersifat read-only.")
+        if any(not kode or "\n" in kode for kode in kelas_diambil):
+            raise ValueError(f"Kode kelas NIM {nim} tidak boleh kosong atau berisi baris baru.")
+        nim_bytes = nim.encode("ascii")
+        if len(nim_bytes) > self.lebar_nim:
+            raise ValueError(f"NIM {nim} melebihi lebar maksimum {self.lebar_nim} byte.")
+        self._nim += nim_bytes.ljust(self.lebar_nim, b"\0")
+        self._sks.append(sks_diambil)
+        self._prasyarat.append(1 if matkul_prasyarat else 0)
+        for kode in kelas_diambil:
+            id_kode = self._id_kode.get(kode)
+            if id_kode is None:
+                id_kode = self._id_kode[kode] = len(self._kode)
+                self._kode.append(kode)
+            self._kelas.append(id_kode)
+        self._kelas_awal.append(len(self._kelas))
+
+    def extend(self, daftar_mhs: Iterable[Mahasiswa]):
+        """Menambahkan banyak objek Mahasiswa (atau objek lain dengan atribut yang sama)."""
+        for mhs in daftar_mhs:
+            self.append(mhs.nim, mhs.sks_diambil, mhs.matkul_prasyarat, mhs.kelas_diambil)
+
+    # --- Akses Data ---
+    def __len__(self) -> int:
+        return len(self._sks)
+
+    def __getitem__(self, indeks: int) -> MahasiswaView:
+        if indeks < 0:
+            indeks += len(self)
+        if not 0 <= indeks < len(self):
+            raise IndexError("Indeks MahasiswaStore di luar jangkauan.")
+        return MahasiswaView(self, indeks)
+
+    def __iter__(self) -> Iterator[MahasiswaView]:
+        for indeks in range(len(self)):
+            yield MahasiswaView(self, indeks)
+
+    def nim_at(self, indeks: int) -> str:
+        awal = indeks * self.lebar_nim
+        return bytes(self._nim[awal:awal + self.lebar_nim]).rstrip(b"\0").decode("ascii")
+
+    def kelas_at(self, indeks: int) -> tuple[str, ...]:
+        kode = self._kode
+        return tuple(kode[k] for k in self._kelas[self._kelas_awal[indeks]:self._kelas_awal[indeks + 1]])
+
+    def to_batch(self) -> MahasiswaBatch:
+        """Membuat MahasiswaBatch (termasuk kolom kelas) untuk RegistrationService.register_many."""
+        n = len(self)
+        return MahasiswaBatch([self.nim_at(i) for i in range(n)], self._sks, self._prasyarat,
+                              [self.kelas_at(i) for i in range(n)])
+
+    @property
+    def nbytes(self) -> int:
+        """Jumlah byte data kolom (tanpa overhead objek Python dan tabel kode kelas)."""
+        return (len(self._nim) + len(self._sks) * self._sks.itemsize + len(self._prasyarat) * self._prasyarat.itemsize
+                + len(self._kelas) * self._kelas.itemsize + len(self._kelas_awal) * self._kelas_awal.itemsize)
+
+    # --- Persistensi (memory-mapped) ---
+    def save(self, path: str):
+        """Menulis store ke file biner yang dapat dibuka kembali dengan MahasiswaStore.open."""
+        tabel_kode = "\n".join(self._kode).encode("utf-8")
+        with open(path, "wb") as f:
+            f.write(_HEADER.pack(_MAGIC, len(self), self.lebar_nim))
+            f.write(_HEADER_KELAS.pack(len(self._kelas), len(tabel_kode)))
+            f.write(self._nim)
+            if len(self._nim) % 2:
+                f.write(b"\0")  # Padding agar kolom uint16 sejajar 2 byte
+            f.write(self._sks.tobytes())
+            f.write(self._prasyarat.tobytes())
+            f.write(b"\0" * (-f.tell() % 4))  # Padding agar kolom offset uint32 sejajar 4 byte
+            f.write(self._kelas_awal.tobytes())
+            f.write(self._kelas.tobytes())
+            f.write(tabel_kode)
+
+    @classmethod
+    def open(cls, path: str) -> "MahasiswaStore":
+        """Membuka file hasil save() secara memory-mapped (read-only, tanpa menyalin data)."""
+        with open(path, "rb") as f:
+            peta = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, jumlah, lebar_nim = _HEADER.unpack_from(peta, 0)
+        if magic not in (_MAGIC, _MAGIC_V1):
+            peta.close()
+            raise ValueError(f"{path} bukan file MahasiswaStore.")
+        if (array('H').itemsize, array('I').itemsize) != (2, 4) \
+                or struct.pack("=H", 1) != struct.pack("<H", 1):
+            peta.close()
+            raise ValueError("MahasiswaStore.open membutuhkan platform little-endian.")
+
+        store = cls(lebar_nim)
+        view = memoryview(peta)
+        posisi = _HEADER.size
+        jumlah_kelas = panjang_tabel = 0
+        if magic == _MAGIC:
+            jumlah_kelas, panjang_tabel = _HEADER_KELAS.unpack_from(peta, posisi)
+            posisi += _HEADER_KELAS.size
+        store._nim = view[posisi:posisi + jumlah * lebar_nim]
+        posisi += jumlah * lebar_nim + (jumlah * lebar_nim) % 2
+        store._sks = view[posisi:posisi + jumlah * 2].cast('H')
+        posisi += jumlah * 2
+        store._prasyarat = view[posisi:posisi + jumlah]
+        posisi += jumlah
+        if magic == _MAGIC:
+            posisi += -posisi % 4
+            store._kelas_awal = view[posisi:posisi + (jumlah + 1) * 4].cast('I')
+            posisi += (jumlah + 1) * 4
+            store._kelas = view[posisi:posisi + jumlah_kelas * 4].cast('I')
+            posisi += jumlah_kelas * 4
+            tabel_kode = bytes(view[posisi:posisi + panjang_tabel]).decode("utf-8")
+            store._kode = tabel_kode.split("\n") if panjang_tabel else []
+        else:
+            store._kelas_awal = array('I', bytes(4 * (jumlah + 1)))  # Semua mahasiswa tanpa kelas
+        store._view = view
+        store._mmap = peta
+        return store
+
+    def close(self):
+        """Melepas memory-map (jika ada). Store tidak bisa dipakai lagi setelah ditutup."""
+        if self._mmap is not None:
+            for kolom in (self._nim, self._sks, self._prasyarat, self._kelas, self._kelas_awal, self._view):
+                if isinstance(kolom, memoryview):
+                    kolom.release()
+            self._view = None
+            self._mmap.close()
+            self._mmap = None
+
+    def __enter__(self) -> "MahasiswaStore":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
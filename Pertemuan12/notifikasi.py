@@ -0,0 +1,198 @@
+# -------------------------- Notifikasi Email Batch (SMTP) --------------------------
+from email.message import EmailMessage
+from typing import Callable
+import logging
+import queue
+import smtplib
+import threading
+import time
+
+from refactor_solid import Order, INotificationService
+
+LOGGER = logging.getLogger('Notifikasi')
+
+_SELESAI = object()  # Penanda shutdown untuk worker
+# Hanya gangguan koneksi yang layak di-retry; penolakan server (alamat ditolak, data ditolak)
+# berlaku untuk satu pesan dan akan terulang jika dikirim lagi.
+# Catatan: SMTPException adalah turunan OSError, jadi urutan except di _kirim_batch penting.
+_KONEKSI_SMTP = (smtplib.SMTPServerDisconnected, smtplib.SMTPConnectError)
+
+class BatchedEmailNotifier(INotificationService):
+    """
+    Notifier email yang mengantrikan konfirmasi pesanan dan mengirimnya per batch
+    lewat satu koneksi SMTP yang dipakai ulang.
+    - Batch dikirim saat jumlahnya mencapai `batch_size` atau setelah `flush_interval` detik.
+    - Antrian dibatasi `max_queue`; send() akan menunggu (backpressure) jika antrian penuh.
+    - close() mengirim semua pesan yang masih tersisa sebelum worker berhenti.
+    """
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        pengirim: str = 'toko@localhost',
+        alamat_penerima: Callable[[Order], str] = lambda order: f'{order.customer_name}@localhost',
+        batch_size: int = 50,
+        flush_interval: float = 1.0,
+        max_queue: int = 1000,
+        max_retry: int = 3,
+        smtp_factory: Callable[[str, int], smtplib.SMTP] = smtplib.SMTP,
+    ):
+        """
+        Args:
+            host (str), port (int): Alamat server SMTP.
+            pengirim (str): Alamat pengirim email.
+            alamat_penerima (Callable[[Order], str]): Fungsi untuk menentukan alamat tujuan dari Order.
+            batch_size (int): Jumlah email maksimum per batch.
+            flush_interval (float): Waktu tunggu maksimum (detik) sebelum batch yang belum penuh dikirim.
+            max_queue (int): Kapasitas antrian; send() memblokir jika penuh.
+            max_retry (int): Jumlah percobaan ulang batch saat koneksi SMTP bermasalah.
+            smtp_factory (Callable): Pembuat koneksi SMTP (bisa diganti saat pengujian).
+        """
+        self.host = host
+        self.port = port
+        self.pengirim = pengirim
+        self.alamat_penerima = alamat_penerima
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_retry = max_retry
+        self.smtp_factory = smtp_factory
+        self.jumlah_terkirim = 0
+        self.jumlah_batch = 0
+        self.gagal: list[Order] = []
+        self._antrian: queue.Queue = queue.Queue(maxsize=max_queue)
+        self._smtp: smtplib.SMTP | None = None
+        self._ditutup = False
+        self._worker = threading.Thread(target=self._jalankan_worker, name='BatchedEmailNotifier', daemon=True)
+        self._worker.start()
+
+    def send(self, order: Order, timeout: float | None = None):
+        """
+        Mengantrikan email konfirmasi untuk `order`.
+        Raises:
+            RuntimeError: Jika notifier sudah ditutup.
+            queue.Full: Jika antrian tetap penuh setelah `timeout` detik.
+        """
+        if self._ditutup:
+            raise RuntimeError('BatchedEmailNotifier sudah ditutup.')
+        self._antrian.put(order, timeout=timeout)
+
+    def flush(self):
+        """Menunggu sampai semua email yang sudah diantrikan selesai diproses."""
+        self._antrian.join()
+
+    def close(self):
+        """Mengirim sisa antrian, menutup koneksi SMTP, lalu menghentikan worker."""
+        if self._ditutup:
+            return
+        self._ditutup = True
+        self._antrian.put(_SELESAI)
+        self._worker.join()
+
+    def __enter__(self) -> "BatchedEmailNotifier":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # --- Worker ---
+    def _jalankan_worker(self):
+        selesai = False
+        while not selesai:
+            batch, selesai = self._ambil_batch()
+            try:
+                if batch:
+                    self._kirim_batch(batch)
+            finally:
+                # Selalu ditandai selesai agar flush() tidak menggantung
+                for _ in range(len(batch) + (1 if selesai else 0)):
+                    self._antrian.task_done()
+        # Pesanan yang masuk bersamaan dengan close() tetap dikirim
+        tersisa = []
+        while True:
+            try:
+                tersisa.append(self._antrian.get_nowait())
+            except queue.Empty:
+                break
+        try:
+            if tersisa:
+                self._kirim_batch(tersisa)
+        finally:
+            for _ in tersisa:
+                self._antrian.task_done()
+            self._tutup_koneksi()
+
+    def _ambil_batch(self) -> tuple[list[Order], bool]:
+        """Mengambil hingga batch_size pesanan; menunggu paling lama flush_interval setelah item pertama."""
+        item = self._antrian.get()
+        if item is _SELESAI:
+            return [], True
+        batch = [item]
+        batas_waktu = time.monotonic() + self.flush_interval
+        while len(batch) < self.batch_size:
+            sisa = batas_waktu - time.monotonic()
+            try:
+                item = self._antrian.get(timeout=sisa) if sisa > 0 else self._antrian.get_nowait()
+            except queue.Empty:
+                break
+            if item is _SELESAI:
+                return batch, True
+            batch.append(item)
+        return batch, False
+
+    def _kirim_batch(self, batch: list[Order]):
+        """
+        Mengirim batch lewat satu koneksi. Gangguan koneksi (_KONEKSI_SMTP, OSError) mengulang batch
+        mulai dari pesan yang belum terkirim; error lain, termasuk penolakan SMTP per pesan
+        (SMTPRecipientsRefused, SMTPSenderRefused, SMTPDataError), hanya menggagalkan pesan itu.
+        """
+        i = 0  # Pesan sebelum indeks ini sudah terkirim atau sudah masuk self.gagal
+        for percobaan in range(1, self.max_retry + 1):
+            try:
+                smtp = self._koneksi()
+                while i < len(batch):
+                    try:
+                        smtp.send_message(self._buat_pesan(batch[i]))
+                    except _KONEKSI_SMTP:
+                        raise
+                    except smtplib.SMTPException as e:
+                        LOGGER.error('Email untuk pesanan ke-%d dalam batch ditolak server: %s', i + 1, e)
+                        self.gagal.append(batch[i])
+                    except OSError:
+                        raise
+                    except Exception:
+                        # Pesanan ini sendiri yang bermasalah (alamat/isi tidak valid): worker tetap hidup
+                        LOGGER.exception('Email untuk pesanan ke-%d dalam batch gagal dibuat/dikirim.', i + 1)
+                        self.gagal.append(batch[i])
+                    else:
+                        self.jumlah_terkirim += 1
+                    i += 1
+                self.jumlah_batch += 1
+                LOGGER.info('Batch %d email diproses.', len(batch))
+                return
+            except Exception as e:
+                LOGGER.warning('Pengiriman batch gagal (percobaan %d/%d): %s', percobaan, self.max_retry, e)
+                self._tutup_koneksi()
+        # Pesan yang tetap gagal disimpan agar bisa dikirim ulang, bukan dibuang diam-diam
+        self.gagal.extend(batch[i:])
+        LOGGER.error('%d email gagal dikirim setelah %d percobaan.', len(batch) - i, self.max_retry)
+
+    def _koneksi(self) -> smtplib.SMTP:
+        if self._smtp is None:
+            self._smtp = self.smtp_factory(self.host, self.port)
+        return self._smtp
+
+    def _tutup_koneksi(self):
+        if self._smtp is not None:
+            try:
+                self._smtp.quit()
+            except (smtplib.SMTPException, OSError):
+                self._smtp.close()
+            self._smtp = None
+
+    def _buat_pesan(self, order: Order) -> EmailMessage:
+        pesan = EmailMessage()
+        pesan['From'] = self.pengirim
+        pesan['To'] = self.alamat_penerima(order)
+        pesan['Subject'] = 'Konfirmasi Pesanan'
+        pesan.set_content(f'Halo {order.customer_name}, pembayaran sebesar {order.total_price} telah diterima.')
+        return pesan
@@ -1,6 +1,14 @@
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import logging
+import os
+import sys
+import time
+import uuid
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "bersama"))  # modul bersama: money, wal, metrics, profiler
+from instrumentasi import AKTIF as INSTRUMENTASI, SPANS, event
+from money import Money
+from wal import TransactionJournal
 # [Pastikan import logging ada di awal file]
     
 # Konfigurasi dasar: semua log level INFO ke atas akan ditampilkan
@@ -15,8 +23,15 @@ LOGGER = logging.getLogger('Checkout')
 @dataclass
 class Order:
     customer_name: str
-    total_price: float
+    total_price: Money
     status: str = 'open'
+    # Kunci idempotensi: retry untuk pesanan yang sama harus memakai kunci yang sama
+    idempotency_key: str = field(default_factory=lambda: uuid.uuid4().hex)
+
+    def __post_init__(self):
+        # Total boleh diberikan sebagai angka Rupiah; disimpan sebagai Money (sen, integer) agar eksak
+        if not isinstance(self.total_price, Money):
+            self.total_price = Money.of(self.total_price)
 
 # === KODE BURUK (SEBELUM REFACTORING) ===
 class OrderManager: # melanggar SRP, OCP DIP
@@ -68,16 +83,20 @@ class EmailNotifier(INotificationService):
 
 # --- KELAS KOORDINATOR (SRP & DIP) ---
 class CheckoutService: # Tanggung jawab tunggal: Mengkoordinasi Checkout
-    def __init__(self, payment_processor: IPaymentProcessor, notifier:INotificationService):
+    def __init__(self, payment_processor: IPaymentProcessor, notifier:INotificationService,
+                 journal: TransactionJournal | None = None):
         """
         Menginisialisasi CheckoutService dengan dependensi yang diperlukan.
 
         Args:
             payment_processor (IPaymentProcessor): Implementasi interface pembayaran.
             notifier (INotificationService): Implementasi interface notifikasi.
+            journal (TransactionJournal | None): Opsional; pesanan yang sudah dibayar dicatat
+                ke write-ahead log sebelum notifikasi dikirim.
         """
         self.payment_processor = payment_processor
         self.notifier = notifier
+        self.journal = journal
 
     def run_checkout(self, order: Order) -> bool:
         """
@@ -89,44 +108,87 @@ class CheckoutService: # Tanggung jawab tunggal: Mengkoordinasi Checkout
         Returns:
             bool: True jika checkout sukses, False jika gagal.
         """
-        # Logging alih-alih print
-        LOGGER.info(f'Memulai checkout untuk {order.customer_name}. Total: {order.total_price}')
+        if INSTRUMENTASI:
+            return self._run_checkout_terinstrumentasi(order)
 
         payment_success= self.payment_processor.process(order) #Delegasi 1
 
         if payment_success:
             order.status = 'paid'
-            self.notifier.send(order)
-            LOGGER.info('Checkout Sukses. Status pesanan: PAID')
+            if self.journal is not None:
+                self._catat_jurnal(order)
+            self.notifier.send(order) # Delegasi 2
             return True
+        # WARNING/ERROR tidak ikut dimatikan bersama instrumentasi
+        event(LOGGER, logging.ERROR, 'checkout.gagal', 'Pembayaran gagal. Transaksi dibatalkan.',
+              customer=order.customer_name)
+        return False
+
+    def _catat_jurnal(self, order: Order):
+        self.journal.append({
+            'type': 'order',
+            'customer': order.customer_name,
+            'total_sen': order.total_price.sen,
+            'status': order.status,
+            'idempotency_key': order.idempotency_key,
+        })
+
+    def _run_checkout_terinstrumentasi(self, order: Order) -> bool:
+        """Jalur run_checkout dengan event log (lazy) dan span durasi per delegasi."""
+        mulai_checkout = time.perf_counter_ns()
+        # Logging alih-alih print; pesan baru diformat jika level INFO aktif
+        event(LOGGER, logging.INFO, 'checkout.mulai', 'Memulai checkout untuk %s. Total: %s',
+              order.customer_name, order.total_price)
+
+        mulai = time.perf_counter_ns()
+        payment_success= self.payment_processor.process(order) #Delegasi 1
+        SPANS.record('CheckoutService.payment', time.perf_counter_ns() - mulai)
+
+        if payment_success:
+            order.status = 'paid'
+            if self.journal is not None:
+                mulai = time.perf_counter_ns()
+                self._catat_jurnal(order)
+                SPANS.record('CheckoutService.journal', time.perf_counter_ns() - mulai)
+            mulai = time.perf_counter_ns()
+            self.notifier.send(order) # Delegasi 2
+            SPANS.record('CheckoutService.notifier', time.perf_counter_ns() - mulai)
+            event(LOGGER, logging.INFO, 'checkout.sukses', 'Checkout Sukses. Status pesanan: PAID')
+            hasil = True
         else:
             # Gunakan level ERROR/WARNING untuk masalah
-            LOGGER.error('Pembayaran gagal. Transaksi dibatalkan.')
-            return False
+            event(LOGGER, logging.ERROR, 'checkout.gagal', 'Pembayaran gagal. Transaksi dibatalkan.',
+                  customer=order.customer_name)
+            hasil = False
+        SPANS.record('CheckoutService.run_checkout', time.perf_counter_ns() - mulai_checkout)
+        return hasil
         
 
-# --- PROGRAM UTAMA ---
-# Setup Dependencies
-andi_order = Order('Andi', 500000)
-email_service = EmailNotifier()
-
-# 1. Inject implementasi Credit card
-cc_processor = CreditCardProcessor()
-checkout_cc = CheckoutService(payment_processor=cc_processor, notifier=email_service)
-print('--- Skenario 1: Credit Card')
-checkout_cc.run_checkout(andi_order)
-
-# 2 Pembuktian OCP: Menambah Metode pembayaran QRIS (Tanpa mengubah CheckoutService)
+# Pembuktian OCP: Menambah Metode pembayaran QRIS (Tanpa mengubah CheckoutService)
 class QrisProcessor(IPaymentProcessor):
     def process(self, order:Order) -> bool:
         print('Payment: Memproses QRIS.')
         return True
-    
-budi_order = Order('Budi', 100000)
-qris_processor = QrisProcessor()
 
-# Inject implementasi QRIS yang baru dibuat
-checkout_qris = CheckoutService(payment_processor=qris_processor, notifier=email_service)
 
-print('\n--- Skenario 2: Pembuktian OCP (WRIS) ---')
-checkout_qris.run_checkout(budi_order)
+# --- PROGRAM UTAMA ---
+if __name__ == '__main__':
+    # Setup Dependencies
+    andi_order = Order('Andi', 500000)
+    email_service = EmailNotifier()
+
+    # 1. Inject implementasi Credit card
+    cc_processor = CreditCardProcessor()
+    checkout_cc = CheckoutService(payment_processor=cc_processor, notifier=email_service)
+    print('--- Skenario 1: Credit Card')
+    checkout_cc.run_checkout(andi_order)
+
+    # 2 Pembuktian OCP: Inject QrisProcessor (Tanpa mengubah CheckoutService)
+    budi_order = Order('Budi', 100000)
+    qris_processor = QrisProcessor()
+
+    # Inject implementasi QRIS yang baru dibuat
+    checkout_qris = CheckoutService(payment_processor=qris_processor, notifier=email_service)
+
+    print('\n--- Skenario 2: Pembuktian OCP (WRIS) ---')
+    checkout_qris.run_checkout(budi_order)
@@ -0,0 +1,135 @@
+# -------------------------- Registrasi Ter-shard (Process Pool) --------------------------
+# Registrasi massal di beberapa proses agar tidak dibatasi GIL saat puncak pengisian KRS.
+# - Batch dipotong menjadi rentang indeks yang bersebelahan (chunk) dan dibagi bergiliran ke
+#   worker. Memotong rentang hanyalah slicing kolom (dikerjakan di C), jadi induk tidak lagi
+#   menghitung hash per NIM atau menyalin baris satu per satu; aturan validasi tidak punya
+#   state antarbaris sehingga mahasiswa tidak perlu ditempelkan ke worker tertentu.
+# - Daftar aturan dikirim sekali per worker lewat initializer, bukan sekali per tugas.
+# - Worker hanya mengembalikan baris yang ditolak, sehingga biaya penggabungan sebanding
+#   dengan jumlah penolakan, bukan jumlah mahasiswa.
+# - Sisa kerja serial di induk adalah pickling chunk (terutama kolom kelas_diambil); kode kelas
+#   sengaja tidak di-intern menjadi array integer karena loop intern di induk lebih mahal
+#   daripada pickling list yang string-nya sudah di-memo oleh pickle.
+# - Hasil digabung kembali sesuai urutan input, identik dengan RegistrationService.register_many.
+from array import array
+from concurrent.futures import Future, ProcessPoolExecutor
+import logging
+import os
+
+from instrumentasi import AKTIF as INSTRUMENTASI, event
+from Latihan_mandiri import LOGGER, Mahasiswa, MahasiswaBatch, RegistrationBatchResult, RegistrationService, IValidationRule
+
+# --- SISI WORKER ---
+_SERVICE: RegistrationService | None = None
+_NAMA_RULE: dict[str, int] = {}
+
+def _init_worker(validation_rules: list[IValidationRule], log_disable: int):
+    """Dipanggil sekali per proses worker: menyimpan aturan dan menyamakan logging dengan induk."""
+    global _SERVICE, _NAMA_RULE
+    _SERVICE = RegistrationService(validation_rules)
+    _NAMA_RULE = {type(rule).__name__: i for i, rule in enumerate(validation_rules)}
+    logging.disable(log_disable)
+
+def _validasi_chunk(chunk: MahasiswaBatch) -> tuple[array, array]:
+    """Mengembalikan (posisi relatif baris yang ditolak, indeks aturan yang menolaknya)."""
+    hasil = _SERVICE.register_many(chunk)
+    ditolak, oleh = array('i'), array('b')
+    for i, nama in enumerate(hasil.gagal_oleh):
+        if nama is not None:
+            ditolak.append(i)
+            oleh.append(_NAMA_RULE[nama])
+    return ditolak, oleh
+
+# --- SISI INDUK ---
+def _iris(batch: MahasiswaBatch, awal: int, akhir: int) -> MahasiswaBatch:
+    kelas = batch.kelas_diambil
+    return MahasiswaBatch(
+        batch.nim[awal:akhir],
+        batch.sks_diambil[awal:akhir],
+        batch.matkul_prasyarat[awal:akhir],
+        kelas[awal:akhir] if kelas is not None else None,
+    )
+
+class ShardedRegistrationService:
+    """
+    Pengganti RegistrationService untuk batch besar yang memakai semua core.
+    Args:
+        validation_rules (list[IValidationRule]): Aturan validasi; harus bisa di-pickle.
+        workers (int | None): Jumlah proses worker; default jumlah CPU.
+        chunk_size (int): Jumlah baris bersebelahan per tugas yang dikirim ke worker.
+        mp_context: Konteks multiprocessing (misalnya multiprocessing.get_context("spawn")).
+    Proses worker dibuat saat register_many pertama dan dipakai ulang; panggil close()
+    (atau gunakan sebagai context manager) untuk menghentikannya.
+    """
+    def __init__(self, validation_rules: list[IValidationRule], workers: int | None = None,
+                 chunk_size: int = 20_000, mp_context=None):
+        if chunk_size <= 0:
+            raise ValueError("chunk_size harus lebih dari 0.")
+        self.validation_rules = validation_rules
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self._mp_context = mp_context
+        self._nama_rule = [type(rule).__name__ for rule in validation_rules]
+        self._lokal = RegistrationService(validation_rules)
+        self._pools: list[ProcessPoolExecutor] | None = None
+
+    def _pool(self) -> list[ProcessPoolExecutor]:
+        if self._pools is None:
+            # Satu executor berisi satu proses per worker agar pembagian chunk bisa diatur sendiri
+            initargs = (self.validation_rules, logging.root.manager.disable)
+            self._pools = [
+                ProcessPoolExecutor(1, mp_context=self._mp_context, initializer=_init_worker, initargs=initargs)
+                for _ in range(self.workers)
+            ]
+        return self._pools
+
+    def _rencana(self, n: int) -> list[tuple[int, int, int]]:
+        """Membagi n baris menjadi (worker, awal, akhir): rentang bersebelahan, bergiliran antarworker."""
+        return [(k % self.workers, awal, min(awal + self.chunk_size, n))
+                for k, awal in enumerate(range(0, n, self.chunk_size))]
+
+    def register_mhs(self, mhs: Mahasiswa) -> bool:
+        """Satu mahasiswa divalidasi langsung di proses ini; biaya IPC tidak sebanding."""
+        return self._lokal.register_mhs(mhs)
+
+    def register_many(self, batch: MahasiswaBatch) -> RegistrationBatchResult:
+        """
+        Menjalankan registrasi batch di semua worker.
+        Returns:
+            RegistrationBatchResult: Sama persis dengan RegistrationService.register_many, urutan sesuai input.
+        """
+        n = len(batch)
+        pools = self._pool()
+        tugas: list[tuple[int, Future]] = [
+            (awal, pools[worker].submit(_validasi_chunk, _iris(batch, awal, akhir)))
+            for worker, awal, akhir in self._rencana(n)
+        ]
+
+        diterima = [True] * n
+        gagal_oleh: list[str | None] = [None] * n
+        nama_rule = self._nama_rule
+        jumlah_ditolak = 0
+        for awal, future in tugas:
+            ditolak, oleh = future.result()
+            jumlah_ditolak += len(ditolak)
+            for rel, r in zip(ditolak, oleh):
+                i = awal + rel
+                diterima[i] = False
+                gagal_oleh[i] = nama_rule[r]
+
+        if INSTRUMENTASI:
+            event(LOGGER, logging.INFO, "registrasi.batch_shard", "REGISTRASI BATCH (%d shard): %d dari %d mahasiswa terdaftar.",
+                  self.workers, n - jumlah_ditolak, n)
+        return RegistrationBatchResult(diterima=diterima, gagal_oleh=gagal_oleh)
+
+    def close(self):
+        if self._pools is not None:
+            for pool in self._pools:
+                pool.shutdown()
+            self._pools = None
+
+    def __enter__(self) -> "ShardedRegistrationService":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,116 @@
+import asyncio
+import logging
+import time
+import unittest
+from checkout_async import AsyncCheckoutService, IAsyncPaymentProcessor, IAsyncNotificationService
+from refactor_solid import Order, QrisProcessor, INotificationService
+
+class PembayaranHitung(IAsyncPaymentProcessor):
+    """Fake prosesor yang mencatat jumlah pembayaran yang berjalan bersamaan."""
+    def __init__(self, sukses: bool = True):
+        self.sukses = sukses
+        self.aktif = 0
+        self.aktif_maks = 0
+
+    async def process(self, order: Order) -> bool:
+        self.aktif += 1
+        self.aktif_maks = max(self.aktif_maks, self.aktif)
+        await asyncio.sleep(0.01)
+        self.aktif -= 1
+        return self.sukses
+
+class NotifikasiLambat(IAsyncNotificationService):
+    def __init__(self):
+        self.terkirim = []
+
+    async def send(self, order: Order):
+        await asyncio.sleep(0.2)
+        self.terkirim.append(order.customer_name)
+
+class NotifikasiSinkron(INotificationService):
+    def __init__(self):
+        self.terkirim = []
+
+    def send(self, order: Order):
+        self.terkirim.append(order.customer_name)
+
+class TestAsyncCheckout(unittest.TestCase):
+
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+
+    def test_notifikasi_tidak_memblokir_checkout(self):
+        """Tes 1: Checkout selesai sebelum notifikasi lambat terkirim; drain menunggu semuanya."""
+        notifier = NotifikasiLambat()
+        service = AsyncCheckoutService(PembayaranHitung(), notifier)
+
+        async def skenario():
+            mulai = time.perf_counter()
+            hasil = await service.run_many([Order('A', 1000), Order('B', 2000)])
+            durasi_checkout = time.perf_counter() - mulai
+            await service.aclose()
+            return hasil, durasi_checkout
+
+        hasil, durasi_checkout = asyncio.run(skenario())
+        self.assertEqual(hasil, [True, True])
+        self.assertLess(durasi_checkout, 0.2)
+        self.assertEqual(sorted(notifier.terkirim), ['A', 'B'])
+
+    def test_batas_konkurensi(self):
+        """Tes 2: Jumlah pembayaran bersamaan tidak melebihi max_concurrency."""
+        pembayaran = PembayaranHitung()
+        service = AsyncCheckoutService(pembayaran, NotifikasiLambat(), max_concurrency=3)
+        asyncio.run(service.run_many([Order(str(i), i) for i in range(10)]))
+        self.assertEqual(pembayaran.aktif_maks, 3)
+
+    def test_pembayaran_gagal(self):
+        """Tes 3: Pesanan tetap 'open' dan tidak ada notifikasi jika pembayaran gagal."""
+        notifier = NotifikasiLambat()
+        order = Order('C', 5000)
+        service = AsyncCheckoutService(PembayaranHitung(sukses=False), notifier)
+
+        async def skenario():
+            hasil = await service.run_checkout_async(order)
+            await service.aclose()
+            return hasil
+
+        self.assertFalse(asyncio.run(skenario()))
+        self.assertEqual(order.status, 'open')
+        self.assertEqual(notifier.terkirim, [])
+
+    def test_adapter_thread_pool_untuk_prosesor_sinkron(self):
+        """Tes 4: Prosesor dan notifier sinkron otomatis dibungkus thread pool."""
+        notifier = NotifikasiSinkron()
+        order = Order('D', 7000)
+        service = AsyncCheckoutService(QrisProcessor(), notifier)
+
+        async def skenario():
+            hasil = await service.run_checkout_async(order)
+            await service.aclose()
+            return hasil
+
+        self.assertTrue(asyncio.run(skenario()))
+        self.assertEqual(order.status, 'paid')
+        self.assertEqual(notifier.terkirim, ['D'])
+
+    def test_dipakai_dari_beberapa_event_loop(self):
+        """Tes 5: Service yang sama bisa dipakai di asyncio.run berikutnya; batas konkurensi berlaku per loop."""
+        pembayaran = PembayaranHitung()
+        notifier = NotifikasiLambat()
+        service = AsyncCheckoutService(pembayaran, notifier, max_concurrency=2)
+
+        async def skenario(awal: int):
+            hasil = await service.run_many([Order(str(i), i) for i in range(awal, awal + 5)])
+            await service.drain()
+            return hasil
+
+        self.assertEqual(asyncio.run(skenario(0)), [True] * 5)
+        self.assertEqual(asyncio.run(skenario(5)), [True] * 5)
+        self.assertEqual(pembayaran.aktif_maks, 2)
+        self.assertEqual(len(notifier.terkirim), 10)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,48 @@
+import logging
+import unittest
+from checkout_metrik import MeteredPaymentProcessor, MeteredCheckoutService
+from metrics import MetricsRegistry
+from refactor_solid import Order, CheckoutService, IPaymentProcessor, INotificationService, QrisProcessor
+
+class ProsesorMenolak(IPaymentProcessor):
+    def process(self, order: Order) -> bool:
+        return False
+
+class ProsesorRusak(IPaymentProcessor):
+    def process(self, order: Order) -> bool:
+        raise ConnectionError("gateway mati")
+
+class NotifierDiam(INotificationService):
+    def send(self, order: Order):
+        pass
+
+class TestCheckoutMetrik(unittest.TestCase):
+
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+        self.registry = MetricsRegistry()
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+
+    def test_metrik_per_prosesor_dan_checkout(self):
+        """Tes 1: Hasil ok/declined/error tercatat per prosesor, dan checkout end-to-end ikut terukur."""
+        qris = MeteredCheckoutService(
+            CheckoutService(MeteredPaymentProcessor(QrisProcessor(), self.registry), NotifierDiam()), self.registry)
+        tolak = MeteredPaymentProcessor(ProsesorMenolak(), self.registry, name="cc")
+        rusak = MeteredPaymentProcessor(ProsesorRusak(), self.registry, name="cc")
+        self.assertTrue(qris.run_checkout(Order("Andi", 500000)))
+        self.assertFalse(tolak.process(Order("Budi", 1000)))
+        with self.assertRaises(ConnectionError):
+            rusak.process(Order("Cici", 1000))
+
+        teks = self.registry.render_prometheus()
+        self.assertIn('payment_total{processor="QrisProcessor",result="ok"} 1', teks)
+        self.assertIn('payment_total{processor="cc",result="declined"} 1', teks)
+        self.assertIn('payment_total{processor="cc",result="error"} 1', teks)
+        self.assertIn('payment_duration_seconds_count{processor="cc"} 2', teks)
+        self.assertIn('checkout_total{result="ok"} 1', teks)
+        self.assertIn("checkout_duration_seconds_count 1", teks)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,103 @@
+import logging
+import os
+import tempfile
+import threading
+import time
+import unittest
+from dataclasses import replace
+from idempotensi import CheckoutResultCache, IdempotentCheckoutService
+from refactor_solid import Order, IPaymentProcessor, INotificationService
+from wal import TransactionJournal
+
+class ProsesorHitung(IPaymentProcessor):
+    """Fake prosesor yang menghitung jumlah panggilan."""
+    def __init__(self, jeda: float = 0.0, error: Exception | None = None):
+        self.panggilan = 0
+        self.jeda = jeda
+        self.error = error
+        self._lock = threading.Lock()
+
+    def process(self, order: Order) -> bool:
+        with self._lock:
+            self.panggilan += 1
+        time.sleep(self.jeda)
+        if self.error is not None:
+            raise self.error
+        return True
+
+class NotifierDiam(INotificationService):
+    def send(self, order: Order):
+        pass
+
+class TestCheckoutIdempoten(unittest.TestCase):
+
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+
+    def test_retry_memakai_hasil_tersimpan(self):
+        """Tes 1: Retry dengan kunci sama tidak memanggil prosesor lagi."""
+        prosesor = ProsesorHitung()
+        service = IdempotentCheckoutService(prosesor, NotifierDiam())
+        order = Order('Andi', 500000)
+        retry = replace(order, status='open')
+        self.assertTrue(service.run_checkout(order))
+        self.assertTrue(service.run_checkout(retry))
+        self.assertEqual(prosesor.panggilan, 1)
+        self.assertEqual(retry.status, 'paid')
+        self.assertEqual(service.cache.hits, 1)
+
+    def test_checkout_bersamaan_digabung(self):
+        """Tes 2: Sepuluh checkout duplikat bersamaan hanya memanggil prosesor sekali."""
+        prosesor = ProsesorHitung(jeda=0.05)
+        service = IdempotentCheckoutService(prosesor, NotifierDiam())
+        order = Order('Budi', 100000)
+        hasil = []
+        threads = [threading.Thread(target=lambda: hasil.append(service.run_checkout(replace(order)))) for _ in range(10)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(hasil, [True] * 10)
+        self.assertEqual(prosesor.panggilan, 1)
+
+    def test_error_tidak_di_cache(self):
+        """Tes 3: Checkout yang error boleh dicoba ulang."""
+        prosesor = ProsesorHitung(error=TimeoutError('gateway timeout'))
+        service = IdempotentCheckoutService(prosesor, NotifierDiam())
+        order = Order('Cici', 1000)
+        for _ in range(2):
+            with self.assertRaises(TimeoutError):
+                service.run_checkout(order)
+        self.assertEqual(prosesor.panggilan, 2)
+
+    def test_cache_lru_dan_ttl(self):
+        """Tes 4 (Boundary): Kunci tertua dibuang saat penuh dan hasil kedaluwarsa setelah TTL."""
+        cache = CheckoutResultCache(max_size=2, ttl=0.05)
+        cache.put('a', True)
+        cache.put('b', True)
+        cache.get('a')
+        cache.put('c', False)
+        self.assertIsNone(cache.get('b'))
+        self.assertIs(cache.get('c'), False)
+        time.sleep(0.06)
+        self.assertIsNone(cache.get('a'))
+
+    def test_order_tercatat_sekali_di_jurnal(self):
+        """Tes 5: Pesanan yang dibayar dicatat ke WAL; retry tidak menambah record."""
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, 'order.wal')
+            journal = TransactionJournal(path)
+            service = IdempotentCheckoutService(ProsesorHitung(), NotifierDiam(), journal=journal)
+            order = Order('Dedi', '1250.50')
+            self.assertTrue(service.run_checkout(order))
+            self.assertTrue(service.run_checkout(replace(order, status='open')))
+            journal.close()
+            records = [p for _, p in TransactionJournal.replay(path)]
+        self.assertEqual(len(records), 1)
+        self.assertEqual((records[0]['total_sen'], records[0]['idempotency_key']), (125050, order.idempotency_key))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,44 @@
+import unittest
+from jadwal import JadwalIndex, SesiKuliah
+
+class TestJadwalIndex(unittest.TestCase):
+
+    def setUp(self):
+        """Arrange: Jadwal kecil dengan satu pasangan bentrok di hari Senin."""
+        self.jadwal = JadwalIndex([
+            SesiKuliah.dari_jam("A", "Senin", "08:00", "12:00", "R101"),
+            SesiKuliah.dari_jam("B", "Senin", "09:00", "09:50", "R102"),
+            SesiKuliah.dari_jam("C", "Senin", "12:00", "13:40", "R101"),
+            SesiKuliah.dari_jam("D", "Selasa", "08:00", "09:40", "R101"),
+        ])
+
+    def test_bentrok_terdeteksi(self):
+        """Tes 1: Sesi B berada di dalam rentang sesi A."""
+        self.assertEqual(self.jadwal.cari_bentrok(["B", "A", "D"]), (self.jadwal.get("A"), self.jadwal.get("B")))
+
+    def test_bersebelahan_tidak_bentrok(self):
+        """Tes 2 (Boundary): Sesi yang selesai tepat saat sesi lain mulai tidak dianggap bentrok."""
+        self.assertFalse(self.jadwal.ada_bentrok(["A", "C", "D"]))
+
+    def test_beda_hari_tidak_bentrok(self):
+        """Tes 3: Jam yang sama pada hari berbeda tidak bentrok."""
+        self.assertFalse(self.jadwal.ada_bentrok(["B", "D"]))
+
+    def test_kode_tidak_dikenal(self):
+        """Tes 4: Kode kelas yang tidak terdaftar menghasilkan KeyError."""
+        with self.assertRaises(KeyError):
+            self.jadwal.ada_bentrok(["A", "Z"])
+
+    def test_sesi_beririsan(self):
+        """Tes 5: Query rentang waktu mengembalikan semua sesi yang beririsan."""
+        hasil = self.jadwal.sesi_beririsan(0, 9 * 60 + 30, 12 * 60 + 30)
+        self.assertEqual({s.kode for s in hasil}, {"A", "B", "C"})
+
+    def test_bentrok_ruang(self):
+        """Tes 6: Penambahan sesi di ruangan yang sama dan waktu beririsan terdeteksi."""
+        self.assertEqual(self.jadwal.bentrok_ruang(), [])
+        self.jadwal.tambah(SesiKuliah.dari_jam("E", "Senin", "11:00", "12:30", "R101"))
+        self.assertEqual([(a.kode, b.kode) for a, b in self.jadwal.bentrok_ruang()], [("A", "E"), ("E", "C")])
+
+if __name__ == '__main__':
+    unittest.main()
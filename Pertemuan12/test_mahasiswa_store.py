@@ -0,0 +1,69 @@
+import logging
+import os
+import tempfile
+import unittest
+from jadwal import JadwalIndex, SesiKuliah
+from Latihan_mandiri import RegistrationService, SksLimitRule, PrerequisiteRule, JadwalBentrokRule
+from mahasiswa_store import MahasiswaStore
+
+class TestMahasiswaStore(unittest.TestCase):
+
+    def setUp(self):
+        """Arrange: Store kecil berisi tiga mahasiswa."""
+        logging.disable(logging.CRITICAL)
+        self.store = MahasiswaStore()
+        self.store.append("24111", 26, True)
+        self.store.append("0244", 20, False)
+        self.store.append("1049", 23, True, ["A", "C"])
+        self.store.append("2050", 20, True, ["A", "B"])
+        self.service = RegistrationService([SksLimitRule(), PrerequisiteRule()])
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+
+    def test_view_dipakai_aturan_validasi(self):
+        """Tes 1: View dari store bisa langsung divalidasi oleh RegistrationService."""
+        self.assertEqual([self.service.register_mhs(v) for v in self.store], [False, False, True, True])
+        self.assertEqual(self.service.register_many(self.store.to_batch()).diterima, [False, False, True, True])
+
+    def test_view_tanpa_dict(self):
+        """Tes 2: View memakai __slots__ (tidak punya __dict__)."""
+        self.assertFalse(hasattr(self.store[0], "__dict__"))
+        self.assertEqual(self.store[-1].nim, "2050")
+
+    def test_simpan_dan_buka_mmap(self):
+        """Tes 3: Data tetap sama setelah disimpan dan dibuka kembali lewat memory-map."""
+        path = os.path.join(tempfile.mkdtemp(), "mhs.bin")
+        self.store.save(path)
+        with MahasiswaStore.open(path) as dibuka:
+            self.assertEqual(
+                [(v.nim, v.sks_diambil, v.matkul_prasyarat, v.kelas_diambil) for v in dibuka],
+                [("24111", 26, True, ()), ("0244", 20, False, ()), ("1049", 23, True, ("A", "C")),
+                 ("2050", 20, True, ("A", "B"))],
+            )
+            with self.assertRaises(TypeError):
+                dibuka.append("1", 20, True)
+        os.remove(path)
+
+    def test_nim_terlalu_panjang(self):
+        """Tes 4 (Boundary): NIM melebihi lebar kolom ditolak."""
+        with self.assertRaises(ValueError):
+            self.store.append("1" * 13, 20, True)
+
+    def test_kelas_tersimpan_untuk_jadwal_bentrok(self):
+        """Tes 5: Kode kelas ikut tersimpan, jadi JadwalBentrokRule menolak view yang jadwalnya bentrok."""
+        jadwal = JadwalIndex([
+            SesiKuliah.dari_jam("A", "Senin", "08:00", "09:40", "R101"),
+            SesiKuliah.dari_jam("B", "Senin", "09:00", "10:40", "R102"),
+            SesiKuliah.dari_jam("C", "Selasa", "13:00", "14:40", "R101"),
+        ])
+        service = RegistrationService([JadwalBentrokRule(jadwal)])
+        self.assertEqual([self.service.register_mhs(v) for v in self.store][2:], [True, True])
+        self.assertEqual([service.register_mhs(v) for v in self.store], [True, True, True, False])
+        self.assertEqual(service.register_many(self.store.to_batch()).diterima, [True, True, True, False])
+        self.assertEqual(self.store[3].kelas_diambil, ("A", "B"))
+        with self.assertRaises(ValueError):
+            self.store.append("3", 20, True, ["A\nB"])
+
+if __name__ == '__main__':
+    unittest.main()
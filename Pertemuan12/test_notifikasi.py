@@ -0,0 +1,147 @@
+import logging
+import queue
+import smtplib
+import socketserver
+import threading
+import unittest
+from notifikasi import BatchedEmailNotifier
+from refactor_solid import Order
+
+class FakeSmtpHandler(socketserver.StreamRequestHandler):
+    """Server SMTP minimal untuk pengujian: menerima semua email dan mencatatnya."""
+    def tulis(self, baris: str):
+        self.wfile.write((baris + '\r\n').encode())
+
+    def handle(self):
+        server = self.server
+        with server.lock:
+            server.jumlah_koneksi += 1
+        self.tulis('220 fake-smtp siap')
+        penerima = []
+        while True:
+            baris = self.rfile.readline().decode().rstrip('\r\n')
+            if not baris:
+                return
+            perintah = baris.split(' ', 1)[0].upper()
+            if perintah in ('EHLO', 'HELO'):
+                self.tulis('250 fake-smtp')
+            elif perintah == 'MAIL':
+                penerima = []
+                self.tulis('250 OK')
+            elif perintah == 'RCPT':
+                alamat = baris.split(':', 1)[1].strip(' <>')
+                if alamat in server.ditolak:
+                    self.tulis('550 Mailbox tidak dikenal')
+                    continue
+                penerima.append(alamat)
+                self.tulis('250 OK')
+            elif perintah == 'DATA':
+                self.tulis('354 Lanjutkan')
+                while self.rfile.readline().rstrip(b'\r\n') != b'.':
+                    pass
+                with server.lock:
+                    server.kotak_masuk.extend(penerima)
+                self.tulis('250 Diterima')
+            elif perintah == 'QUIT':
+                self.tulis('221 Bye')
+                return
+            else:
+                self.tulis('250 OK')
+
+class FakeSmtpServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self):
+        super().__init__(('127.0.0.1', 0), FakeSmtpHandler)
+        self.lock = threading.Lock()
+        self.jumlah_koneksi = 0
+        self.kotak_masuk: list[str] = []
+        self.ditolak: set[str] = set()  # Alamat yang dijawab 550 saat RCPT
+
+class TestBatchedEmailNotifier(unittest.TestCase):
+
+    def setUp(self):
+        """Arrange: Jalankan fake SMTP server lokal di port acak."""
+        logging.disable(logging.CRITICAL)
+        self.server = FakeSmtpServer()
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.host, self.port = self.server.server_address
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        logging.disable(logging.NOTSET)
+
+    def test_batch_lewat_satu_koneksi(self):
+        """Tes 1: 25 email dikirim dalam 3 batch lewat satu koneksi SMTP."""
+        notifier = BatchedEmailNotifier(self.host, self.port, batch_size=10, flush_interval=5)
+        for i in range(25):
+            notifier.send(Order(f'pelanggan{i}', 1000))
+        notifier.close()
+        self.assertEqual(len(self.server.kotak_masuk), 25)
+        self.assertEqual(notifier.jumlah_batch, 3)
+        self.assertEqual(self.server.jumlah_koneksi, 1)
+
+    def test_flush_berdasarkan_waktu(self):
+        """Tes 2: Batch yang belum penuh tetap terkirim setelah flush_interval."""
+        notifier = BatchedEmailNotifier(self.host, self.port, batch_size=100, flush_interval=0.05)
+        notifier.send(Order('andi', 500000))
+        notifier.flush()
+        self.assertEqual(self.server.kotak_masuk, ['andi@localhost'])
+        notifier.close()
+
+    def test_backpressure_saat_antrian_penuh(self):
+        """Tes 3: send() menunggu lalu gagal dengan queue.Full jika worker tidak sempat mengosongkan antrian."""
+        blokir = threading.Event()
+
+        def smtp_lambat(host, port):
+            blokir.wait()
+            return smtplib.SMTP(host, port)
+
+        notifier = BatchedEmailNotifier(self.host, self.port, batch_size=1, max_queue=2, smtp_factory=smtp_lambat)
+        notifier.send(Order('a', 1))  # diambil worker, tertahan di koneksi
+        notifier.send(Order('b', 1))
+        notifier.send(Order('c', 1))
+        with self.assertRaises(queue.Full):
+            notifier.send(Order('d', 1), timeout=0.05)
+        blokir.set()
+        notifier.close()
+        self.assertEqual(sorted(self.server.kotak_masuk), ['a@localhost', 'b@localhost', 'c@localhost'])
+
+    def test_send_setelah_close(self):
+        """Tes 4: Notifier yang sudah ditutup menolak pesanan baru."""
+        notifier = BatchedEmailNotifier(self.host, self.port)
+        notifier.close()
+        with self.assertRaises(RuntimeError):
+            notifier.send(Order('x', 1))
+
+    def test_pesanan_rusak_tidak_menghentikan_worker(self):
+        """Tes 5: Error tak terduga pada satu pesanan hanya menggagalkan pesanan itu; flush() tidak menggantung."""
+        def alamat(order: Order) -> str:
+            if order.customer_name == 'rusak':
+                raise LookupError('alamat tidak ditemukan')
+            return f'{order.customer_name}@localhost'
+
+        notifier = BatchedEmailNotifier(self.host, self.port, alamat_penerima=alamat, batch_size=10, flush_interval=0.05)
+        for nama in ('a', 'rusak', 'b'):
+            notifier.send(Order(nama, 1))
+        notifier.flush()
+        notifier.send(Order('c', 1))  # Worker masih hidup
+        notifier.close()
+        self.assertEqual(self.server.kotak_masuk, ['a@localhost', 'b@localhost', 'c@localhost'])
+        self.assertEqual([o.customer_name for o in notifier.gagal], ['rusak'])
+
+    def test_penerima_ditolak_hanya_menggagalkan_pesannya(self):
+        """Tes 6: Satu alamat yang ditolak (550) di tengah batch tidak di-retry dan tidak menggagalkan pesan lain."""
+        self.server.ditolak.add('bad@localhost')
+        notifier = BatchedEmailNotifier(self.host, self.port, batch_size=10, flush_interval=5)
+        for nama in ('a', 'bad', 'b', 'c', 'd'):
+            notifier.send(Order(nama, 1))
+        notifier.close()
+        self.assertEqual(self.server.kotak_masuk, ['a@localhost', 'b@localhost', 'c@localhost', 'd@localhost'])
+        self.assertEqual([o.customer_name for o in notifier.gagal], ['bad'])
+        self.assertEqual(self.server.jumlah_koneksi, 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,156 @@
+import logging
+import os
+import pstats
+import tempfile
+import unittest
+from unittest import mock
+import Latihan_mandiri
+import refactor_solid
+from Latihan_mandiri import (
+    Mahasiswa, MahasiswaBatch, RegistrationService, AdaptiveRegistrationService,
+    SksLimitRule, PrerequisiteRule, JadwalBentrokRule, ProfiledRegistrationService
+)
+from jadwal import JadwalIndex, SesiKuliah
+from profiler import Profiler
+from refactor_solid import Order, CheckoutService, IPaymentProcessor, INotificationService
+
+class TestRegistrasiBatch(unittest.TestCase):
+
+    def setUp(self):
+        """Arrange: Siapkan service dengan aturan lengkap dan data campuran."""
+        logging.disable(logging.CRITICAL)
+        jadwal = JadwalIndex([
+            SesiKuliah.dari_jam("A", "Senin", "08:00", "09:40", "R101"),
+            SesiKuliah.dari_jam("B", "Senin", "09:00", "10:40", "R102"),
+        ])
+        self.service = RegistrationService([SksLimitRule(), PrerequisiteRule(), JadwalBentrokRule(jadwal)])
+        self.daftar_mhs = [
+            Mahasiswa("24111", 26, True),             # gagal SKS
+            Mahasiswa("0244", 20, False),             # gagal prasyarat
+            Mahasiswa("1049", 23, True, ["A"]),       # lolos
+            Mahasiswa("24112", 20, True, ["A", "B"]), # gagal jadwal
+        ]
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+
+    def test_batch_sama_dengan_per_baris(self):
+        """Tes 1: Mask register_many identik dengan register_mhs per mahasiswa."""
+        hasil = self.service.register_many(MahasiswaBatch.from_mahasiswa(self.daftar_mhs))
+        self.assertEqual(hasil.diterima, [self.service.register_mhs(m) for m in self.daftar_mhs])
+
+    def test_aturan_pertama_yang_gagal(self):
+        """Tes 2: gagal_oleh mencatat aturan pertama yang menolak setiap baris."""
+        hasil = self.service.register_many(MahasiswaBatch.from_mahasiswa(self.daftar_mhs))
+        self.assertEqual(hasil.gagal_oleh, ["SksLimitRule", "PrerequisiteRule", None, "JadwalBentrokRule"])
+        self.assertEqual(hasil.jumlah_diterima, 1)
+
+    def test_kolom_tidak_sejajar(self):
+        """Tes 3: Kolom dengan panjang berbeda ditolak."""
+        with self.assertRaises(ValueError):
+            MahasiswaBatch(["1", "2"], [20], [True, True])
+
+class TestRegistrasiAdaptif(unittest.TestCase):
+
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+        self.sks = SksLimitRule()
+        self.prasyarat = PrerequisiteRule()
+        # Semua mahasiswa lolos SKS, setengahnya gagal prasyarat
+        self.batch = MahasiswaBatch(
+            [str(i) for i in range(100)], [20] * 100, [i % 2 == 0 for i in range(100)]
+        )
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+
+    def test_statistik_tercatat(self):
+        """Tes 1: Jumlah panggilan dan penolakan per aturan tercatat."""
+        service = AdaptiveRegistrationService([self.sks, self.prasyarat], reorder_interval=10**9)
+        service.register_many(self.batch)
+        stats_sks, stats_prasyarat = service.statistics()
+        self.assertEqual((stats_sks.panggilan, stats_sks.ditolak), (100, 0))
+        self.assertEqual((stats_prasyarat.panggilan, stats_prasyarat.ditolak), (100, 50))
+        self.assertEqual(stats_prasyarat.rejection_rate, 0.5)
+
+    def test_aturan_yang_sering_menolak_dipindah_ke_depan(self):
+        """Tes 2: Setelah reorder, aturan yang menolak berjalan lebih dulu."""
+        service = AdaptiveRegistrationService([self.sks, self.prasyarat], reorder_interval=100)
+        service.register_many(self.batch)
+        self.assertEqual(service.validation_rules, [self.prasyarat, self.sks])
+
+    def test_aturan_pinned_tidak_berpindah(self):
+        """Tes 3: Aturan yang di-pin tetap di posisinya."""
+        service = AdaptiveRegistrationService(
+            [self.sks, self.prasyarat], pinned_rules=[self.sks], reorder_interval=100
+        )
+        service.register_many(self.batch)
+        self.assertEqual(service.validation_rules, [self.sks, self.prasyarat])
+
+    def test_hasil_tetap_sama_setelah_reorder(self):
+        """Tes 4: Penyusunan ulang tidak mengubah mask registrasi."""
+        service = AdaptiveRegistrationService([self.sks, self.prasyarat], reorder_interval=1)
+        hasil_awal = service.register_many(self.batch).diterima
+        self.assertEqual(service.register_many(self.batch).diterima, hasil_awal)
+
+    def test_jalur_per_baris_sama_dengan_batch(self):
+        """Tes 5: register_mhs memakai loop dasar yang sama: hasil dan statistik identik dengan register_many."""
+        per_baris = AdaptiveRegistrationService([self.sks, self.prasyarat], reorder_interval=10**9)
+        batch = AdaptiveRegistrationService([self.sks, self.prasyarat], reorder_interval=10**9)
+        hasil = [per_baris.register_mhs(self.batch.row(i)) for i in range(len(self.batch))]
+        self.assertEqual(hasil, batch.register_many(self.batch).diterima)
+        self.assertEqual(
+            [(st.panggilan, st.ditolak) for st in per_baris.statistics()],
+            [(st.panggilan, st.ditolak) for st in batch.statistics()],
+        )
+
+class TestLogTanpaInstrumentasi(unittest.TestCase):
+    """INSTRUMENTASI=0 hanya mematikan event INFO dan span; WARNING/ERROR tetap tercatat."""
+
+    def test_aturan_gagal_tetap_warning(self):
+        """Tes 1: Penolakan aturan dan registrasi gagal tetap tercatat sebagai WARNING."""
+        service = RegistrationService([SksLimitRule(), PrerequisiteRule()])
+        with mock.patch.object(Latihan_mandiri, "INSTRUMENTASI", False), \
+                self.assertLogs("REGISTRASI", logging.WARNING) as log:
+            self.assertFalse(service.register_mhs(Mahasiswa("24111", 26, True)))
+        self.assertEqual([r.event for r in log.records], ["rule.sks_terlampaui", "registrasi.gagal"])
+
+    def test_pembayaran_gagal_tetap_error(self):
+        """Tes 2: Checkout yang pembayarannya ditolak tetap mencatat ERROR."""
+        class Menolak(IPaymentProcessor):
+            def process(self, order: Order) -> bool:
+                return False
+
+        class Diam(INotificationService):
+            def send(self, order: Order):
+                pass
+
+        with mock.patch.object(refactor_solid, "INSTRUMENTASI", False), \
+                self.assertLogs("Checkout", logging.ERROR) as log:
+            self.assertFalse(CheckoutService(Menolak(), Diam()).run_checkout(Order("Budi", 1000)))
+        self.assertEqual(log.records[0].event, "checkout.gagal")
+
+class TestRegistrasiProfiling(unittest.TestCase):
+
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+
+    def test_registrasi_terekam_hanya_saat_jendela_aktif(self):
+        """Tes: Hasil registrasi tidak berubah, dan register_mhs hanya muncul di laporan saat jendela terbuka."""
+        with tempfile.TemporaryDirectory() as tmp:
+            profiler = Profiler(tmp, durasi=0)
+            service = ProfiledRegistrationService(RegistrationService([SksLimitRule(), PrerequisiteRule()]), profiler)
+            self.assertTrue(service.register_mhs(Mahasiswa("1", 20)))  # Di luar jendela
+            profiler.start()
+            self.assertFalse(service.register_mhs(Mahasiswa("2", 30)))
+            laporan = profiler.stop()
+            self.assertEqual(sorted(os.listdir(tmp)), sorted(os.path.basename(p) for p in laporan.values()))
+            stats = pstats.Stats(laporan["pstats"]).stats
+            panggilan = [nc for (_, _, nama), (_, nc, *_) in stats.items() if nama == "register_mhs"]
+            self.assertEqual(panggilan, [1])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,58 @@
+import logging
+import random
+import unittest
+from jadwal import JadwalIndex, SesiKuliah
+from Latihan_mandiri import (
+    Mahasiswa, MahasiswaBatch, RegistrationService, SksLimitRule, PrerequisiteRule, JadwalBentrokRule
+)
+from registrasi_paralel import ShardedRegistrationService
+
+class TestRegistrasiTershard(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        logging.disable(logging.CRITICAL)
+        jadwal = JadwalIndex([
+            SesiKuliah.dari_jam("A", "Senin", "08:00", "09:40", "R101"),
+            SesiKuliah.dari_jam("B", "Senin", "09:00", "10:40", "R102"),
+            SesiKuliah.dari_jam("C", "Selasa", "13:00", "14:40", "R101"),
+        ])
+        cls.aturan = [SksLimitRule(), PrerequisiteRule(), JadwalBentrokRule(jadwal)]
+        rng = random.Random(1)
+        n = 1_000
+        cls.batch = MahasiswaBatch(
+            [f"{rng.randrange(10**8):08d}" for _ in range(n)],
+            [rng.randint(12, 30) for _ in range(n)],
+            [rng.random() < 0.8 for _ in range(n)],
+            [rng.choice([["A", "C"], ["A", "B"], ["C"], ["X"]]) for _ in range(n)],
+        )
+        cls.service = ShardedRegistrationService(cls.aturan, workers=3, chunk_size=64)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.service.close()
+        logging.disable(logging.NOTSET)
+
+    def test_hasil_identik_dan_berurutan(self):
+        """Tes 1: Hasil dari 3 shard (banyak chunk per shard) sama persis dan berurutan seperti register_many."""
+        acuan = RegistrationService(self.aturan).register_many(self.batch)
+        hasil = self.service.register_many(self.batch)
+        self.assertEqual(hasil, acuan)
+        self.assertEqual(set(hasil.gagal_oleh), {None, "SksLimitRule", "PrerequisiteRule", "JadwalBentrokRule"})
+        # Worker dipakai ulang untuk batch berikutnya
+        self.assertEqual(self.service.register_many(self.batch), acuan)
+
+    def test_rencana_rentang_bersebelahan(self):
+        """Tes 2: Chunk berupa rentang bersebelahan yang menutup semua baris dan dibagi ke semua worker."""
+        rencana = self.service._rencana(len(self.batch))
+        self.assertEqual(rencana[0][1], 0)
+        self.assertEqual(rencana[-1][2], len(self.batch))
+        for (_, _, akhir), (_, awal, _) in zip(rencana, rencana[1:]):
+            self.assertEqual(akhir, awal)
+        self.assertTrue(all(akhir - awal <= 64 for _, awal, akhir in rencana))
+        self.assertEqual({worker for worker, _, _ in rencana}, {0, 1, 2})
+        self.assertFalse(self.service.register_mhs(Mahasiswa("1", 30)))
+        self.assertEqual(self.service.register_many(MahasiswaBatch([], [], [])).diterima, [])
+
+if __name__ == '__main__':
+    unittest.main()
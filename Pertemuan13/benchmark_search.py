@@ -0,0 +1,67 @@
+# Benchmark ProductSearchIndex vs scan linear get_all() pada katalog besar.
+# Cara menjalankan: python benchmark_search.py [jumlah_produk]
+import logging
+import os
+import random
+import statistics
+import sys
+import time
+from itertools import islice
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "bersama"))  # modul bersama: money, wal, metrics, profiler
+from models import Product
+from repositories import ProductRepository
+from search import ProductSearchIndex
+
+MEREK = ["Asus", "Lenovo", "Logitech", "Razer", "Samsung", "Xiaomi", "Philips", "Sony", "Acer", "Rexus"]
+JENIS = ["Laptop", "Mouse", "Keyboard", "Monitor", "Headset", "Kabel", "Charger", "Speaker", "Webcam", "Flashdisk"]
+VARIAN = ["Gaming", "Wireless", "Mech", "Pro", "Mini", "Ultra", "USB-C", "HDMI", "RGB", "Slim"]
+
+class KatalogRepository(ProductRepository):
+    """Repository di memori berisi katalog sintetis."""
+    def __init__(self, n: int, seed: int = 11):
+        rng = random.Random(seed)
+        self._products = {
+            f"P{i:06d}": Product(f"P{i:06d}", f"{rng.choice(JENIS)} {rng.choice(MEREK)} {rng.choice(VARIAN)} {i}", rng.randint(10, 20000) * 1000)
+            for i in range(n)
+        }
+
+def scan_linear(repo: ProductRepository, query: str, limit: int) -> list[Product]:
+    q = query.lower()
+    return list(islice((p for p in repo.get_all() if p.id.lower().startswith(q) or q in p.name.lower()), limit))
+
+def latensi(fungsi, queries: list[str]) -> tuple[float, float]:
+    """Mengembalikan (p50, p99) latensi dalam milidetik."""
+    hasil = []
+    for q in queries:
+        mulai = time.perf_counter()
+        fungsi(q)
+        hasil.append((time.perf_counter() - mulai) * 1000)
+    hasil.sort()
+    return statistics.median(hasil), hasil[int(len(hasil) * 0.99) - 1]
+
+def main(n: int = 500_000):
+    logging.disable(logging.CRITICAL)
+    repo = KatalogRepository(n)
+    mulai = time.perf_counter()
+    index = ProductSearchIndex(repo)
+    print(f"Membangun indeks {n:,} produk: {time.perf_counter() - mulai:.2f} s")
+
+    rng = random.Random(5)
+    skenario = {
+        "prefix ID": [f"P{rng.randrange(n):06d}"[:6] for _ in range(50)],
+        "kata nama": [f"{rng.choice(JENIS)} {rng.choice(MEREK)}" for _ in range(50)],
+        "prefix kata": [rng.choice(MEREK)[:3] for _ in range(50)],
+        "kata langka": [f"{rng.choice(JENIS)} {rng.randrange(n)}" for _ in range(50)],
+    }
+    for nama, queries in skenario.items():
+        p50_idx, p99_idx = latensi(lambda q: index.page(q, 1, 10), queries)
+        p50_scan, p99_scan = latensi(lambda q: scan_linear(repo, q, 10), queries[:10])
+        print(f"{nama:<12} | index p50 {p50_idx:7.3f} ms p99 {p99_idx:7.3f} ms | scan p50 {p50_scan:8.1f} ms p99 {p99_scan:8.1f} ms")
+
+    mulai = time.perf_counter()
+    for i in range(1000):
+        index.upsert(Product(f"N{i:06d}", f"Produk Baru {i}", 1000))
+    print(f"Upsert inkremental: {(time.perf_counter() - mulai) / 1000 * 1e6:.0f} us/produk")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500_000)
@@ -0,0 +1,44 @@
+# Benchmark StripedStockRepository: satu lock global vs lock striping, pada banyak thread kasir.
+# Cara menjalankan: python benchmark_stok.py [jumlah_thread] [operasi_per_thread]
+import random
+import sys
+import threading
+import time
+from stok import StripedStockRepository
+
+JUMLAH_SKU = 10_000
+
+def jalankan(stripes: int, threads: int, per_thread: int, sku_populer: float) -> float:
+    """Mengembalikan transaksi (reserve + commit) per detik."""
+    stok = StripedStockRepository({f"S{i:05d}": 10**9 for i in range(JUMLAH_SKU)}, stripes=stripes)
+    mulai_bersama = threading.Barrier(threads + 1)
+
+    def kasir(seed: int):
+        rng = random.Random(seed)
+        # Sebagian transaksi jatuh ke 10 SKU populer, sisanya tersebar
+        skus = [f"S{rng.randrange(10):05d}" if rng.random() < sku_populer else f"S{rng.randrange(JUMLAH_SKU):05d}"
+                for _ in range(per_thread)]
+        holder = f"kasir-{seed}"
+        mulai_bersama.wait()
+        for sku in skus:
+            stok.reserve(holder, sku, 1)
+            stok.commit(holder, sku, 1)
+
+    pekerja = [threading.Thread(target=kasir, args=(i,)) for i in range(threads)]
+    for t in pekerja:
+        t.start()
+    mulai_bersama.wait()
+    mulai = time.perf_counter()
+    for t in pekerja:
+        t.join()
+    return threads * per_thread / (time.perf_counter() - mulai)
+
+def main(threads: int = 16, per_thread: int = 20_000):
+    print(f"{threads} thread x {per_thread:,} transaksi, {JUMLAH_SKU:,} SKU")
+    for sku_populer in (0.0, 0.5):
+        for stripes in (1, 64):
+            tps = jalankan(stripes, threads, per_thread, sku_populer)
+            print(f"populer {sku_populer:>4.0%} | stripes {stripes:>3} | {tps:12,.0f} transaksi/s")
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:3]))
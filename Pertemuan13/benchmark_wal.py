@@ -0,0 +1,48 @@
+# Benchmark TransactionJournal: fsync per transaksi vs group commit.
+# Cara menjalankan: python benchmark_wal.py [jumlah_kasir] [transaksi_per_kasir] [direktori]
+import logging
+import os
+import sys
+import tempfile
+import threading
+import time
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "bersama"))  # modul bersama: money, wal, metrics, profiler
+from wal import TransactionJournal
+
+def jalankan(folder: str, kasir: int, per_kasir: int, **opsi) -> tuple[float, int]:
+    """Mengembalikan (transaksi per detik, jumlah fsync)."""
+    path = os.path.join(folder, "bench.wal")
+    if os.path.exists(path):
+        os.remove(path)
+    journal = TransactionJournal(path, **opsi)
+    record = {"type": "checkout", "total_sen": 1575000000, "items": [["P001", 1, 1500000000], ["P002", 3, 25000000]]}
+
+    def terminal():
+        for _ in range(per_kasir):
+            journal.append(record)
+
+    threads = [threading.Thread(target=terminal) for _ in range(kasir)]
+    mulai = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    durasi = time.perf_counter() - mulai
+    journal.close()
+    return kasir * per_kasir / durasi, journal.fsync_count
+
+def main(kasir: int = 16, per_kasir: int = 200, folder: str | None = None):
+    logging.disable(logging.CRITICAL)
+    with tempfile.TemporaryDirectory(dir=folder) as tmp:
+        print(f"{kasir} kasir x {per_kasir} transaksi, WAL di {tmp}")
+        for nama, opsi in [
+            ("fsync per transaksi", {"group_commit": False}),
+            ("group commit", {"group_commit": True}),
+            ("group commit + 1 ms", {"group_commit": True, "commit_delay": 0.001}),
+        ]:
+            tps, fsync = jalankan(tmp, kasir, per_kasir, **opsi)
+            print(f"{nama:<22} {tps:10,.0f} transaksi/s | {fsync:6,} fsync")
+
+if __name__ == "__main__":
+    argumen = sys.argv[1:]
+    main(*(int(a) for a in argumen[:2]), *argumen[2:3])
@@ -1,83 +1,318 @@
+import argparse
 import logging
-from repositories import ProductRepository
-from services import IPaymentProcessor, ShoppingCart, CashPayment, DebitCardPayment
-from models import Product # Diperlukan untuk type hint di _handle_add_item
+import os
+import sys
+import time
+import uuid
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "bersama"))  # modul bersama: money, wal, metrics, profiler
+from repositories import IProductRepository, ProductRepository, SqliteProductRepository, CachingProductRepository
+from services import IPaymentProcessor, ShoppingCart, CashPayment, DebitCardPayment, MeteredPaymentProcessor
+from models import Product, CartItem # Diperlukan untuk type hint di _handle_add_item
+from money import Money
+from search import ProductSearchIndex
+from receipts import ReceiptRenderer, ReceiptJournal, BinaryReceiptArchive
+from wal import TransactionJournal
+from stok import IStockRepository, StripedStockRepository
+from resilience import ResilientPaymentProcessor
+from metrics import MeteredCall, MetricsRegistry, REGISTRY
+import profiler as profiling
 
 LOGGER = logging.getLogger('MAIN_APP')
 
+def ringkas_penjualan(records) -> dict:
+    """snapshot_fn untuk TransactionJournal: melipat record checkout (dan snapshot lama) jadi satu ringkasan."""
+    ringkasan = {"type": "snapshot", "transaksi": 0, "total_sen": 0, "qty_per_produk": {}}
+    qty = ringkasan["qty_per_produk"]
+    for r in records:
+        if r["type"] == "snapshot":
+            ringkasan["transaksi"] += r["transaksi"]
+            ringkasan["total_sen"] += r["total_sen"]
+            for product_id, jumlah in r["qty_per_produk"].items():
+                qty[product_id] = qty.get(product_id, 0) + jumlah
+        elif r["type"] == "checkout":
+            ringkasan["transaksi"] += 1
+            ringkasan["total_sen"] += r["total_sen"]
+            for product_id, jumlah, _ in r["items"]:
+                qty[product_id] = qty.get(product_id, 0) + jumlah
+    return ringkasan
+
 class PosApp:
     """Kelas Orchestrator (Aplikasi Utama). Hanya mengkoordinasi flow dan menerapkan DI."""
     def __init__(
         self,
-        repository: ProductRepository,
-        payment_processor: IPaymentProcessor
+        repository: IProductRepository,
+        payment_processor: IPaymentProcessor,
+        search_index: ProductSearchIndex | None = None,
+        receipt_renderer: ReceiptRenderer | None = None,
+        receipt_journal: ReceiptJournal | None = None,
+        receipt_archive: BinaryReceiptArchive | None = None,
+        transaction_journal: TransactionJournal | None = None,
+        stock: IStockRepository | None = None,
+        metrics: MetricsRegistry | None = None,
+        profiler: profiling.Profiler | None = None
     ):
         self.repository = repository
         self.payment_processor = payment_processor
+        self._search_index = search_index
+        self.receipt_renderer = receipt_renderer or ReceiptRenderer()
+        self.receipt_journal = receipt_journal
+        self.receipt_archive = receipt_archive
+        self.transaction_journal = transaction_journal
+        self.profiler = profiler # Handler menu hanya membungkus pekerjaan non-interaktif, bukan input()
+        self.stock = stock
+        self.holder = uuid.uuid4().hex # Pemilik reservasi stok untuk keranjang sesi ini
+        self._meter_checkout = None
+        if metrics is not None:
+            self._meter_checkout = MeteredCall(metrics, "pos_checkout", "Latensi PosApp.checkout.",
+                                               "Jumlah checkout per hasil.")
+        self.transaksi = 0 # Nomor struk terakhir
         self.cart = ShoppingCart()
         LOGGER.info("POS Application Initialized.")
 
+    def _jalankan(self, fungsi, *args):
+        """Menjalankan pekerjaan lewat profiler (jika ada) agar masuk jendela profiling yang aktif."""
+        if self.profiler is None:
+            return fungsi(*args)
+        return self.profiler.jalankan(fungsi, *args)
+
     def _display_menu(self):
+        self._jalankan(self._tampilkan_produk)
+
+    def _tampilkan_produk(self):
         LOGGER.info("\n--- DAFTAR PRODUK ---")
         for p in self.repository.get_all():
             LOGGER.info(f"[{p.id}] {p.name} - Rp{p.price:,.0f}")
 
-    def _handle_add_item(self):
-        product_id = input("Masukkan ID Produk: ").strip().upper()
+    def _cari_produk(self, product_id: str) -> Product | None:
+        """Lookup produk; jika tidak ada, menampilkan saran dari indeks pencarian."""
         product = self.repository.get_by_id(product_id)
-
         if not product:
             LOGGER.warning("Produk tidak ditemukan.")
+            saran = self.search_index.page(product_id, ukuran=5)
+            if saran:
+                LOGGER.info("Mungkin maksud Anda: %s", ", ".join(f"[{p.id}] {p.name}" for p in saran))
+        return product
+
+    def _handle_add_item(self):
+        product_id = input("Masukkan ID Produk: ").strip().upper()
+        if not self._jalankan(self._cari_produk, product_id):
             return
 
         try:
             quantity = int(input("Jumlah (default 1): ") or "1")
             if quantity <= 0: raise ValueError
-            self.cart.add_item(product, quantity)
         except ValueError:
             LOGGER.error("Jumlah tidak valid.")
+            return
+        self._jalankan(self.add_item, product_id, quantity) # Lewat add_item agar stok ikut direservasi
 
-    def _handle_checkout(self):
+    @property
+    def search_index(self) -> ProductSearchIndex:
+        # Indeks dibangun saat pertama kali dipakai jika tidak di-inject
+        if self._search_index is None:
+            self._search_index = ProductSearchIndex(self.repository)
+        return self._search_index
+
+    def _handle_search(self):
+        query = input("Cari (ID atau nama produk): ")
+        nomor = 1
+        while True:
+            hasil = self._jalankan(self.search_index.page, query, nomor, 10)
+            if not hasil:
+                LOGGER.info("Tidak ada hasil." if nomor == 1 else "Tidak ada hasil lagi.")
+                return
+            LOGGER.info("\n--- HASIL PENCARIAN (halaman %d) ---", nomor)
+            for p in hasil:
+                LOGGER.info("[%s] %s - Rp%s", p.id, p.name, f"{p.price:,.0f}")
+            if len(hasil) < 10 or input("Halaman berikutnya? (y/N): ").strip().lower() != "y":
+                return
+            nomor += 1
+
+    def add_item(self, product_id: str, quantity: int = 1) -> bool:
+        """Menambahkan produk ke keranjang tanpa prompt (dipakai mode replay). False jika gagal."""
+        product = self.repository.get_by_id(product_id)
+        if product is None or quantity <= 0:
+            LOGGER.warning("Item ditolak: %s x%d", product_id, quantity)
+            return False
+        if self.stock is not None and not self.stock.reserve(self.holder, product_id, quantity):
+            LOGGER.warning("Stok tidak cukup: %s x%d", product_id, quantity)
+            return False
+        self.cart.add_item(product, quantity)
+        return True
+
+    def remove_item(self, product_id: str) -> bool:
+        """Menghapus satu baris keranjang dan melepas reservasi stoknya."""
+        if not self.cart.remove_item(product_id):
+            return False
+        if self.stock is not None:
+            self.stock.release(self.holder, product_id)
+        return True
+
+    def close(self):
+        """Mengakhiri sesi: reservasi stok untuk isi keranjang dilepas."""
+        if self.stock is not None:
+            for item in self.cart.get_items():
+                self.stock.release(self.holder, item.product.id)
+        self.cart = ShoppingCart()
+
+    def _commit_stock(self) -> list[CartItem] | None:
+        """Mengurangi stok untuk seluruh isi keranjang (semua atau tidak sama sekali)."""
+        terambil = []
+        for item in self.cart.get_items():
+            if not self.stock.commit(self.holder, item.product.id, item.quantity):
+                LOGGER.warning("Stok %s tidak cukup saat checkout.", item.product.id)
+                self._batalkan_commit(terambil)
+                return None
+            terambil.append(item)
+        return terambil
+
+    def _batalkan_commit(self, items: list[CartItem]):
+        """Kompensasi: barang kembali ke stok dan tetap direservasi untuk keranjang ini."""
+        for item in items:
+            self.stock.uncommit(self.holder, item.product.id, item.quantity)
+
+    def checkout(self) -> bool:
+        """Membayar isi keranjang tanpa prompt. False jika keranjang kosong atau pembayaran gagal."""
+        if self._meter_checkout is None:
+            return self._checkout()
+        return self._meter_checkout(self._checkout)
+
+    def _checkout(self) -> bool:
         total = self.cart.total_price
-        if total == 0:
+        if not total:
             LOGGER.warning("Keranjang kosong.")
-            return
+            return False
 
-        LOGGER.info(f"\nTotal Belanja: Rp{total:,.0f}")
+        if LOGGER.isEnabledFor(logging.INFO):
+            LOGGER.info(f"\nTotal Belanja: Rp{total:,.0f}")
 
-        success = self.payment_processor.process(total)
+        terambil = None
+        if self.stock is not None:
+            terambil = self._commit_stock()
+            if terambil is None:
+                return False
+
+        try:
+            success = self.payment_processor.process(total)
+        except BaseException:
+            if terambil:
+                self._batalkan_commit(terambil)  # Pembayaran tidak pasti: stok kembali ke keranjang ini
+            raise
 
         if success:
             LOGGER.info("TRANSAKSI BERHASIL.")
-            self._print_receipt()
+            self.transaksi += 1
+            if self.transaction_journal is not None:
+                # Write-ahead: penjualan tercatat durable sebelum struk dicetak dan keranjang direset
+                self.transaction_journal.append({
+                    "type": "checkout",
+                    "nomor": self.transaksi,
+                    "waktu": time.time(),
+                    "total_sen": total.sen,
+                    "items": [[i.product.id, i.quantity, i.product.price.sen] for i in self.cart.get_items()],
+                })
+            self._print_receipt(total)
             self.cart = ShoppingCart() # Reset cart
-        else:
-            LOGGER.error("TRANSAKSI GAGAL.")
+            return True
+        LOGGER.error("TRANSAKSI GAGAL.")
+        if terambil:
+            # Keranjang tetap utuh, jadi reservasinya juga dipulihkan untuk checkout ulang
+            self._batalkan_commit(terambil)
+        return False
 
-    def _print_receipt(self):
-        LOGGER.info("\n--- STRUK PEMBELIAN ---")
-        for item in self.cart.get_items():
-            LOGGER.info(f" {item.product.name} x{item.quantity} = Rp{item.subtotal:,.0f}")
-        LOGGER.info("-----------------------")
-        LOGGER.info(f"TOTAL AKHIR: Rp{self.cart.total_price:,.0f}")
-        LOGGER.info("-----------------------")
+    def _handle_checkout(self):
+        self._jalankan(self.checkout)
+
+    def _print_receipt(self, total: Money):
+        """Merender struk sekali (satu buffer) lalu mengirimnya ke log, jurnal, dan arsip."""
+        tampil = LOGGER.isEnabledFor(logging.INFO)
+        waktu = time.time()
+        if tampil or self.receipt_journal is not None:
+            teks = self.receipt_renderer.render(self.cart.get_items(), total, self.transaksi, waktu)
+            if tampil:
+                LOGGER.info("%s", teks.rstrip("\n"))
+            if self.receipt_journal is not None:
+                self.receipt_journal.write(teks)
+        if self.receipt_archive is not None:
+            self.receipt_archive.write(self.cart.get_items(), total, self.transaksi, waktu)
 
 # --- TITIK MASUK UTAMA (Orchestration) ---
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Aplikasi POS sederhana.")
+    parser.add_argument("--db", help="Path database SQLite produk (default: data simulasi di memori).")
+    parser.add_argument("--import-csv", help="Impor produk dari CSV (id,name,price) ke --db sebelum mulai.")
+    parser.add_argument("--cache-size", type=int, default=1024, help="Ukuran cache produk (0 = tanpa cache).")
+    parser.add_argument("--stock-per-product", type=int,
+                        help="Lacak stok dengan N unit awal per produk (default: stok tidak dilacak).")
+    parser.add_argument("--receipt-journal", help="File jurnal struk (teks, dirotasi per ukuran).")
+    parser.add_argument("--receipt-max-bytes", type=int, default=10 * 1024 * 1024, help="Ukuran maksimum jurnal sebelum dirotasi.")
+    parser.add_argument("--receipt-archive", help="File arsip struk biner.")
+    parser.add_argument("--wal", help="File write-ahead log transaksi (dipulihkan saat start).")
+    parser.add_argument("--wal-compact-bytes", type=int, default=64 * 1024 * 1024, help="Ukuran WAL sebelum diringkas.")
+    parser.add_argument("--metrics-port", type=int, help="Sajikan metrik Prometheus di http://127.0.0.1:PORT/metrics.")
+    parser.add_argument("--metrics-file", help="Tulis metrik Prometheus ke file ini saat keluar.")
+    parser.add_argument("--payment-timeout", type=float, default=30.0, help="Batas waktu satu percobaan pembayaran (detik).")
+    parser.add_argument("--payment-retries", type=int, default=2, help="Retry pembayaran saat koneksi terminal terputus.")
+    parser.add_argument("--payment-fallback", choices=("none", "cash"), default="none",
+                        help="Prosesor cadangan saat terminal gagal/circuit breaker terbuka.")
+    parser.add_argument("--payment-fallback-on-timeout", action="store_true",
+                        help="Tetap pakai fallback setelah terminal timeout (RISIKO tagihan ganda jika terminal ternyata menyetujui).")
+    parser.add_argument("--hedge-after", type=float,
+                        help="Jalankan fallback paralel jika terminal belum menjawab setelah N detik "
+                             "(RISIKO tagihan ganda; jawaban terminal yang terlambat dicatat untuk rekonsiliasi).")
+    profiling.tambah_argumen(parser)
+    args = parser.parse_args()
+    if args.import_csv and not args.db:
+        parser.error("--import-csv membutuhkan --db (data simulasi di memori tidak bisa diimpor).")
+
     # Setup Logging awal
     logging.basicConfig(level=logging.INFO, format='%(name)s - %(levelname)s - %(message)s')
 
     # 1. Instantiate Lapisan Data
-    repo = ProductRepository()
+    if args.db:
+        repo = SqliteProductRepository(args.db)
+        if args.import_csv:
+            repo.import_csv(args.import_csv)
+    else:
+        repo = ProductRepository()
+    if args.cache_size > 0:
+        repo = CachingProductRepository(repo, max_size=args.cache_size)
+    stock = None
+    if args.stock_per_product is not None:
+        stock = StripedStockRepository({p.id: args.stock_per_product for p in repo.get_all()})
 
     # 2. Instantiate Service (Implementasi Konkret)
     # payment_method = CashPayment()
 
     # Menggunakan DebitCardPayment sebagai metode pembayaran, perintah dari Latihan Mandiri
     payment_method = DebitCardPayment()
+    metrik_aktif = args.metrics_port is not None or args.metrics_file is not None
+    if metrik_aktif:
+        payment_method = MeteredPaymentProcessor(payment_method)
+        if args.metrics_port is not None:
+            REGISTRY.serve_http(args.metrics_port)
+            LOGGER.info("Metrik tersedia di http://127.0.0.1:%d/metrics", args.metrics_port)
+    # Terminal yang menggantung tidak boleh memblokir kasir: batas waktu, circuit breaker, retry, fallback
+    payment_method = ResilientPaymentProcessor(
+        payment_method, timeout=args.payment_timeout, retries=args.payment_retries,
+        fallback=CashPayment() if args.payment_fallback == "cash" else None, hedge_after=args.hedge_after,
+        fallback_on_timeout=args.payment_fallback_on_timeout)
 
     # 3. Inject Dependencies ke Aplikasi Utama
-    app = PosApp(repository=repo, payment_processor=payment_method)
+    journal = ReceiptJournal(args.receipt_journal, args.receipt_max_bytes) if args.receipt_journal else None
+    archive = BinaryReceiptArchive(args.receipt_archive) if args.receipt_archive else None
+    wal = None
+    if args.wal:
+        wal = TransactionJournal(args.wal, snapshot_fn=ringkas_penjualan, compact_bytes=args.wal_compact_bytes)
+        ringkasan = ringkas_penjualan(payload for _, payload in TransactionJournal.replay(args.wal))
+        LOGGER.info("WAL: %d transaksi tercatat, total Rp%s", ringkasan["transaksi"],
+                    f"{Money(ringkasan['total_sen']):,.0f}")
+    # Profiler hanya membungkus pekerjaan di dalam handler, bukan prompt input() yang menunggu kasir
+    profiler = profiling.dari_argumen(args)
+    app = PosApp(repository=repo, payment_processor=payment_method,
+                 receipt_journal=journal, receipt_archive=archive, transaction_journal=wal,
+                 stock=stock, metrics=REGISTRY if metrik_aktif else None, profiler=profiler)
+    handlers = {"1": app._display_menu, "2": app._handle_add_item, "3": app._handle_checkout, "4": app._handle_search}
 
     # Tambahkan loop CLI sederhana untuk interaksi
     while True:
@@ -85,16 +320,24 @@ if __name__ == "__main__":
         print("1. Tampilkan Produk")
         print("2. Tambah ke Keranjang")
         print("3. Checkout")
-        print("4. Keluar")
-        choice = input("Pilih opsi (1-4): ")
-
-        if choice == "1":
-            app._display_menu()
-        elif choice == "2":
-            app._handle_add_item()
-        elif choice == "3":
-            app._handle_checkout()
-        elif choice == "4":
+        print("4. Cari Produk")
+        print("5. Keluar")
+        choice = input("Pilih opsi (1-5): ")
+
+        if choice in handlers:
+            handlers[choice]()
+        elif choice == "5":
+            if isinstance(repo, CachingProductRepository):
+                LOGGER.info("Statistik cache produk: %s", repo.stats())
+            app.close()  # Reservasi stok keranjang yang belum dibayar dilepas
+            if args.metrics_file:
+                REGISTRY.write_file(args.metrics_file)
+            for berkas in (journal, archive, wal):
+                if berkas is not None:
+                    berkas.close()
+            if profiler is not None:
+                profiler.stop()
+            payment_method.close()
             LOGGER.info("Aplikasi dihentikan.")
             break
         else:
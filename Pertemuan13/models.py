@@ -1,18 +1,24 @@
 from dataclasses import dataclass
 from typing import List
+from money import Money
 
 @dataclass
 class Product:
     id: str
     name: str
-    price: float
+    price: Money
 
-@dataclass
+    def __post_init__(self):
+        # Harga boleh diberikan sebagai angka Rupiah (int/float/str); disimpan sebagai Money eksak
+        if not isinstance(self.price, Money):
+            self.price = Money.of(self.price)
+
+@dataclass(slots=True)
 class CartItem:
     product: Product
     quantity: int
 
     @property
-    def subtotal(self) -> float:
+    def subtotal(self) -> Money:
         """Menghitung subtotal untuk item ini."""
-        return self.product.price * self.quantity
\ No newline at end of file
+        return self.product.price * self.quantity
@@ -0,0 +1,192 @@
+# Mode server: banyak terminal kasir berbagi satu repository dan satu payment processor,
+# masing-masing dengan keranjang (PosApp) sendiri. Protokol berbasis baris (UTF-8):
+#   ADD <id> [qty]    -> OK <total>          | ERR ...
+#   REMOVE <id>       -> OK <total>          | ERR ...
+#   TOTAL             -> OK <total>
+#   LIST              -> OK <id>x<qty>,...
+#   CHECKOUT          -> OK PAID <total>     | ERR ...
+#   QUIT              -> OK BYE (koneksi ditutup)
+# Cara menjalankan: python pos_server.py [--port 8765 | --unix /tmp/pos.sock] [--db produk.db]
+# Contoh klien lokal: nc localhost 8765
+from concurrent.futures import ThreadPoolExecutor
+import argparse
+import asyncio
+import itertools
+import logging
+import os
+import sys
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "bersama"))  # modul bersama: money, wal, metrics, profiler
+from main_app import PosApp
+from repositories import IProductRepository, ProductRepository, SqliteProductRepository, CachingProductRepository
+from services import IPaymentProcessor, DebitCardPayment
+from resilience import ResilientPaymentProcessor
+from stok import IStockRepository, StripedStockRepository
+
+LOGGER = logging.getLogger('POS_SERVER')
+
+class PosServer:
+    """
+    Server asyncio: satu sesi (PosApp dengan ShoppingCart sendiri) per koneksi.
+    Repository dan payment processor dipakai bersama. I/O jaringan ditangani event loop,
+    sedangkan setiap perintah (lookup repository, reservasi stok, pembayaran, jurnal) dijalankan
+    di thread pool berukuran `workers`, sehingga terminal pembayaran yang lambat hanya menahan
+    sesinya sendiri. Perintah satu sesi tetap berurutan, jadi PosApp tidak diakses bersamaan.
+    Sesi yang tidak mengirim perintah selama `idle_timeout` detik ditutup (keranjangnya dibuang).
+    """
+    def __init__(
+        self,
+        repository: IProductRepository,
+        payment_processor: IPaymentProcessor,
+        idle_timeout: float = 300.0,
+        max_line: int = 1024,
+        stock: IStockRepository | None = None,
+        workers: int = 32,
+    ):
+        self.repository = repository
+        self.payment_processor = payment_processor
+        self.stock = stock
+        self.idle_timeout = idle_timeout
+        self.max_line = max_line
+        self.sessions: dict[int, PosApp] = {}
+        self.evicted = 0
+        self._ids = itertools.count(1)
+        self._server: asyncio.AbstractServer | None = None
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="pos-session")
+
+    # --- Siklus hidup ---
+    async def start(self, host: str = "127.0.0.1", port: int = 8765, unix_path: str | None = None):
+        if unix_path:
+            self._server = await asyncio.start_unix_server(self._handle, path=unix_path, limit=self.max_line)
+        else:
+            self._server = await asyncio.start_server(self._handle, host, port, limit=self.max_line, backlog=1024)
+        LOGGER.info("POS server mendengarkan di %s", ", ".join(str(s.getsockname()) for s in self._server.sockets))
+        return self._server
+
+    @property
+    def port(self) -> int:
+        return self._server.sockets[0].getsockname()[1]
+
+    async def close(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    # --- Sesi ---
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        session_id = next(self._ids)
+        app = PosApp(repository=self.repository, payment_processor=self.payment_processor, stock=self.stock)
+        self.sessions[session_id] = app
+        LOGGER.info("Sesi %d dibuka (%d aktif).", session_id, len(self.sessions))
+        loop = asyncio.get_running_loop()
+        try:
+            writer.write(f"OK SESSION {session_id}\n".encode())
+            while True:
+                try:
+                    baris = await asyncio.wait_for(reader.readline(), self.idle_timeout)
+                except asyncio.TimeoutError:
+                    self.evicted += 1
+                    LOGGER.info("Sesi %d idle > %.0f s, ditutup.", session_id, self.idle_timeout)
+                    writer.write(b"ERR IDLE\n")
+                    break
+                except (ValueError, asyncio.LimitOverrunError):
+                    writer.write(b"ERR LINE TOO LONG\n")
+                    break
+                if not baris:
+                    break  # Klien menutup koneksi
+                balasan, lanjut = await loop.run_in_executor(self._executor, self.execute, app,
+                                                             baris.decode("utf-8", "replace"))
+                writer.write(balasan.encode() + b"\n")
+                if not lanjut:
+                    break
+                # Backpressure: drain() hanya menunggu jika buffer tulis melewati batasnya
+                await writer.drain()
+            await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            app.close()  # Reservasi stok keranjang yang ditinggal langsung dilepas
+            self.sessions.pop(session_id, None)
+            writer.close()
+            LOGGER.info("Sesi %d ditutup (%d aktif).", session_id, len(self.sessions))
+
+    def execute(self, app: PosApp, baris: str) -> tuple[str, bool]:
+        """Menjalankan satu perintah untuk satu sesi. Mengembalikan (balasan, koneksi_lanjut)."""
+        bagian = baris.split()
+        if not bagian:
+            return "ERR EMPTY", True
+        perintah, argumen = bagian[0].upper(), bagian[1:]
+        cart = app.cart
+
+        if perintah == "ADD" and 1 <= len(argumen) <= 2:
+            try:
+                quantity = int(argumen[1]) if len(argumen) == 2 else 1
+            except ValueError:
+                return "ERR BAD QUANTITY", True
+            product_id = argumen[0].upper()
+            if quantity <= 0:
+                return "ERR BAD QUANTITY", True
+            if not app.add_item(product_id, quantity):
+                if app.repository.get_by_id(product_id) is None:
+                    return "ERR NOT FOUND", True
+                return "ERR OUT OF STOCK", True
+            return f"OK {cart.total_price.sen}", True
+        if perintah == "REMOVE" and len(argumen) == 1:
+            if not app.remove_item(argumen[0].upper()):
+                return "ERR NOT IN CART", True
+            return f"OK {cart.total_price.sen}", True
+        if perintah == "TOTAL" and not argumen:
+            return f"OK {cart.total_price.sen}", True
+        if perintah == "LIST" and not argumen:
+            return "OK " + ",".join(f"{i.product.id}x{i.quantity}" for i in cart.get_items()), True
+        if perintah == "CHECKOUT" and not argumen:
+            total = cart.total_price
+            if not total:
+                return "ERR EMPTY CART", True
+            if not app.checkout():
+                return "ERR CHECKOUT FAILED", True
+            return f"OK PAID {total.sen}", True
+        if perintah == "QUIT":
+            return "OK BYE", False
+        return f"ERR UNKNOWN {perintah}", True
+
+# --- TITIK MASUK SERVER ---
+async def main(args):
+    repo = SqliteProductRepository(args.db) if args.db else ProductRepository()
+    if args.cache_size > 0:
+        repo = CachingProductRepository(repo, max_size=args.cache_size)
+    stock = None
+    if args.stock_per_product is not None:
+        # Satu repository stok dipakai bersama semua sesi: reservasi mencegah dua terminal menjual unit yang sama
+        stock = StripedStockRepository({p.id: args.stock_per_product for p in repo.get_all()})
+    # Sama seperti main_app: terminal yang menggantung dibatasi timeout dan circuit breaker
+    payment = ResilientPaymentProcessor(DebitCardPayment(), timeout=args.payment_timeout)
+    server = PosServer(repo, payment, idle_timeout=args.idle_timeout, stock=stock, workers=args.workers)
+    srv = await server.start(args.host, args.port, args.unix)
+    try:
+        async with srv:
+            await srv.serve_forever()
+    finally:
+        await server.close()
+        payment.close()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Server POS multi-terminal (protokol baris).")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--unix", help="Path Unix socket (menggantikan --host/--port).")
+    parser.add_argument("--db", help="Path database SQLite produk (default: data simulasi di memori).")
+    parser.add_argument("--cache-size", type=int, default=1024, help="Ukuran cache produk (0 = tanpa cache).")
+    parser.add_argument("--idle-timeout", type=float, default=300.0, help="Detik sebelum sesi idle ditutup.")
+    parser.add_argument("--stock-per-product", type=int,
+                        help="Lacak stok dengan N unit awal per produk (default: stok tidak dilacak).")
+    parser.add_argument("--workers", type=int, default=32, help="Thread untuk menjalankan perintah sesi.")
+    parser.add_argument("--payment-timeout", type=float, default=30.0, help="Batas waktu satu percobaan pembayaran (detik).")
+    args = parser.parse_args()
+
+    # WARNING secara default: log per perintah terlalu mahal untuk ratusan sesi
+    logging.basicConfig(level=logging.WARNING, format='%(name)s - %(levelname)s - %(message)s')
+    try:
+        asyncio.run(main(args))
+    except KeyboardInterrupt:
+        LOGGER.warning("Server dihentikan.")
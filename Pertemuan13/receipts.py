@@ -0,0 +1,153 @@
+from dataclasses import dataclass
+from typing import BinaryIO, Iterable, Iterator
+import io
+import logging
+import os
+import struct
+import threading
+import time
+from models import CartItem
+from money import Money
+
+LOGGER = logging.getLogger('RECEIPTS')
+
+# --- TEMPLATE & RENDERER ---
+@dataclass(frozen=True)
+class ReceiptTemplate:
+    """
+    Template struk (format str.format). Placeholder yang tersedia:
+    header/footer: {nomor}, {waktu}, {total}; baris: {nama}, {id}, {qty}, {harga}, {subtotal}.
+    Nilai uang berupa Money, sehingga bisa diformat seperti angka (misalnya {total:,.0f}).
+    """
+    header: str = "\n--- STRUK PEMBELIAN ---\n"
+    baris: str = " {nama} x{qty} = Rp{subtotal:,.0f}\n"
+    footer: str = "-----------------------\nTOTAL AKHIR: Rp{total:,.0f}\n-----------------------\n"
+
+class ReceiptRenderer:
+    """Merender satu struk utuh ke satu buffer string (bukan satu log per baris item)."""
+    def __init__(self, template: ReceiptTemplate | None = None):
+        self.template = template or ReceiptTemplate()
+
+    def render(self, items: Iterable[CartItem], total: Money, nomor: int = 0, waktu: float | None = None) -> str:
+        t = self.template
+        waktu_str = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(waktu if waktu is not None else time.time()))
+        buffer = io.StringIO()
+        buffer.write(t.header.format(nomor=nomor, waktu=waktu_str, total=total))
+        format_baris = t.baris.format
+        for item in items:
+            harga = item.product.price
+            buffer.write(format_baris(nama=item.product.name, id=item.product.id, qty=item.quantity,
+                                      harga=harga, subtotal=harga * item.quantity))
+        buffer.write(t.footer.format(nomor=nomor, waktu=waktu_str, total=total))
+        return buffer.getvalue()
+
+# --- JURNAL TEKS BERROTASI ---
+class ReceiptJournal:
+    """
+    Jurnal struk berbasis file dengan rotasi ukuran (struk.log -> struk.log.1 -> ... ).
+    Setiap struk ditulis dengan satu write() lalu di-flush, sehingga struk tidak pernah
+    terpotong atau bercampur dengan struk lain. Aman dipakai dari banyak thread.
+    """
+    def __init__(self, path: str, max_bytes: int = 10 * 1024 * 1024, backup_count: int = 5):
+        if max_bytes <= 0:
+            raise ValueError("max_bytes harus lebih dari 0.")
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self._lock = threading.Lock()
+        self._file: BinaryIO = open(path, "ab")
+        self._size = self._file.tell()
+
+    def write(self, teks: str):
+        data = teks.encode("utf-8")
+        with self._lock:
+            if self._size and self._size + len(data) > self.max_bytes:
+                self._rotate()
+            self._file.write(data)
+            self._file.flush()
+            self._size += len(data)
+
+    def _rotate(self):
+        self._file.close()
+        if self.backup_count > 0:
+            for i in range(self.backup_count - 1, 0, -1):
+                sumber = f"{self.path}.{i}"
+                if os.path.exists(sumber):
+                    os.replace(sumber, f"{self.path}.{i + 1}")
+            os.replace(self.path, f"{self.path}.1")
+        else:
+            os.remove(self.path)
+        self._file = open(self.path, "ab")
+        self._size = 0
+        LOGGER.info("Jurnal struk dirotasi: %s", self.path)
+
+    def close(self):
+        with self._lock:
+            self._file.close()
+
+# --- ARSIP BINER ---
+# Record: panjang (I) | header | item...
+#   header: magic b"RC", versi (B), nomor (Q), waktu ms (q), total sen (q), jumlah item (H)
+#   item  : qty (I), harga sen (q), panjang id (B), id (utf-8)
+_PANJANG = struct.Struct("<I")
+_HEADER = struct.Struct("<2sBQqqH")
+_ITEM = struct.Struct("<IqB")
+_MAGIC, _VERSI = b"RC", 1
+
+@dataclass(frozen=True)
+class BinaryReceipt:
+    nomor: int
+    waktu: float
+    total: Money
+    items: tuple[tuple[str, int, Money], ...]  # (product_id, quantity, harga satuan)
+
+def encode_receipt(items: Iterable[CartItem], total: Money, nomor: int = 0, waktu: float | None = None) -> bytes:
+    """Struk ringkas untuk arsip: hanya ID produk, kuantitas, dan harga dalam sen."""
+    bagian = []
+    jumlah = 0
+    for item in items:
+        id_bytes = item.product.id.encode("utf-8")
+        bagian.append(_ITEM.pack(item.quantity, item.product.price.sen, len(id_bytes)) + id_bytes)
+        jumlah += 1
+    waktu_ms = int((waktu if waktu is not None else time.time()) * 1000)
+    return _HEADER.pack(_MAGIC, _VERSI, nomor, waktu_ms, total.sen, jumlah) + b"".join(bagian)
+
+def decode_receipt(data: bytes) -> BinaryReceipt:
+    magic, versi, nomor, waktu_ms, total_sen, jumlah = _HEADER.unpack_from(data, 0)
+    if magic != _MAGIC or versi != _VERSI:
+        raise ValueError("Bukan struk biner yang dikenal.")
+    posisi = _HEADER.size
+    items = []
+    for _ in range(jumlah):
+        qty, harga_sen, panjang_id = _ITEM.unpack_from(data, posisi)
+        posisi += _ITEM.size
+        items.append((data[posisi:posisi + panjang_id].decode("utf-8"), qty, Money(harga_sen)))
+        posisi += panjang_id
+    return BinaryReceipt(nomor, waktu_ms / 1000, Money(total_sen), tuple(items))
+
+class BinaryReceiptArchive:
+    """File arsip struk biner (record dengan prefix panjang), satu write() per struk."""
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._file: BinaryIO = open(path, "ab")
+
+    def write(self, items: Iterable[CartItem], total: Money, nomor: int = 0, waktu: float | None = None):
+        data = encode_receipt(items, total, nomor, waktu)
+        with self._lock:
+            self._file.write(_PANJANG.pack(len(data)) + data)
+            self._file.flush()
+
+    def close(self):
+        with self._lock:
+            self._file.close()
+
+    @staticmethod
+    def read(path: str) -> Iterator[BinaryReceipt]:
+        with open(path, "rb") as f:
+            while True:
+                prefix = f.read(_PANJANG.size)
+                if len(prefix) < _PANJANG.size:
+                    return
+                (panjang,) = _PANJANG.unpack(prefix)
+                yield decode_receipt(f.read(panjang))
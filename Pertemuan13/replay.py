@@ -0,0 +1,215 @@
+# Mode headless: memutar ulang log transaksi (JSONL/CSV) lewat PosApp tanpa input().
+# Format event (satu per baris/record):
+#   JSONL: {"event": "add", "product_id": "P001", "quantity": 2}  /  {"event": "checkout"}
+#   CSV  : header event,product_id,quantity
+# Cara menjalankan: python replay.py hari1.jsonl hari2.csv [--workers 4] [--db produk.db]
+import argparse
+import csv
+import json
+import logging
+import os
+import random
+import sys
+import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Iterable, Iterator
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "bersama"))  # modul bersama: money, wal, metrics, profiler
+from main_app import PosApp
+from repositories import IProductRepository, ProductRepository, SqliteProductRepository, CachingProductRepository
+from services import IPaymentProcessor, CashPayment
+
+LOGGER = logging.getLogger('REPLAY')
+
+# --- MEMBACA LOG ---
+def baca_log(path: str) -> Iterator[dict | None]:
+    """
+    Membaca event secara streaming (tidak dimuat sekaligus ke memori).
+    Baris JSONL yang rusak (misalnya terpotong) dilaporkan sebagai WARNING lalu diteruskan
+    sebagai None, sehingga replay() menghitungnya sebagai event yang dilewati.
+    """
+    with open(path, newline="", encoding="utf-8") as f:
+        if path.lower().endswith(".csv"):
+            yield from csv.DictReader(f)
+        else:
+            for nomor, baris in enumerate(f, 1):
+                if baris.strip():
+                    try:
+                        yield json.loads(baris)
+                    except json.JSONDecodeError as e:
+                        LOGGER.warning("Baris %d di %s bukan JSON valid: %s", nomor, path, e)
+                        yield None
+
+def tulis_log_sintetis(path: str, transaksi: int, product_ids: list[str], seed: int = 1):
+    """Membuat log transaksi acak (1-5 item per transaksi) untuk load test."""
+    rng = random.Random(seed)
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        if path.lower().endswith(".csv"):
+            writer = csv.writer(f)
+            writer.writerow(["event", "product_id", "quantity"])
+            for _ in range(transaksi):
+                for _ in range(rng.randint(1, 5)):
+                    writer.writerow(["add", rng.choice(product_ids), rng.randint(1, 3)])
+                writer.writerow(["checkout", "", ""])
+        else:
+            for _ in range(transaksi):
+                for _ in range(rng.randint(1, 5)):
+                    f.write(json.dumps({"event": "add", "product_id": rng.choice(product_ids),
+                                        "quantity": rng.randint(1, 3)}) + "\n")
+                f.write('{"event": "checkout"}\n')
+
+# --- HASIL ---
+@dataclass
+class ReplayResult:
+    """Ringkasan satu (atau gabungan beberapa) replay. Latensi per transaksi dalam nanodetik."""
+    sumber: str
+    events: int = 0
+    sukses: int = 0
+    gagal: int = 0
+    dilewati: int = 0  # Event rusak atau tidak dikenal
+    durasi: float = 0.0
+    latensi_ns: array = field(default_factory=lambda: array('q'))
+
+    @property
+    def transaksi(self) -> int:
+        return self.sukses + self.gagal
+
+    @property
+    def tps(self) -> float:
+        return self.transaksi / self.durasi if self.durasi else 0.0
+
+    def persentil(self, p: float) -> float:
+        """Persentil latensi (nearest-rank) dalam milidetik."""
+        if not self.latensi_ns:
+            return 0.0
+        urut = sorted(self.latensi_ns)
+        indeks = max(0, min(len(urut) - 1, -(-len(urut) * p // 100) - 1))
+        return urut[int(indeks)] / 1e6
+
+    @classmethod
+    def gabung(cls, hasil: Iterable["ReplayResult"], durasi: float) -> "ReplayResult":
+        """Menggabungkan hasil dari beberapa worker; durasi = waktu dinding keseluruhan."""
+        total = cls("total", durasi=durasi)
+        for h in hasil:
+            total.events += h.events
+            total.sukses += h.sukses
+            total.gagal += h.gagal
+            total.dilewati += h.dilewati
+            total.latensi_ns.extend(h.latensi_ns)
+        return total
+
+    def ringkasan(self) -> str:
+        return (f"{self.sumber}: {self.events:,} event, {self.transaksi:,} transaksi "
+                f"({self.gagal:,} gagal, {self.dilewati:,} event dilewati) dalam {self.durasi:.2f} s -> {self.tps:,.0f} TPS | "
+                f"latensi p50 {self.persentil(50):.3f} ms, p95 {self.persentil(95):.3f} ms, "
+                f"p99 {self.persentil(99):.3f} ms")
+
+# --- REPLAY ---
+def replay(app: PosApp, events: Iterable[dict | None], sumber: str = "log") -> ReplayResult:
+    """
+    Memutar event ke PosApp. Satu transaksi = event add sejak checkout sebelumnya sampai
+    checkout berikutnya; latensinya diukur dari event pertama sampai checkout selesai.
+    Event yang rusak (bukan objek, product_id hilang, quantity bukan bilangan bulat) atau tidak
+    dikenal dilewati dengan WARNING dan dihitung di `dilewati`; replay tetap berlanjut.
+    """
+    hasil = ReplayResult(sumber)
+    latensi = hasil.latensi_ns
+    clock = time.perf_counter_ns
+    mulai_transaksi = None
+    mulai = time.perf_counter()
+    for e in events:
+        hasil.events += 1
+        if not isinstance(e, dict):
+            if e is not None:  # None: baris rusak yang sudah dilaporkan baca_log
+                LOGGER.warning("Event bukan objek di %s (event ke-%d): %r", sumber, hasil.events, e)
+            hasil.dilewati += 1
+            continue
+        sekarang = clock()
+        if mulai_transaksi is None:
+            mulai_transaksi = sekarang
+        jenis = e.get("event")
+        if jenis == "add":
+            try:
+                product_id, quantity = e["product_id"], int(e.get("quantity") or 1)
+            except (KeyError, ValueError, TypeError) as err:
+                LOGGER.warning("Event add rusak di %s (event ke-%d): %r (%s)", sumber, hasil.events, e, err)
+                hasil.dilewati += 1
+                continue
+            app.add_item(product_id, quantity)
+        elif jenis == "checkout":
+            if app.checkout():
+                hasil.sukses += 1
+            else:
+                hasil.gagal += 1
+            latensi.append(clock() - mulai_transaksi)
+            mulai_transaksi = None
+        else:
+            LOGGER.warning("Event tidak dikenal di %s: %r", sumber, jenis)
+            hasil.dilewati += 1
+    hasil.durasi = time.perf_counter() - mulai
+    return hasil
+
+def buat_repository(db: str | None = None, cache_size: int = 1024) -> IProductRepository:
+    repo = SqliteProductRepository(db) if db else ProductRepository()
+    if cache_size > 0:
+        repo = CachingProductRepository(repo, max_size=cache_size)
+    return repo
+
+def replay_file(path: str, db: str | None = None, cache_size: int = 1024,
+                payment_processor: IPaymentProcessor | None = None) -> ReplayResult:
+    """Replay satu file dengan PosApp baru (repository dan keranjang sendiri)."""
+    repo = buat_repository(db, cache_size)
+    try:
+        app = PosApp(repository=repo, payment_processor=payment_processor or CashPayment())
+        return replay(app, baca_log(path), sumber=os.path.basename(path))
+    finally:
+        close = getattr(repo, "close", None)
+        if close:
+            close()
+
+def _inisialisasi_worker(level: int):
+    logging.basicConfig(level=level)
+    logging.getLogger().setLevel(level)
+
+def replay_files(paths: list[str], workers: int = 1, db: str | None = None,
+                 cache_size: int = 1024, log_level: int = logging.WARNING) -> tuple[list[ReplayResult], ReplayResult]:
+    """
+    Replay banyak file, masing-masing di proses worker terpisah jika workers > 1.
+    Mengembalikan (hasil per file, hasil gabungan).
+    """
+    mulai = time.perf_counter()
+    if workers <= 1 or len(paths) <= 1:
+        hasil = [replay_file(p, db, cache_size) for p in paths]
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(paths)), initializer=_inisialisasi_worker,
+                                 initargs=(log_level,)) as pool:
+            hasil = list(pool.map(replay_file, paths, [db] * len(paths), [cache_size] * len(paths)))
+    return hasil, ReplayResult.gabung(hasil, time.perf_counter() - mulai)
+
+# --- TITIK MASUK HEADLESS ---
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Replay log transaksi POS tanpa interaksi.")
+    parser.add_argument("logs", nargs="*", help="File log transaksi (.jsonl atau .csv).")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Jumlah proses worker.")
+    parser.add_argument("--db", help="Path database SQLite produk (default: data simulasi di memori).")
+    parser.add_argument("--cache-size", type=int, default=1024, help="Ukuran cache produk (0 = tanpa cache).")
+    parser.add_argument("--generate", type=int, metavar="N",
+                        help="Buat log sintetis berisi N transaksi ke setiap path di logs, lalu keluar.")
+    parser.add_argument("--verbose", action="store_true", help="Tampilkan log INFO per event (lambat).")
+    args = parser.parse_args()
+
+    # Tanpa --verbose hanya WARNING ke atas, sehingga tidak ada format/flush log per event
+    level = logging.INFO if args.verbose else logging.WARNING
+    logging.basicConfig(level=level, format='%(name)s - %(levelname)s - %(message)s')
+
+    if args.generate:
+        ids = [p.id for p in buat_repository(args.db, 0).get_all()]
+        for i, path in enumerate(args.logs):
+            tulis_log_sintetis(path, args.generate, ids, seed=i)
+            print(f"Log sintetis ditulis: {path}")
+    else:
+        per_file, total = replay_files(args.logs, args.workers, args.db, args.cache_size, level)
+        for h in per_file:
+            print(h.ringkasan())
+        print(total.ringkasan())
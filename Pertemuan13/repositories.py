@@ -1,9 +1,44 @@
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import replace
+from typing import Callable, Iterable, Iterator
+import csv
 import logging
+import queue
+import sqlite3
+import threading
+import time
 from models import Product # Wajib diimpor dari models.py
+from money import Money
 
 LOGGER = logging.getLogger('REPOSITORY')
 
-class ProductRepository:
+# --- INTERFACE REPOSITORY (Diperlukan untuk DIP/OCP) ---
+class IProductRepository(ABC):
+    @abstractmethod
+    def get_all(self) -> list[Product]:
+        pass
+
+    @abstractmethod
+    def get_by_id(self, product_id: str) -> Product | None:
+        pass
+
+    @abstractmethod
+    def update_price(self, product_id: str, price: Money) -> bool:
+        pass
+
+    # --- Notifikasi Perubahan (untuk indeks/cache turunan, misalnya ProductSearchIndex) ---
+    def subscribe(self, listener: Callable[[list[Product]], None]):
+        """Mendaftarkan listener yang dipanggil dengan produk yang ditambah/diubah setelah penulisan sukses."""
+        # Copy-on-write: _notify dari thread lain tetap mengiterasi list lama dengan aman
+        self._listeners = [*getattr(self, "_listeners", ()), listener]
+
+    def _notify(self, products: list[Product]):
+        for listener in getattr(self, "_listeners", ()):
+            listener(products)
+
+class ProductRepository(IProductRepository):
     """Mengambil data produk (simulasi database)."""
     def __init__(self):
         # Data hardcoded untuk simulasi:
@@ -20,4 +55,220 @@ class ProductRepository:
 
     def get_by_id(self, product_id: str) -> Product | None:
         """Mencari produk berdasarkan ID."""
-        return self._products.get(product_id)
\ No newline at end of file
+        return self._products.get(product_id)
+
+    def update_price(self, product_id: str, price: Money) -> bool:
+        """Mengubah harga produk. Mengembalikan False jika produk tidak ditemukan."""
+        product = self._products.get(product_id)
+        if product is None:
+            return False
+        # Objek baru agar item yang sudah ada di keranjang tidak ikut berubah harga
+        self._products[product_id] = replace(product, price=Money.of(price))
+        self._notify([self._products[product_id]])
+        return True
+
+# --- REPOSITORY SQLITE (Persisten) ---
+class SqliteConnectionPool:
+    """
+    Pool koneksi SQLite yang aman dipakai banyak thread (satu koneksi dipinjam satu thread).
+    Database ":memory:" (atau "" untuk database sementara) bersifat privat per koneksi, jadi
+    pool-nya selalu berisi satu koneksi agar semua thread melihat database yang sama.
+    """
+    def __init__(self, db_path: str, size: int = 4):
+        self.db_path = db_path
+        if db_path in (":memory:", ""):
+            size = 1
+        self._pool: queue.Queue[sqlite3.Connection] = queue.Queue(maxsize=size)
+        for _ in range(size):
+            conn = sqlite3.connect(db_path, check_same_thread=False, cached_statements=256)
+            conn.execute("PRAGMA journal_mode=WAL")  # Pembaca tidak diblokir penulis
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._pool.put(conn)
+        self.size = size
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """Meminjam satu koneksi; commit jika blok sukses, rollback jika terjadi error."""
+        conn = self._pool.get()
+        try:
+            with conn:
+                yield conn
+        finally:
+            self._pool.put(conn)
+
+    def close(self):
+        for _ in range(self.size):
+            self._pool.get().close()
+
+class SqliteProductRepository(IProductRepository):
+    """
+    Repository produk persisten di SQLite dengan lookup terindeks dan impor massal.
+    Harga disimpan sebagai INTEGER dalam sen (Money.sen) agar tidak ada pembulatan float.
+    """
+    # Statement SQL konstan: sqlite3 meng-compile sekali lalu memakai ulang (prepared) per koneksi
+    _SQL_SCHEMA = (
+        "CREATE TABLE IF NOT EXISTS products ("
+        " id TEXT PRIMARY KEY, name TEXT NOT NULL, price_sen INTEGER NOT NULL"
+        ") WITHOUT ROWID",
+        "CREATE INDEX IF NOT EXISTS idx_products_name ON products(name)",
+    )
+    _SQL_GET_ALL = "SELECT id, name, price_sen FROM products ORDER BY id"
+    _SQL_GET_BY_ID = "SELECT id, name, price_sen FROM products WHERE id = ?"
+    _SQL_UPSERT = "INSERT OR REPLACE INTO products (id, name, price_sen) VALUES (?, ?, ?)"
+    _SQL_UPDATE_PRICE = "UPDATE products SET price_sen = ? WHERE id = ?"
+
+    def __init__(self, db_path: str, pool_size: int = 4):
+        self.pool = SqliteConnectionPool(db_path, pool_size)
+        with self.pool.connection() as conn:
+            for sql in self._SQL_SCHEMA:
+                conn.execute(sql)
+        LOGGER.info("SqliteProductRepository initialized (%s).", db_path)
+
+    def get_all(self) -> list[Product]:
+        """Mengambil semua produk yang tersedia."""
+        with self.pool.connection() as conn:
+            return [Product(pid, name, Money(sen)) for pid, name, sen in conn.execute(self._SQL_GET_ALL)]
+
+    def get_by_id(self, product_id: str) -> Product | None:
+        """Mencari produk berdasarkan ID (lookup lewat primary key)."""
+        with self.pool.connection() as conn:
+            row = conn.execute(self._SQL_GET_BY_ID, (product_id,)).fetchone()
+        return Product(row[0], row[1], Money(row[2])) if row else None
+
+    def update_price(self, product_id: str, price: Money) -> bool:
+        """Mengubah harga produk. Mengembalikan False jika produk tidak ditemukan."""
+        with self.pool.connection() as conn:
+            updated = conn.execute(self._SQL_UPDATE_PRICE, (Money.of(price).sen, product_id)).rowcount > 0
+        if updated and getattr(self, "_listeners", None):
+            self._notify([self.get_by_id(product_id)])
+        return updated
+
+    def add_many(self, products: Iterable[Product], batch_size: int = 10_000) -> int:
+        """Menyimpan banyak produk sekaligus (executemany per batch dalam satu transaksi)."""
+        jumlah = 0
+        # Produk disimpan hanya jika ada listener, dan dikirim setelah transaksi commit
+        tersimpan: list[Product] | None = [] if getattr(self, "_listeners", None) else None
+        with self.pool.connection() as conn:
+            batch = []
+            for p in products:
+                batch.append((p.id, p.name, p.price.sen))
+                if tersimpan is not None:
+                    tersimpan.append(p)
+                if len(batch) >= batch_size:
+                    conn.executemany(self._SQL_UPSERT, batch)
+                    jumlah += len(batch)
+                    batch.clear()
+            if batch:
+                conn.executemany(self._SQL_UPSERT, batch)
+                jumlah += len(batch)
+        if tersimpan:
+            self._notify(tersimpan)
+        return jumlah
+
+    def import_csv(self, csv_path: str, batch_size: int = 10_000) -> int:
+        """Impor massal dari CSV berkolom id,name,price. Mengembalikan jumlah baris yang diimpor."""
+        with open(csv_path, newline="", encoding="utf-8") as f:
+            products = (Product(id=r["id"], name=r["name"], price=Money.of(r["price"])) for r in csv.DictReader(f))
+            jumlah = self.add_many(products, batch_size)
+        LOGGER.info("Imported %d products from %s.", jumlah, csv_path)
+        return jumlah
+
+    def close(self):
+        self.pool.close()
+
+# --- DECORATOR CACHE (Read-through) ---
+class CachingProductRepository(IProductRepository):
+    """
+    Decorator read-through di depan IProductRepository mana pun.
+    - get_by_id: cache LRU berukuran terbatas dengan TTL per entri.
+    - get_all: satu snapshot list yang dipakai ulang sampai TTL habis atau ada perubahan harga.
+    - update_price: diteruskan ke repository asli lalu meng-invalidasi cache produk dan snapshot.
+    - Penulisan langsung ke repository asli (add_many, import_csv) ikut meng-invalidasi lewat subscribe.
+    """
+    def __init__(self, inner: IProductRepository, max_size: int = 1024, ttl: float = 300.0):
+        self.inner = inner
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._cache: OrderedDict[str, tuple[float, Product]] = OrderedDict()
+        self._snapshot: tuple[float, list[Product]] | None = None
+        # Dinaikkan setiap invalidate(): hasil baca dari inner yang dimulai sebelum invalidasi
+        # (bisa berisi harga lama) tidak disimpan ke cache
+        self._generasi = 0
+        self._lock = threading.Lock()
+        inner.subscribe(self._invalidate_produk)
+
+    def get_all(self) -> list[Product]:
+        """Mengembalikan snapshot semua produk. List yang dikembalikan dipakai bersama: jangan diubah."""
+        with self._lock:
+            snapshot = self._snapshot
+            if snapshot is not None and snapshot[0] > time.monotonic():
+                self.hits += 1
+                return snapshot[1]
+            self.misses += 1
+            generasi = self._generasi
+        products = self.inner.get_all()
+        with self._lock:
+            if generasi == self._generasi:
+                self._snapshot = (time.monotonic() + self.ttl, products)
+        return products
+
+    def get_by_id(self, product_id: str) -> Product | None:
+        with self._lock:
+            entri = self._cache.get(product_id)
+            if entri is not None and entri[0] > time.monotonic():
+                self._cache.move_to_end(product_id)
+                self.hits += 1
+                return entri[1]
+            self.misses += 1
+            generasi = self._generasi
+        product = self.inner.get_by_id(product_id)
+        if product is not None:  # ID yang tidak ada tidak di-cache
+            with self._lock:
+                if generasi != self._generasi:
+                    return product  # Ada invalidasi selama membaca; jangan cache nilai yang mungkin basi
+                self._cache[product_id] = (time.monotonic() + self.ttl, product)
+                self._cache.move_to_end(product_id)
+                while len(self._cache) > self.max_size:
+                    self._cache.popitem(last=False)
+                    self.evictions += 1
+        return product
+
+    def update_price(self, product_id: str, price: Money) -> bool:
+        updated = self.inner.update_price(product_id, price)
+        self.invalidate(product_id)
+        return updated
+
+    def subscribe(self, listener: Callable[[list[Product]], None]):
+        """Listener didaftarkan ke repository asli, tempat penulisan benar-benar terjadi."""
+        self.inner.subscribe(listener)
+
+    def _invalidate_produk(self, products: list[Product]):
+        if len(products) == 1:
+            self.invalidate(products[0].id)
+        else:
+            self.invalidate()
+
+    def invalidate(self, product_id: str | None = None):
+        """Menghapus cache satu produk (beserta snapshot), atau seluruh cache jika product_id None."""
+        with self._lock:
+            self._generasi += 1
+            if product_id is None:
+                self._cache.clear()
+            else:
+                self._cache.pop(product_id, None)
+            self._snapshot = None
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self) -> dict[str, float]:
+        """Counter cache untuk tuning ukuran cache."""
+        return {
+            "hits": self.hits, "misses": self.misses, "evictions": self.evictions,
+            "size": len(self._cache), "hit_rate": self.hit_rate,
+        }
@@ -0,0 +1,288 @@
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Callable
+import logging
+import random
+import threading
+import time
+from money import Money
+from services import IPaymentProcessor
+
+LOGGER = logging.getLogger('RESILIENCE')
+
+# --- CIRCUIT BREAKER ---
+class CircuitBreaker:
+    """
+    Circuit breaker sederhana untuk satu backend.
+    - closed    : panggilan diteruskan; `failure_threshold` kegagalan berturut-turut membuka sirkuit.
+    - open      : panggilan langsung ditolak (fail fast) selama `reset_timeout` detik.
+    - half_open : setelah reset_timeout, satu panggilan percobaan diizinkan; sukses menutup
+                  sirkuit, gagal membukanya lagi.
+    Args:
+        failure_threshold (int): Jumlah kegagalan berturut-turut sebelum sirkuit terbuka.
+        reset_timeout (float): Lama sirkuit terbuka dalam detik.
+        clock: Sumber waktu (bisa diganti di tes).
+    """
+    CLOSED, OPEN, HALF_OPEN = "closed", "open", "half_open"
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0,
+                 clock: Callable[[], float] = time.monotonic):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial = False  # Panggilan percobaan half-open sedang berjalan
+        self._trial_mulai = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._state == self.OPEN and self._clock() - self._opened_at >= self.reset_timeout:
+                return self.HALF_OPEN
+            return self._state
+
+    def allow(self) -> bool:
+        """True jika panggilan boleh dilakukan sekarang."""
+        with self._lock:
+            if self._state == self.CLOSED:
+                return True
+            sekarang = self._clock()
+            if self._state == self.OPEN:
+                if sekarang - self._opened_at < self.reset_timeout:
+                    return False
+                self._state = self.HALF_OPEN
+                self._trial = False
+            # Percobaan yang tidak pernah melapor (misalnya menggantung) dianggap hangus setelah reset_timeout
+            if self._trial and sekarang - self._trial_mulai < self.reset_timeout:
+                return False
+            self._trial = True
+            self._trial_mulai = sekarang
+            return True
+
+    def release(self):
+        """Melepas slot percobaan half-open tanpa hasil (panggilan dibatalkan sebelum berjalan)."""
+        with self._lock:
+            self._trial = False
+
+    def record_success(self):
+        with self._lock:
+            if self._state != self.CLOSED:
+                LOGGER.info("Circuit breaker tertutup kembali.")
+            self._state = self.CLOSED
+            self._failures = 0
+            self._trial = False
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                if self._state != self.OPEN:
+                    LOGGER.warning("Circuit breaker terbuka setelah %d kegagalan.", self._failures)
+                self._state = self.OPEN
+                self._opened_at = self._clock()
+                self._trial = False
+
+# --- PROSESOR PEMBAYARAN TANGGUH (Decorator, OCP) ---
+class ResilientPaymentProcessor(IPaymentProcessor):
+    """
+    Membungkus prosesor pembayaran dengan batas waktu per percobaan, circuit breaker,
+    retry terbatas dengan jitter, dan (opsional) prosesor cadangan.
+
+    Kegagalan adalah exception atau melewati `timeout`; penolakan (False) adalah jawaban sah
+    dan tidak di-retry. Retry hanya untuk exception `retry_on` (misalnya koneksi terputus
+    sebelum transaksi terkirim). Timeout tidak di-retry karena panggilan yang terlambat masih
+    bisa selesai dan menagih dua kali.
+
+    Jika semua percobaan gagal sebelum transaksi terkirim, sirkuit terbuka, atau semua slot
+    sibuk, pembayaran dialihkan ke `fallback` (misalnya CashPayment); tanpa fallback,
+    process() mengembalikan False.
+    Setelah timeout, status tagihan di prosesor utama tidak diketahui, jadi secara default
+    process() langsung mengembalikan False tanpa fallback: menagih lagi lewat fallback bisa
+    membuat pelanggan membayar dua kali. `fallback_on_timeout=True` mengizinkannya secara
+    sadar (misalnya fallback tunai yang bisa dikembalikan di kasir).
+
+    Dengan `hedge_after`, fallback sudah dimulai jika prosesor utama belum menjawab setelah
+    sekian detik, dan jawaban pertama yang dipakai. PERINGATAN: hedging menerima risiko tagihan
+    ganda yang sama secara eksplisit; panggilan utama yang sedang berjalan tidak bisa dibatalkan,
+    jadi jika ia tetap disetujui setelah fallback menang, pelanggan tertagih dua kali. Jawaban
+    utama yang terlambat itu dicatat sebagai WARNING untuk rekonsiliasi/refund manual, dan
+    hedging hanya layak dipakai dengan fallback yang bisa dibatalkan.
+
+    Args:
+        inner (IPaymentProcessor): Prosesor utama.
+        timeout (float): Batas waktu setiap percobaan dalam detik.
+        retries (int): Jumlah retry maksimum setelah percobaan pertama.
+        backoff (float): Dasar backoff eksponensial dalam detik (full jitter).
+        max_backoff (float): Batas atas jeda antar-retry.
+        retry_on (tuple[type[BaseException], ...]): Exception yang boleh di-retry.
+        breaker (CircuitBreaker | None): Default CircuitBreaker() baru.
+        fallback (IPaymentProcessor | None): Prosesor cadangan.
+        hedge_after (float | None): Detik sebelum fallback dijalankan paralel; None = tanpa hedging.
+        fallback_on_timeout (bool): Izinkan fallback setelah prosesor utama timeout (risiko tagihan ganda).
+        max_workers (int): Panggilan prosesor utama yang boleh berjalan bersamaan. Panggilan yang
+            menggantung tetap memakai thread sampai selesai; jika semua slot terpakai, pembayaran
+            baru langsung gagal/dialihkan ke fallback alih-alih mengantre (dan menagih belakangan).
+    """
+    def __init__(
+        self,
+        inner: IPaymentProcessor,
+        timeout: float = 10.0,
+        retries: int = 2,
+        backoff: float = 0.1,
+        max_backoff: float = 2.0,
+        retry_on: tuple[type[BaseException], ...] = (ConnectionError,),
+        breaker: CircuitBreaker | None = None,
+        fallback: IPaymentProcessor | None = None,
+        hedge_after: float | None = None,
+        max_workers: int = 4,
+        fallback_on_timeout: bool = False,
+        sleep: Callable[[float], None] = time.sleep,
+        rng: random.Random | None = None,
+    ):
+        if hedge_after is not None and fallback is None:
+            raise ValueError("hedge_after membutuhkan fallback.")
+        self.inner = inner
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.retry_on = retry_on
+        self.breaker = breaker if breaker is not None else CircuitBreaker()
+        self.fallback = fallback
+        self.hedge_after = hedge_after
+        self.fallback_on_timeout = fallback_on_timeout
+        self._sleep = sleep
+        self._rng = rng or random.Random()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="payment")
+        self._slot = threading.BoundedSemaphore(max_workers)
+        self._executor_fallback = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="payment-fallback")
+
+    def _kirim_utama(self, amount: Money) -> Future | None:
+        """Menjalankan prosesor utama di thread pool; None jika semua slot sedang terpakai."""
+        if not self._slot.acquire(blocking=False):
+            self.breaker.record_failure()
+            LOGGER.error("Semua %s sedang sibuk/menggantung; pembayaran %s tidak diantrekan.",
+                         type(self.inner).__name__, amount)
+            return None
+        future = self._executor.submit(self.inner.process, amount)
+        future.add_done_callback(lambda _: self._slot.release())
+        return future
+
+    def process(self, amount: Money) -> bool:
+        if self.hedge_after is not None:
+            if not self.breaker.allow():
+                LOGGER.warning("Prosesor %s sedang terganggu (circuit open).", type(self.inner).__name__)
+                return self._bayar_fallback(amount)
+            return self._hedged(amount)
+
+        for percobaan in range(self.retries + 1):
+            if not self.breaker.allow():
+                LOGGER.warning("Prosesor %s sedang terganggu (circuit open).", type(self.inner).__name__)
+                break
+            if percobaan:
+                self._sleep(self._rng.uniform(0, min(self.max_backoff, self.backoff * 2 ** (percobaan - 1))))
+            future = self._kirim_utama(amount)
+            if future is None:
+                break
+            try:
+                hasil = future.result(timeout=self.timeout)
+            except Exception as e:
+                self.breaker.record_failure()
+                if isinstance(e, TimeoutError) and not future.done():
+                    LOGGER.error("Pembayaran %s melewati batas waktu %.1f detik.", amount, self.timeout)
+                    if future.cancel():
+                        break  # Belum sempat terkirim: aman dialihkan ke fallback
+                    # Sudah berjalan di terminal: pantau jawaban terlambat untuk rekonsiliasi
+                    self._pantau_terlambat(future, amount)
+                    if self.fallback_on_timeout:
+                        break
+                    return False  # Status tagihan tidak diketahui; jangan menagih lagi
+                if isinstance(e, self.retry_on):
+                    LOGGER.warning("Percobaan pembayaran %d gagal: %s", percobaan + 1, e)
+                    continue
+                LOGGER.error("Pembayaran gagal: %s", e)
+                break
+            self.breaker.record_success()
+            return hasil
+        return self._bayar_fallback(amount)
+
+    def _hedged(self, amount: Money) -> bool:
+        """
+        Menjalankan prosesor utama; jika belum menjawab setelah hedge_after, fallback ikut
+        berjalan dan jawaban pertama yang tidak error yang dipakai (tanpa retry).
+        """
+        utama = self._kirim_utama(amount)
+        if utama is None:
+            return self._bayar_fallback(amount)
+        batas = time.monotonic() + self.timeout
+        tertunda = {utama}
+        cadangan = None
+        while tertunda:
+            tunggu = self.hedge_after if cadangan is None else max(0.0, batas - time.monotonic())
+            selesai, tertunda = wait(tertunda, timeout=tunggu, return_when=FIRST_COMPLETED)
+            for future in selesai:
+                try:
+                    hasil = future.result()
+                except Exception as e:
+                    LOGGER.warning("Pembayaran lewat %s gagal: %s", "prosesor utama" if future is utama else "fallback", e)
+                    if future is utama:
+                        self.breaker.record_failure()
+                    continue
+                if future is utama:
+                    self.breaker.record_success()
+                elif not utama.done():
+                    # Fallback menang; hasil utama tetap dilaporkan ke breaker saat datang
+                    self._pantau_terlambat(utama, amount, lapor_breaker=True)
+                return hasil
+            if cadangan is None and (tertunda or utama.done()):
+                # Utama belum menjawab (hedge) atau sudah gagal: jalankan fallback
+                if tertunda:
+                    LOGGER.warning("Prosesor utama belum menjawab setelah %.2f detik; menjalankan fallback.", self.hedge_after)
+                cadangan = self._executor_fallback.submit(self.fallback.process, amount)
+                tertunda = tertunda | {cadangan}
+            elif not selesai:
+                break  # Batas waktu habis
+        if not utama.done():
+            self.breaker.record_failure()
+            if not utama.cancel():
+                self._pantau_terlambat(utama, amount)
+        LOGGER.error("Pembayaran %s gagal di prosesor utama dan fallback.", amount)
+        return False
+
+    def _bayar_fallback(self, amount: Money) -> bool:
+        if self.fallback is None:
+            return False
+        LOGGER.warning("Mengalihkan pembayaran %s ke %s.", amount, type(self.fallback).__name__)
+        try:
+            return self.fallback.process(amount)
+        except Exception as e:
+            LOGGER.error("Pembayaran fallback gagal: %s", e)
+            return False
+
+    def _pantau_terlambat(self, future: Future, amount: Money, lapor_breaker: bool = False):
+        """
+        Mencatat jawaban prosesor utama yang datang setelah transaksi diputuskan.
+        Dengan `lapor_breaker`, hasil tersebut juga dilaporkan ke circuit breaker (termasuk
+        melepas slot percobaan half-open jika panggilan dibatalkan).
+        """
+        def catat(f: Future):
+            if f.cancelled():
+                if lapor_breaker:
+                    self.breaker.release()
+                return
+            if f.exception() is not None:
+                if lapor_breaker:
+                    self.breaker.record_failure()
+                return
+            if lapor_breaker:
+                self.breaker.record_success()
+            if f.result():
+                LOGGER.warning("Pembayaran %s disetujui prosesor utama SETELAH dialihkan/timeout; perlu rekonsiliasi.", amount)
+        future.add_done_callback(catat)
+
+    def close(self, wait: bool = False):
+        """Melepas thread pool; default tanpa menunggu panggilan yang menggantung."""
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+        self._executor_fallback.shutdown(wait=wait, cancel_futures=True)
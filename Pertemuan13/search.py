@@ -0,0 +1,168 @@
+from bisect import bisect_left, insort
+from itertools import islice
+from typing import Iterator
+import logging
+import re
+from models import Product
+from repositories import IProductRepository
+
+LOGGER = logging.getLogger('SEARCH')
+
+_TOKEN = re.compile(r"\w+")
+
+def _tokens(teks: str) -> list[str]:
+    return _TOKEN.findall(teks.lower())
+
+def _cari_prefix(daftar_urut: list[tuple[str, str]], prefix: str) -> Iterator[tuple[str, str]]:
+    """Menghasilkan pasangan (kunci, id) dari list terurut yang kuncinya diawali `prefix`."""
+    # Iterasi lewat indeks (bukan islice) agar tidak melewati elemen sebelum posisi bisect satu per satu
+    for posisi in range(bisect_left(daftar_urut, (prefix,)), len(daftar_urut)):
+        kunci, product_id = daftar_urut[posisi]
+        if not kunci.startswith(prefix):
+            return
+        yield kunci, product_id
+
+class ProductSearchIndex:
+    """
+    Indeks pencarian produk di atas IProductRepository (SRP: repository tetap hanya menyimpan data).
+    - Indeks terurut (ID, lalu nama) untuk pencarian prefix lewat bisect.
+    - Inverted index kata nama -> ID produk, kata terakhir query diperlakukan sebagai prefix.
+    Hasil dikembalikan sebagai generator; detail produk diambil dari repository saat di-yield
+    sehingga harga terbaru selalu dipakai. Produk yang ditambah/diganti namanya lewat repository
+    (add_many, import_csv) masuk ke indeks lewat IProductRepository.subscribe.
+    """
+    # Perubahan sebesar ini atau lebih dibangun ulang sekaligus; insort per produk bernilai O(n)
+    BATAS_REBUILD = 1_000
+
+    def __init__(self, repository: IProductRepository):
+        self.repository = repository
+        self._id_urut: list[tuple[str, str]] = []        # (id lowercase, id asli)
+        self._nama_urut: list[tuple[str, str]] = []      # (nama lowercase, id)
+        self._kata: dict[str, set[str]] = {}             # kata -> {id}
+        self._kata_urut: list[str] = []
+        self._nama_per_id: dict[str, str] = {}
+        self.rebuild()
+        repository.subscribe(self._on_change)
+
+    # --- Pemeliharaan Indeks ---
+    def rebuild(self):
+        """Membangun ulang seluruh indeks dari repository."""
+        products = self.repository.get_all()
+        self._nama_per_id = {p.id: p.name for p in products}
+        self._id_urut = sorted((p.id.lower(), p.id) for p in products)
+        self._nama_urut = sorted((p.name.lower(), p.id) for p in products)
+        self._kata = {}
+        for p in products:
+            for kata in _tokens(p.name):
+                self._kata.setdefault(kata, set()).add(p.id)
+        self._kata_urut = sorted(self._kata)
+        LOGGER.info("Search index built for %d products.", len(products))
+
+    def _on_change(self, products: list[Product]):
+        if len(products) >= self.BATAS_REBUILD:
+            self.rebuild()
+        else:
+            for product in products:
+                self.upsert(product)
+
+    def upsert(self, product: Product):
+        """Menambahkan produk baru atau memperbarui nama produk yang sudah terindeks."""
+        if product.id in self._nama_per_id:
+            if self._nama_per_id[product.id] == product.name:
+                return
+            self.remove(product.id)
+        self._nama_per_id[product.id] = product.name
+        insort(self._id_urut, (product.id.lower(), product.id))
+        insort(self._nama_urut, (product.name.lower(), product.id))
+        for kata in _tokens(product.name):
+            posting = self._kata.get(kata)
+            if posting is None:
+                posting = self._kata[kata] = set()
+                insort(self._kata_urut, kata)
+            posting.add(product.id)
+
+    def remove(self, product_id: str):
+        """Menghapus produk dari indeks (tidak melakukan apa-apa jika tidak terindeks)."""
+        nama = self._nama_per_id.pop(product_id, None)
+        if nama is None:
+            return
+        self._hapus_urut(self._id_urut, (product_id.lower(), product_id))
+        self._hapus_urut(self._nama_urut, (nama.lower(), product_id))
+        for kata in _tokens(nama):
+            posting = self._kata[kata]
+            posting.discard(product_id)
+            if not posting:
+                del self._kata[kata]
+                self._hapus_urut(self._kata_urut, kata)
+
+    @staticmethod
+    def _hapus_urut(daftar_urut: list, elemen):
+        posisi = bisect_left(daftar_urut, elemen)
+        if posisi < len(daftar_urut) and daftar_urut[posisi] == elemen:
+            del daftar_urut[posisi]
+
+    # --- Query ---
+    def search(self, query: str) -> Iterator[Product]:
+        """
+        Mencari produk berdasarkan prefix ID atau kata pada nama.
+        Urutan hasil: kecocokan prefix ID, lalu kecocokan nama (urut abjad).
+        Returns:
+            Iterator[Product]: Generator hasil (lazy).
+        """
+        q = query.strip().lower()
+        if not q:
+            return
+        sudah = set()
+        if " " not in q:
+            for _, product_id in _cari_prefix(self._id_urut, q):
+                sudah.add(product_id)
+                product = self.repository.get_by_id(product_id)
+                if product is not None:
+                    yield product
+
+        kandidat = self._cocok_kata(_tokens(q)) - sudah
+        if len(kandidat) * 16 > len(self._nama_urut):
+            # Kandidat padat: berjalan di indeks nama (sudah urut) lebih cepat daripada mengurutkan kandidat
+            urut = (product_id for _, product_id in self._nama_urut if product_id in kandidat)
+        else:
+            urut = (product_id for _, product_id in sorted((self._nama_per_id[pid].lower(), pid) for pid in kandidat))
+        for product_id in urut:
+            product = self.repository.get_by_id(product_id)
+            if product is not None:
+                yield product
+
+    def search_prefix_nama(self, prefix: str) -> Iterator[Product]:
+        """Produk yang namanya diawali `prefix` (urut abjad)."""
+        for _, product_id in _cari_prefix(self._nama_urut, prefix.lower()):
+            product = self.repository.get_by_id(product_id)
+            if product is not None:
+                yield product
+
+    def page(self, query: str, nomor: int = 1, ukuran: int = 10) -> list[Product]:
+        """Satu halaman hasil search() (nomor halaman dimulai dari 1)."""
+        awal = (nomor - 1) * ukuran
+        return list(islice(self.search(query), awal, awal + ukuran))
+
+    def _cocok_kata(self, kata_query: list[str]) -> set[str]:
+        if not kata_query:
+            return set()
+        *lengkap, terakhir = kata_query
+        # Kata terakhir diperlakukan sebagai prefix (query saat kasir masih mengetik)
+        kata_urut = self._kata_urut
+        cocok_prefix = []
+        for posisi in range(bisect_left(kata_urut, terakhir), len(kata_urut)):
+            kata = kata_urut[posisi]
+            if not kata.startswith(terakhir):
+                break
+            cocok_prefix.append(self._kata[kata])
+        if not cocok_prefix:
+            return set()
+        postings = [cocok_prefix[0] if len(cocok_prefix) == 1 else set().union(*cocok_prefix)]
+        for kata in lengkap:
+            posting = self._kata.get(kata)
+            if posting is None:
+                return set()
+            postings.append(posting)
+        # Irisan dimulai dari posting terkecil: biaya sebanding dengan ukuran posting terkecil
+        postings.sort(key=len)
+        return postings[0].intersection(*postings[1:])
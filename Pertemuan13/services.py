@@ -1,49 +1,115 @@
 from abc import ABC, abstractmethod
 import logging
+import os
 from models import Product, CartItem # Wajib diimpor dari models.py
+from money import Money
 from typing import List
+from metrics import MeteredCall, MetricsRegistry, REGISTRY
 
 LOGGER = logging.getLogger('SERVICES')
 
 # --- INTERFACE PEMBAYARAN (Diperlukan untuk DIP/OCP) ---
 class IPaymentProcessor(ABC):
     @abstractmethod
-    def process(self, amount: float) -> bool:
+    def process(self, amount: Money) -> bool:
         pass
 
 # --- IMPLEMENTASI PEMBAYARAN TUNAI ---
 class CashPayment(IPaymentProcessor):
-    def process(self, amount: float) -> bool:
-        LOGGER.info(f"Menerima TUNAI sejumlah: Rp{amount:,.0f}")
+    def process(self, amount: Money) -> bool:
+        LOGGER.info("Menerima TUNAI sejumlah: %s", amount)
         return True
 
 
 # --- IMPLEMENTASI PEMBAYARAN KARTU DEBIT ---
 class DebitCardPayment(IPaymentProcessor):
-    def process(self, amount: float) -> bool:
-        LOGGER.info(f"Menginisialisasi pembayaran Kartu Debit...")
-        LOGGER.info(f"Menggesek kartu untuk tagihan: Rp{amount:,.0f}")
+    def process(self, amount: Money) -> bool:
+        LOGGER.info("Menginisialisasi pembayaran Kartu Debit...")
+        LOGGER.info("Menggesek kartu untuk tagihan: %s", amount)
         # Simulasi pembayaran sukses
         LOGGER.info("Pembayaran Debit Disetujui.")
         return True
 
 
+# --- DECORATOR METRIK PEMBAYARAN (OCP: prosesor lama tidak diubah) ---
+class MeteredPaymentProcessor(IPaymentProcessor):
+    """
+    Membungkus prosesor apa pun dan mencatat latensi (histogram) serta hasil
+    (counter ok/declined/error) per nama prosesor.
+    """
+    def __init__(self, inner: IPaymentProcessor, registry: MetricsRegistry = REGISTRY, name: str | None = None):
+        self.inner = inner
+        self.name = name or type(inner).__name__
+        self._meter = MeteredCall(registry, "payment", "Latensi IPaymentProcessor.process.",
+                                  "Jumlah pembayaran per hasil.", {"processor": self.name}, gagal="declined")
+
+    def process(self, amount: Money) -> bool:
+        return self._meter(self.inner.process, amount)
+
+
 # --- SERVICE KERANJANG BELANJA (Logika Inti Bisnis) ---
 class ShoppingCart:
-    """Mengelola item, kuantitas, dan total harga pesanan (SRP)."""
-    def __init__(self):
+    """
+    Mengelola item, kuantitas, dan total harga pesanan (SRP).
+    Total disimpan sebagai running total yang diperbarui oleh add_item, remove_item, dan
+    update_quantity, sehingga total_price O(1) berapa pun jumlah barisnya. Ubah kuantitas
+    hanya lewat method tersebut (bukan langsung ke CartItem) agar total tetap konsisten.
+    Args:
+        debug (bool | None): Jika True, setiap akses total_price dicek ulang terhadap hitung penuh.
+            Default mengikuti environment variable POS_DEBUG=1.
+    """
+    __slots__ = ("items", "_total", "debug")
+
+    def __init__(self, debug: bool | None = None):
         self.items: dict[str, CartItem] = {}
+        self._total = Money.zero()
+        self.debug = os.environ.get("POS_DEBUG") == "1" if debug is None else debug
 
     def add_item(self, product: Product, quantity: int = 1):
-        if product.id in self.items:
-            self.items[product.id].quantity += quantity
+        item = self.items.get(product.id)
+        if item is not None:
+            item.quantity += quantity
+            self._total += item.product.price * quantity
         else:
             self.items[product.id] = CartItem(product=product, quantity=quantity)
-        LOGGER.info(f"Added {quantity}x {product.name} to cart.")
+            self._total += product.price * quantity
+        LOGGER.info("Added %dx %s to cart.", quantity, product.name)
+
+    def remove_item(self, product_id: str) -> bool:
+        """Menghapus satu baris dari keranjang. Mengembalikan False jika produk tidak ada."""
+        item = self.items.pop(product_id, None)
+        if item is None:
+            return False
+        self._total -= item.subtotal
+        LOGGER.info("Removed %s from cart.", item.product.name)
+        return True
+
+    def update_quantity(self, product_id: str, quantity: int) -> bool:
+        """Mengubah kuantitas satu baris; kuantitas <= 0 menghapus baris tersebut."""
+        if quantity <= 0:
+            return self.remove_item(product_id)
+        item = self.items.get(product_id)
+        if item is None:
+            return False
+        self._total += item.product.price * (quantity - item.quantity)
+        item.quantity = quantity
+        return True
 
     def get_items(self) -> List[CartItem]:
         return list(self.items.values())
 
     @property
-    def total_price(self) -> float:
-        return sum(item.subtotal for item in self.items.values())
\ No newline at end of file
+    def total_price(self) -> Money:
+        if self.debug:
+            self.verify_total()
+        return self._total
+
+    def recompute_total(self) -> Money:
+        """Menghitung total penuh dari semua item (O(n)), untuk pengecekan konsistensi."""
+        return Money.total(item.subtotal for item in self.items.values())
+
+    def verify_total(self):
+        """Memastikan running total sama persis dengan hitung penuh."""
+        penuh = self.recompute_total()
+        if self._total != penuh:
+            raise AssertionError(f"Running total {self._total} tidak sama dengan hitung penuh {penuh}.")
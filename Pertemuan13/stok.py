@@ -0,0 +1,210 @@
+from abc import ABC, abstractmethod
+from typing import Callable
+import logging
+import threading
+import time
+import zlib
+
+LOGGER = logging.getLogger('STOK')
+
+# --- INTERFACE STOK ---
+class IStockRepository(ABC):
+    """
+    Kontrak persediaan dengan alur reserve -> commit / release.
+    `holder` adalah pemilik reservasi (misalnya satu keranjang/sesi kasir).
+    """
+    @abstractmethod
+    def available(self, product_id: str) -> int:
+        pass
+
+    @abstractmethod
+    def reserve(self, holder: str, product_id: str, quantity: int) -> bool:
+        pass
+
+    @abstractmethod
+    def commit(self, holder: str, product_id: str, quantity: int) -> bool:
+        pass
+
+    @abstractmethod
+    def release(self, holder: str, product_id: str) -> int:
+        pass
+
+    @abstractmethod
+    def uncommit(self, holder: str, product_id: str, quantity: int):
+        pass
+
+    @abstractmethod
+    def restock(self, product_id: str, quantity: int):
+        pass
+
+# --- IMPLEMENTASI DENGAN LOCK STRIPING ---
+class _Sku:
+    __slots__ = ("on_hand", "reserved", "reservasi")
+
+    def __init__(self, on_hand: int):
+        self.on_hand = on_hand
+        self.reserved = 0
+        self.reservasi: dict[str, list] = {}  # holder -> [quantity, kedaluwarsa]
+
+class StripedStockRepository(IStockRepository):
+    """
+    Stok di memori yang aman untuk banyak thread kasir.
+    SKU dibagi ke `stripes` lock berdasarkan hash ID-nya, sehingga penjualan SKU berbeda
+    jarang menunggu lock yang sama; hanya SKU pada stripe yang sama yang saling serial.
+    Reservasi kedaluwarsa setelah `ttl` detik (keranjang ditinggal) dan dibersihkan secara
+    lazy saat SKU-nya kekurangan stok, atau lewat expire().
+
+    Args:
+        stok_awal (dict[str, int]): Stok fisik per product_id.
+        stripes (int): Jumlah lock.
+        ttl (float): Umur reservasi dalam detik.
+        clock: Sumber waktu (bisa diganti di tes).
+    """
+    def __init__(
+        self,
+        stok_awal: dict[str, int],
+        stripes: int = 64,
+        ttl: float = 900.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if stripes <= 0:
+            raise ValueError("stripes harus lebih dari 0.")
+        self.ttl = ttl
+        self._clock = clock
+        self._locks = [threading.Lock() for _ in range(stripes)]
+        self._skus = {product_id: _Sku(jumlah) for product_id, jumlah in stok_awal.items()}
+        self._skus_lock = threading.Lock()  # Hanya untuk menambah SKU baru
+        self.expired = 0
+
+    def _lock(self, product_id: str) -> threading.Lock:
+        # crc32 stabil antarproses (hash() str diacak per proses)
+        return self._locks[zlib.crc32(product_id.encode()) % len(self._locks)]
+
+    def _purge(self, sku: _Sku, sekarang: float):
+        """Membuang reservasi kedaluwarsa satu SKU; lock stripe-nya harus sudah dipegang."""
+        for holder, (jumlah, kedaluwarsa) in list(sku.reservasi.items()):
+            if kedaluwarsa <= sekarang:
+                del sku.reservasi[holder]
+                sku.reserved -= jumlah
+                self.expired += 1
+
+    def available(self, product_id: str) -> int:
+        """Stok yang masih bisa direservasi (fisik dikurangi reservasi aktif)."""
+        sku = self._skus.get(product_id)
+        if sku is None:
+            return 0
+        with self._lock(product_id):
+            self._purge(sku, self._clock())
+            return sku.on_hand - sku.reserved
+
+    def on_hand(self, product_id: str) -> int:
+        sku = self._skus.get(product_id)
+        return sku.on_hand if sku is not None else 0
+
+    def reserve(self, holder: str, product_id: str, quantity: int) -> bool:
+        """Menambah reservasi `holder` sebanyak `quantity`; False jika stok tidak cukup."""
+        sku = self._skus.get(product_id)
+        if sku is None or quantity <= 0:
+            return False
+        with self._lock(product_id):
+            sekarang = self._clock()
+            if sku.on_hand - sku.reserved < quantity:
+                self._purge(sku, sekarang)
+                if sku.on_hand - sku.reserved < quantity:
+                    return False
+            entri = sku.reservasi.get(holder)
+            if entri is not None and entri[1] <= sekarang:
+                # Reservasi lama sudah kedaluwarsa tapi belum dibersihkan; hitung ulang dari nol
+                sku.reserved -= entri[0]
+                self.expired += 1
+                entri = None
+            if entri is None:
+                sku.reservasi[holder] = [quantity, sekarang + self.ttl]
+            else:
+                entri[0] += quantity
+                entri[1] = sekarang + self.ttl  # Aktivitas memperpanjang reservasi
+            sku.reserved += quantity
+            return True
+
+    def commit(self, holder: str, product_id: str, quantity: int) -> bool:
+        """
+        Mengurangi stok fisik sebanyak `quantity` untuk holder. Reservasi holder dipakai lebih
+        dulu; sisanya (misalnya reservasi sudah kedaluwarsa) diambil dari stok yang tersedia.
+        Sisa reservasi holder untuk SKU ini ikut dilepas. False jika stok tidak cukup; dalam
+        hal itu tidak ada yang berubah.
+        """
+        sku = self._skus.get(product_id)
+        if sku is None or quantity <= 0:
+            return False
+        with self._lock(product_id):
+            sekarang = self._clock()
+            entri = sku.reservasi.get(holder)
+            milik = entri[0] if entri is not None and entri[1] > sekarang else 0
+            kurang = quantity - min(milik, quantity)
+            if kurang and sku.on_hand - sku.reserved < kurang:
+                self._purge(sku, sekarang)
+                entri = sku.reservasi.get(holder)
+                milik = entri[0] if entri is not None else 0
+                kurang = quantity - min(milik, quantity)
+                if sku.on_hand - sku.reserved < kurang:
+                    return False
+            if entri is not None:
+                del sku.reservasi[holder]
+                sku.reserved -= entri[0]
+            sku.on_hand -= quantity
+            return True
+
+    def release(self, holder: str, product_id: str) -> int:
+        """Melepas reservasi holder untuk satu SKU; mengembalikan jumlah yang dilepas."""
+        sku = self._skus.get(product_id)
+        if sku is None:
+            return 0
+        with self._lock(product_id):
+            entri = sku.reservasi.pop(holder, None)
+            if entri is None:
+                return 0
+            sku.reserved -= entri[0]
+            return entri[0]
+
+    def uncommit(self, holder: str, product_id: str, quantity: int):
+        """
+        Kompensasi commit yang transaksinya batal (misalnya pembayaran gagal): stok fisik
+        dikembalikan dan langsung direservasi lagi untuk holder dalam satu lock, sehingga
+        keranjang yang masih utuh tidak kehilangan barangnya ke kasir lain.
+        """
+        sku = self._skus.get(product_id)
+        if sku is None:
+            with self._skus_lock:
+                sku = self._skus.setdefault(product_id, _Sku(0))
+        with self._lock(product_id):
+            sekarang = self._clock()
+            sku.on_hand += quantity
+            entri = sku.reservasi.get(holder)
+            if entri is not None and entri[1] <= sekarang:
+                sku.reserved -= entri[0]
+                self.expired += 1
+                entri = None
+            if entri is None:
+                sku.reservasi[holder] = [quantity, sekarang + self.ttl]
+            else:
+                entri[0] += quantity
+                entri[1] = sekarang + self.ttl
+            sku.reserved += quantity
+
+    def restock(self, product_id: str, quantity: int):
+        """Menambah stok fisik (barang masuk)."""
+        sku = self._skus.get(product_id)
+        if sku is None:
+            with self._skus_lock:
+                sku = self._skus.setdefault(product_id, _Sku(0))
+        with self._lock(product_id):
+            sku.on_hand += quantity
+
+    def expire(self) -> int:
+        """Membersihkan semua reservasi kedaluwarsa; mengembalikan jumlah yang dibuang."""
+        sebelum = self.expired
+        sekarang = self._clock()
+        for product_id, sku in list(self._skus.items()):
+            with self._lock(product_id):
+                self._purge(sku, sekarang)
+        return self.expired - sebelum
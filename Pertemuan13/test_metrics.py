@@ -0,0 +1,128 @@
+import logging
+import os
+import tempfile
+import threading
+import unittest
+import urllib.request
+from main_app import PosApp
+from metrics import MeteredCall, MetricsRegistry, _indeks, _batas_atas
+from money import Money
+from repositories import ProductRepository
+from services import IPaymentProcessor, MeteredPaymentProcessor
+
+class PembayaranTetap(IPaymentProcessor):
+    def __init__(self, hasil: bool):
+        self.hasil = hasil
+
+    def process(self, amount: Money) -> bool:
+        return self.hasil
+
+class TestMetrics(unittest.TestCase):
+
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+        self.registry = MetricsRegistry()
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+
+    def test_bucket_hdr_galat_relatif_kecil(self):
+        """Tes 1: Setiap nilai jatuh di bucket yang batas atasnya lebih besar, dengan galat <= 6,25%."""
+        for ns in (0, 1, 15, 16, 31, 32, 1000, 123_456, 10**9, 10**11):
+            batas = _batas_atas(_indeks(ns))
+            self.assertGreater(batas, ns)
+            self.assertLessEqual(batas - 1 - ns, max(1, ns) * 0.0625)
+
+    def test_counter_dan_histogram_dari_banyak_thread(self):
+        """Tes 2: Sel per thread dijumlahkan saat dibaca tanpa kehilangan observasi."""
+        counter = self.registry.counter("tes_total", "Tes.").labels()
+        histogram = self.registry.histogram("tes_seconds", "Tes.").labels()
+
+        def kerja():
+            for i in range(1, 1001):
+                counter.inc()
+                histogram.observe_ns(i * 1000)
+        threads = [threading.Thread(target=kerja) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(counter.value, 8000)
+        self.assertEqual(histogram.count, 8000)
+        self.assertAlmostEqual(histogram.quantile(0.5), 500_000, delta=500_000 * 0.0625)
+        self.assertAlmostEqual(histogram.quantile(0.99), 990_000, delta=990_000 * 0.0625)
+
+    def test_ekspor_prometheus_file_dan_http(self):
+        """Tes 3: Prosesor terukur menghasilkan teks Prometheus yang sama di file dan endpoint HTTP."""
+        ok = MeteredPaymentProcessor(PembayaranTetap(True), self.registry, name="debit")
+        tolak = MeteredPaymentProcessor(PembayaranTetap(False), self.registry, name="tunai")
+        self.assertTrue(ok.process(Money.of(1000)))
+        self.assertFalse(tolak.process(Money.of(1000)))
+
+        teks = self.registry.render_prometheus()
+        self.assertIn("# TYPE payment_duration_seconds histogram", teks)
+        self.assertIn('payment_total{processor="debit",result="ok"} 1', teks)
+        self.assertIn('payment_total{processor="tunai",result="declined"} 1', teks)
+        self.assertIn('payment_duration_seconds_bucket{processor="debit",le="+Inf"} 1', teks)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "pos.prom")
+            self.registry.write_file(path)
+            with open(path, encoding="utf-8") as f:
+                self.assertEqual(f.read(), teks)
+
+        server = self.registry.serve_http(0)
+        try:
+            url = f"http://127.0.0.1:{server.server_address[1]}/metrics"
+            with urllib.request.urlopen(url, timeout=5) as resp:
+                self.assertEqual(resp.read().decode("utf-8"), teks)
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    def test_posapp_mencatat_checkout(self):
+        """Tes 4: PosApp dengan registry mencatat checkout sukses dan gagal."""
+        app = PosApp(ProductRepository(), PembayaranTetap(True), metrics=self.registry)
+        self.assertFalse(app.checkout())  # Keranjang kosong
+        self.assertTrue(app.add_item("P001", 1))
+        self.assertTrue(app.checkout())
+        teks = self.registry.render_prometheus()
+        self.assertIn('pos_checkout_total{result="ok"} 1', teks)
+        self.assertIn('pos_checkout_total{result="failed"} 1', teks)
+        self.assertIn("pos_checkout_duration_seconds_count 2", teks)
+
+    def test_posapp_mencatat_checkout_error(self):
+        """Tes 5: Exception dari prosesor tercatat sebagai result="error" dan tetap diteruskan."""
+        class PembayaranRusak(IPaymentProcessor):
+            def process(self, amount: Money) -> bool:
+                raise ConnectionError("terminal mati")
+
+        app = PosApp(ProductRepository(), PembayaranRusak(), metrics=self.registry)
+        self.assertTrue(app.add_item("P001", 1))
+        with self.assertRaises(ConnectionError):
+            app.checkout()
+        teks = self.registry.render_prometheus()
+        self.assertIn('pos_checkout_total{result="error"} 1', teks)
+        self.assertIn("pos_checkout_duration_seconds_count 1", teks)
+
+    def test_metered_call_berbagi_sel_dengan_child(self):
+        """Tes 6: MeteredCall dari banyak thread menulis ke sel yang sama dengan child counter/histogram."""
+        dicatat = MeteredCall(self.registry, "tes", "Durasi.", "Hasil.", {"jalur": "a"})
+        ok = self.registry.counter("tes_total", "Hasil.", ("jalur", "result")).labels(jalur="a", result="ok")
+        durasi = self.registry.histogram("tes_duration_seconds", "Durasi.", ("jalur",)).labels(jalur="a")
+
+        def kerja():
+            for i in range(1000):
+                dicatat(lambda gagal: not gagal, i % 4 == 0)
+                ok.inc()
+        threads = [threading.Thread(target=kerja) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(ok.value, 4 * 750 + 4000)
+        self.assertEqual(durasi.count, 4000)
+        self.assertIn('tes_total{jalur="a",result="failed"} 1000', self.registry.render_prometheus())
+
+if __name__ == "__main__":
+    unittest.main()
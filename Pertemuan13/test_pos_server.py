@@ -0,0 +1,100 @@
+import asyncio
+import logging
+import threading
+import time
+import unittest
+from money import Money
+from pos_server import PosServer
+from repositories import ProductRepository
+from services import CashPayment, IPaymentProcessor
+
+class PembayaranTertahan(IPaymentProcessor):
+    """Terminal yang menggantung sampai `lepas` di-set."""
+    def __init__(self):
+        self.lepas = threading.Event()
+
+    def process(self, amount: Money) -> bool:
+        return self.lepas.wait(5)
+
+class TestPosServer(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        """Arrange: Server di port acak dengan repository simulasi."""
+        logging.disable(logging.CRITICAL)
+        self.server = PosServer(ProductRepository(), CashPayment(), idle_timeout=0.3)
+        await self.server.start(port=0)
+
+    async def asyncTearDown(self):
+        await self.server.close()
+        logging.disable(logging.NOTSET)
+
+    async def connect(self, server: PosServer | None = None):
+        reader, writer = await asyncio.open_connection("127.0.0.1", (server or self.server).port)
+        self.assertTrue((await reader.readline()).startswith(b"OK SESSION"))
+        return reader, writer
+
+    async def kirim(self, koneksi, perintah: str) -> str:
+        reader, writer = koneksi
+        writer.write(perintah.encode() + b"\n")
+        return (await reader.readline()).decode().strip()
+
+    async def test_keranjang_terisolasi_per_sesi(self):
+        """Tes 1: Dua terminal punya keranjang sendiri; checkout mengosongkan keranjang."""
+        a, b = await self.connect(), await self.connect()
+        self.assertEqual(await self.kirim(a, "ADD P001"), "OK 1500000000")
+        self.assertEqual(await self.kirim(b, "add p002 2"), "OK 50000000")
+        self.assertEqual(await self.kirim(a, "LIST"), "OK P001x1")
+        self.assertEqual(await self.kirim(b, "ADD P999"), "ERR NOT FOUND")
+        self.assertEqual(await self.kirim(a, "CHECKOUT"), "OK PAID 1500000000")
+        self.assertEqual(await self.kirim(a, "TOTAL"), "OK 0")
+        self.assertEqual(await self.kirim(b, "TOTAL"), "OK 50000000")
+        self.assertEqual(await self.kirim(b, "QUIT"), "OK BYE")
+        self.assertEqual(await b[0].readline(), b"")
+        a[1].close()
+
+    async def test_sesi_idle_dievict(self):
+        """Tes 2: Sesi tanpa perintah ditutup setelah idle_timeout."""
+        reader, writer = await self.connect()
+        self.assertEqual(await asyncio.wait_for(reader.readline(), 2), b"ERR IDLE\n")
+        self.assertEqual(await reader.readline(), b"")
+        self.assertEqual(self.server.evicted, 1)
+        self.assertEqual(self.server.sessions, {})
+        writer.close()
+
+    async def test_ratusan_sesi_bersamaan(self):
+        """Tes 3: 300 terminal bersamaan masing-masing checkout dengan total yang benar."""
+        self.server.idle_timeout = 30  # Koneksi awal menunggu yang lain; jangan dianggap idle
+        async def terminal(i: int) -> str:
+            koneksi = await self.connect()
+            await self.kirim(koneksi, f"ADD P002 {i % 5 + 1}")
+            hasil = await self.kirim(koneksi, "CHECKOUT")
+            await self.kirim(koneksi, "QUIT")
+            koneksi[1].close()
+            return hasil
+
+        hasil = await asyncio.gather(*(terminal(i) for i in range(300)))
+        self.assertEqual(hasil, [f"OK PAID {25000000 * (i % 5 + 1)}" for i in range(300)])
+
+    async def test_pembayaran_lambat_tidak_memblokir_sesi_lain(self):
+        """Tes 4: Checkout yang tertahan di terminal tidak menahan perintah sesi lain."""
+        pembayaran = PembayaranTertahan()
+        server = PosServer(ProductRepository(), pembayaran)
+        await server.start(port=0)
+        try:
+            a, b = await self.connect(server), await self.connect(server)
+            self.assertEqual(await self.kirim(a, "ADD P002"), "OK 25000000")
+            a[1].write(b"CHECKOUT\n")
+            await asyncio.sleep(0.05)  # Checkout sesi a sedang menunggu terminal
+            mulai = time.perf_counter()
+            self.assertEqual(await asyncio.wait_for(self.kirim(b, "ADD P001"), 1), "OK 1500000000")
+            self.assertLess(time.perf_counter() - mulai, 0.5)
+            pembayaran.lepas.set()
+            self.assertEqual((await a[0].readline()).decode().strip(), "OK PAID 25000000")
+            a[1].close()
+            b[1].close()
+        finally:
+            pembayaran.lepas.set()
+            await server.close()
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+import logging
+import os
+import signal
+import tempfile
+import threading
+import time
+import unittest
+from main_app import PosApp
+from money import Money
+from profiler import Profiler
+from repositories import ProductRepository
+from services import IPaymentProcessor
+
+class PembayaranLambat(IPaymentProcessor):
+    def process(self, amount: Money) -> bool:
+        time.sleep(0.05)  # Cukup lama agar tertangkap sampler stack
+        return True
+
+class TestProfiler(unittest.TestCase):
+
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+        logging.disable(logging.NOTSET)
+
+    def test_laporan_handler_posapp(self):
+        """Tes 1: Jendela profiling di sekitar checkout menghasilkan pstats, collapsed stack, dan laporan alokasi."""
+        profiler = Profiler(self.tmp.name, durasi=0, interval=0.001)
+        app = PosApp(ProductRepository(), PembayaranLambat())
+        app.add_item("P001", 1)
+        self.assertTrue(profiler.start())
+        self.assertFalse(profiler.start())  # Hanya satu jendela sekaligus
+        self.assertTrue(profiler.jalankan(app.checkout))
+        laporan = profiler.stop()
+        self.assertIsNone(profiler.stop())
+
+        with open(laporan["ringkasan"], encoding="utf-8") as f:
+            self.assertIn("_checkout", f.read())
+        with open(laporan["collapsed"], encoding="utf-8") as f:
+            baris = f.read().splitlines()
+        # Format collapsed: "frame;frame;... jumlah", akar (nama thread) di depan
+        self.assertTrue(baris)
+        stack, jumlah = baris[0].rsplit(" ", 1)
+        self.assertGreater(int(jumlah), 0)
+        self.assertTrue(any(b.startswith("MainThread;") and "process (test_profiler.py" in b for b in baris))
+        with open(laporan["alokasi"], encoding="utf-8") as f:
+            self.assertTrue(f.readline().startswith("Pertambahan memori selama jendela"))
+
+    def test_jendela_berakhir_sendiri(self):
+        """Tes 2: Jendela berdurasi ditutup otomatis dan handler setelahnya tidak lagi diprofil."""
+        profiler = Profiler(self.tmp.name, durasi=0.05)
+        profiler.start()
+        batas = time.monotonic() + 5
+        while profiler.aktif and time.monotonic() < batas:
+            time.sleep(0.01)
+        self.assertFalse(profiler.aktif)
+        self.assertEqual(len(profiler.laporan), 1)
+        self.assertEqual(profiler.jalankan(sum, [1, 2]), 3)
+
+    @unittest.skipUnless(hasattr(signal, "SIGUSR1"), "SIGUSR1 tidak tersedia di platform ini")
+    def test_sinyal_memulai_dan_menghentikan(self):
+        """Tes 3: SIGUSR1 membuka lalu menutup jendela tanpa restart proses."""
+        profiler = Profiler(self.tmp.name, durasi=0)
+        lama = signal.getsignal(signal.SIGUSR1)
+        try:
+            self.assertTrue(profiler.install_signal())
+            os.kill(os.getpid(), signal.SIGUSR1)
+            self.assertTrue(profiler.aktif)
+            os.kill(os.getpid(), signal.SIGUSR1)
+            self.assertFalse(profiler.aktif)
+        finally:
+            signal.signal(signal.SIGUSR1, lama)
+        self.assertEqual(len(profiler.laporan), 1)
+
+    def test_panggilan_panjang_tidak_memperpanjang_jendela(self):
+        """Tes 4: Jendela 0.1 detik di sekitar panggilan 0.5 detik dilaporkan 0.1 detik, dan panggilan lain tidak antre."""
+        profiler = Profiler(self.tmp.name, durasi=0.1)
+        profiler.start()
+        lepas = threading.Event()
+        panjang = threading.Thread(target=profiler.jalankan, args=(lepas.wait, 0.5))
+        panjang.start()
+        time.sleep(0.02)
+        mulai = time.monotonic()
+        self.assertEqual(profiler.jalankan(sum, [1, 2]), 3)  # Tidak menunggu panggilan terprofil
+        self.assertLess(time.monotonic() - mulai, 0.05)
+        panjang.join()
+        batas = time.monotonic() + 5
+        while profiler.aktif and time.monotonic() < batas:
+            time.sleep(0.01)
+        with open(profiler.laporan[0]["ringkasan"], encoding="utf-8") as f:
+            baris = f.read().splitlines()
+        detik = float(baris[0].split()[2])
+        self.assertLess(detik, 0.3)
+        self.assertIn("cProfile menunggu", baris[1])
+
+if __name__ == "__main__":
+    unittest.main()
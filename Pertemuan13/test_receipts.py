@@ -0,0 +1,78 @@
+import logging
+import os
+import shutil
+import tempfile
+import unittest
+from main_app import PosApp
+from money import Money
+from models import CartItem, Product
+from receipts import BinaryReceiptArchive, ReceiptJournal, ReceiptRenderer, ReceiptTemplate, decode_receipt, encode_receipt
+from repositories import ProductRepository
+from services import CashPayment
+
+class TestReceipts(unittest.TestCase):
+
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+        self.dir = tempfile.mkdtemp()
+        self.items = [
+            CartItem(Product("P001", "Laptop Gaming", 15000000), 1),
+            CartItem(Product("P002", "Mouse Wireless", 250000), 2),
+        ]
+        self.total = Money.of(15500000)
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+        logging.disable(logging.NOTSET)
+
+    def test_render_satu_buffer(self):
+        """Tes 1: Template default menghasilkan format struk lama dalam satu string."""
+        teks = ReceiptRenderer().render(self.items, self.total)
+        self.assertEqual(teks, (
+            "\n--- STRUK PEMBELIAN ---\n"
+            " Laptop Gaming x1 = Rp15,000,000\n"
+            " Mouse Wireless x2 = Rp500,000\n"
+            "-----------------------\n"
+            "TOTAL AKHIR: Rp15,500,000\n"
+            "-----------------------\n"
+        ))
+        kustom = ReceiptRenderer(ReceiptTemplate(header="#{nomor}\n", baris="{id};{qty};{harga.sen}\n", footer="={total.sen}\n"))
+        self.assertEqual(kustom.render(self.items, self.total, nomor=7), "#7\nP001;1;1500000000\nP002;2;25000000\n=1550000000\n")
+
+    def test_jurnal_dirotasi_tanpa_memotong_struk(self):
+        """Tes 2: Jurnal dirotasi per ukuran; setiap file hanya berisi struk utuh."""
+        path = os.path.join(self.dir, "struk.log")
+        journal = ReceiptJournal(path, max_bytes=400, backup_count=2)
+        teks = ReceiptRenderer().render(self.items, self.total)
+        for _ in range(10):
+            journal.write(teks)
+        journal.close()
+        self.assertEqual(sorted(os.listdir(self.dir)), ["struk.log", "struk.log.1", "struk.log.2"])
+        for nama in os.listdir(self.dir):
+            with open(os.path.join(self.dir, nama), encoding="utf-8") as f:
+                isi = f.read()
+            self.assertLessEqual(len(isi.encode()), 400)
+            self.assertEqual(isi, teks * (len(isi) // len(teks)))
+
+    def test_arsip_biner_dan_posapp(self):
+        """Tes 3: PosApp menulis jurnal dan arsip biner; arsip bisa dibaca kembali."""
+        self.assertEqual(decode_receipt(encode_receipt(self.items, self.total, 3, 1.5)).items[1],
+                         ("P002", 2, Money.of(250000)))
+        journal = ReceiptJournal(os.path.join(self.dir, "struk.log"))
+        archive = BinaryReceiptArchive(os.path.join(self.dir, "struk.bin"))
+        app = PosApp(ProductRepository(), CashPayment(), receipt_journal=journal, receipt_archive=archive)
+        for product_id in ("P001", "P003"):
+            app.add_item(product_id, 2)
+            self.assertTrue(app.checkout())
+        journal.close()
+        archive.close()
+
+        arsip = list(BinaryReceiptArchive.read(archive.path))
+        self.assertEqual([r.nomor for r in arsip], [1, 2])
+        self.assertEqual(arsip[0].total, Money.of(30000000))
+        self.assertEqual(arsip[1].items, (("P003", 2, Money.of(800000)),))
+        with open(journal.path, encoding="utf-8") as f:
+            self.assertEqual(f.read().count("--- STRUK PEMBELIAN ---"), 2)
+
+if __name__ == "__main__":
+    unittest.main()
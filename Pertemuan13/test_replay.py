@@ -0,0 +1,99 @@
+import logging
+import os
+import shutil
+import tempfile
+import unittest
+from array import array
+from main_app import PosApp
+from money import Money
+from repositories import ProductRepository
+from replay import ReplayResult, replay, replay_file, replay_files, tulis_log_sintetis
+from services import IPaymentProcessor
+
+class PembayaranDicatat(IPaymentProcessor):
+    """Prosesor palsu yang mencatat jumlah setiap pembayaran."""
+    def __init__(self):
+        self.tagihan = []
+
+    def process(self, amount: Money) -> bool:
+        self.tagihan.append(amount)
+        return True
+
+class TestReplay(unittest.TestCase):
+
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+        self.dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+        logging.disable(logging.NOTSET)
+
+    def test_replay_event_ke_posapp(self):
+        """Tes 1: Event add/checkout diproses tanpa input(); produk tak dikenal dilewati."""
+        pembayaran = PembayaranDicatat()
+        app = PosApp(ProductRepository(), pembayaran)
+        events = [
+            {"event": "add", "product_id": "P001", "quantity": 1},
+            {"event": "add", "product_id": "P999", "quantity": 1},
+            {"event": "add", "product_id": "P002", "quantity": "2"},
+            {"event": "checkout"},
+            {"event": "checkout"},  # Keranjang kosong -> gagal
+        ]
+        hasil = replay(app, events)
+        self.assertEqual((hasil.events, hasil.sukses, hasil.gagal), (5, 1, 1))
+        self.assertEqual(pembayaran.tagihan, [Money.of(15500000)])
+        self.assertEqual(len(hasil.latensi_ns), 2)
+
+    def test_persentil(self):
+        """Tes 2: Persentil nearest-rank dalam milidetik."""
+        hasil = ReplayResult("x", latensi_ns=array('q', range(1_000_000, 101_000_000, 1_000_000)))
+        self.assertEqual(hasil.persentil(50), 50.0)
+        self.assertEqual(hasil.persentil(99), 99.0)
+        self.assertEqual(hasil.persentil(100), 100.0)
+
+    def test_replay_banyak_file_paralel(self):
+        """Tes 3: File JSONL dan CSV diputar di worker terpisah dan hasilnya digabung."""
+        ids = [p.id for p in ProductRepository().get_all()]
+        paths = [os.path.join(self.dir, "a.jsonl"), os.path.join(self.dir, "b.csv")]
+        for i, path in enumerate(paths):
+            tulis_log_sintetis(path, 200, ids, seed=i)
+        per_file, total = replay_files(paths, workers=2)
+        self.assertEqual([h.transaksi for h in per_file], [200, 200])
+        self.assertEqual((total.sukses, total.gagal), (400, 0))
+        self.assertEqual(len(total.latensi_ns), 400)
+        self.assertGreater(total.tps, 0)
+
+    def test_event_rusak_dilewati(self):
+        """Tes 4: Event tanpa product_id, quantity non-angka, atau jenis tak dikenal dilewati tanpa menghentikan replay."""
+        pembayaran = PembayaranDicatat()
+        app = PosApp(ProductRepository(), pembayaran)
+        events = [
+            {"event": "add", "quantity": 1},
+            {"event": "add", "product_id": "P001", "quantity": "dua"},
+            {"event": "refund"},
+            {"event": "add", "product_id": "P002", "quantity": 1},
+            {"event": "checkout"},
+        ]
+        logging.disable(logging.NOTSET)
+        with self.assertLogs("REPLAY", logging.WARNING) as log:
+            hasil = replay(app, events)
+        self.assertEqual(len(log.records), 3)
+        self.assertEqual((hasil.events, hasil.dilewati, hasil.sukses), (5, 3, 1))
+        self.assertEqual(pembayaran.tagihan, [Money.of(250000)])
+
+    def test_baris_jsonl_rusak_dilewati(self):
+        """Tes 5: Baris JSONL terpotong dan baris yang bukan objek dihitung dilewati; replay_file tetap selesai."""
+        path = os.path.join(self.dir, "rusak.jsonl")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write('{"event": "add", "product_id": "P002", "quantity": 1}\n')
+            f.write('{"event": "add", "product_id": "P0\n')  # Terpotong
+            f.write('[1, 2]\n')
+            f.write('{"event": "checkout"}\n')
+        pembayaran = PembayaranDicatat()
+        hasil = replay_file(path, payment_processor=pembayaran)
+        self.assertEqual((hasil.events, hasil.dilewati, hasil.sukses), (4, 2, 1))
+        self.assertEqual(pembayaran.tagihan, [Money.of(250000)])
+
+if __name__ == "__main__":
+    unittest.main()
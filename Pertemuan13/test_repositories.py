@@ -0,0 +1,152 @@
+import logging
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+from models import Product
+from money import Money
+from repositories import ProductRepository, SqliteProductRepository, CachingProductRepository
+
+class TestSqliteProductRepository(unittest.TestCase):
+
+    def setUp(self):
+        """Arrange: Database SQLite baru di direktori sementara."""
+        logging.disable(logging.CRITICAL)
+        self.dir = tempfile.mkdtemp()
+        self.repo = SqliteProductRepository(os.path.join(self.dir, "produk.db"))
+
+    def tearDown(self):
+        self.repo.close()
+        shutil.rmtree(self.dir)
+        logging.disable(logging.NOTSET)
+
+    def test_import_csv_dan_lookup(self):
+        """Tes 1: Produk dari CSV bisa dicari lewat get_by_id dan get_all."""
+        csv_path = os.path.join(self.dir, "produk.csv")
+        with open(csv_path, "w", encoding="utf-8") as f:
+            f.write("id,name,price\nP001,Laptop Gaming,15000000\nP002,Mouse Wireless,250000\n")
+        self.assertEqual(self.repo.import_csv(csv_path), 2)
+        self.assertEqual(self.repo.get_by_id("P002"), Product("P002", "Mouse Wireless", 250000))
+        self.assertEqual([p.id for p in self.repo.get_all()], ["P001", "P002"])
+        self.assertIsNone(self.repo.get_by_id("P999"))
+        self.assertTrue(self.repo.update_price("P002", 200000))
+        self.assertFalse(self.repo.update_price("P999", 1))
+        self.assertEqual(self.repo.get_by_id("P002").price, Money.of(200000))
+
+    def test_add_many_per_batch(self):
+        """Tes 2: add_many menyimpan semua produk walau dipecah menjadi beberapa batch."""
+        jumlah = self.repo.add_many((Product(f"S{i:05d}", f"Produk {i}", i) for i in range(2500)), batch_size=1000)
+        self.assertEqual(jumlah, 2500)
+        self.assertEqual(len(self.repo.get_all()), 2500)
+
+    def test_lookup_dari_banyak_thread(self):
+        """Tes 3: Lookup bersamaan dari 8 thread memakai pool tanpa error."""
+        self.repo.add_many(Product(f"S{i}", f"Produk {i}", i) for i in range(100))
+        error = []
+
+        def baca():
+            try:
+                for i in range(100):
+                    assert self.repo.get_by_id(f"S{i}").price == Money.of(i)
+            except Exception as e:
+                error.append(e)
+
+        threads = [threading.Thread(target=baca) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(error, [])
+
+    def test_database_memori_dipakai_bersama(self):
+        """Tes 4: Repository ":memory:" memakai satu koneksi sehingga data terlihat dari semua thread."""
+        repo = SqliteProductRepository(":memory:")
+        try:
+            self.assertEqual(repo.pool.size, 1)
+            repo.add_many([Product("M1", "Memori", 1000)])
+            hasil = []
+            t = threading.Thread(target=lambda: hasil.append(repo.get_by_id("M1")))
+            t.start()
+            t.join()
+            self.assertEqual(hasil, [Product("M1", "Memori", 1000)])
+        finally:
+            repo.close()
+
+class RepositoryHitung(ProductRepository):
+    """ProductRepository yang menghitung akses ke lapisan data asli."""
+    def __init__(self):
+        super().__init__()
+        self.akses = 0
+
+    def get_all(self):
+        self.akses += 1
+        return super().get_all()
+
+    def get_by_id(self, product_id):
+        self.akses += 1
+        return super().get_by_id(product_id)
+
+class TestCachingProductRepository(unittest.TestCase):
+
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+        self.inner = RepositoryHitung()
+        self.repo = CachingProductRepository(self.inner, max_size=2, ttl=60)
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+
+    def test_read_through(self):
+        """Tes 1: Scan berulang hanya menyentuh repository asli sekali."""
+        for _ in range(5):
+            self.assertEqual(self.repo.get_by_id("P001").name, "Laptop Gaming")
+        self.assertEqual(self.inner.akses, 1)
+        self.assertEqual((self.repo.hits, self.repo.misses), (4, 1))
+
+    def test_snapshot_get_all(self):
+        """Tes 2: get_all memakai snapshot yang sama sampai di-invalidasi."""
+        self.assertIs(self.repo.get_all(), self.repo.get_all())
+        self.assertEqual(self.inner.akses, 1)
+
+    def test_update_harga_menginvalidasi(self):
+        """Tes 3: Perubahan harga langsung terlihat di get_by_id dan get_all."""
+        self.repo.get_by_id("P002")
+        self.repo.get_all()
+        self.assertTrue(self.repo.update_price("P002", 200000))
+        self.assertEqual(self.repo.get_by_id("P002").price, Money.of(200000))
+        self.assertEqual([p.price for p in self.repo.get_all() if p.id == "P002"], [Money.of(200000)])
+
+    def test_eviksi_lru(self):
+        """Tes 4 (Boundary): Cache berukuran 2 membuang produk yang paling lama tidak dipakai."""
+        for product_id in ("P001", "P002", "P001", "P003"):
+            self.repo.get_by_id(product_id)
+        self.assertEqual(self.repo.evictions, 1)
+        self.repo.get_by_id("P001")
+        self.assertEqual(self.repo.stats()["hits"], 2)
+
+    def test_ttl_kedaluwarsa(self):
+        """Tes 5: Entri yang melewati TTL dibaca ulang dari repository asli."""
+        repo = CachingProductRepository(self.inner, ttl=0.01)
+        repo.get_by_id("P001")
+        time.sleep(0.02)
+        repo.get_by_id("P001")
+        self.assertEqual(self.inner.akses, 2)
+
+    def test_invalidasi_saat_membaca_tidak_meng_cache_harga_lama(self):
+        """Tes 6 (Race): Harga yang diubah selagi miss sedang membaca tidak tertimpa nilai lama di cache."""
+        class Balapan(RepositoryHitung):
+            def get_by_id(self, product_id):
+                lama = super().get_by_id(product_id)
+                if self.akses == 1:  # Penulis lain mengubah harga di tengah pembacaan pertama
+                    self.update_price(product_id, 1)
+                    repo.invalidate(product_id)
+                return lama
+
+        repo = CachingProductRepository(Balapan())
+        self.assertEqual(repo.get_by_id("P001").name, "Laptop Gaming")
+        self.assertEqual(repo.get_by_id("P001").price, Money.of(1))
+
+if __name__ == '__main__':
+    unittest.main()
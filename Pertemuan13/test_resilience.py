@@ -0,0 +1,157 @@
+import logging
+import threading
+import time
+import unittest
+from money import Money
+from resilience import CircuitBreaker, ResilientPaymentProcessor
+from services import IPaymentProcessor, CashPayment
+
+class ProsesorPalsu(IPaymentProcessor):
+    """
+    Fake prosesor dengan skrip per panggilan: angka = latensi (detik) lalu sukses,
+    exception = dilempar, bool = jawaban langsung. Panggilan setelah skrip habis sukses seketika.
+    """
+    def __init__(self, *skrip):
+        self.skrip = list(skrip)
+        self.panggilan = 0
+        self.lepas = threading.Event()  # Melepas panggilan yang "menggantung" saat tes selesai
+        self._lock = threading.Lock()
+
+    def process(self, amount: Money) -> bool:
+        with self._lock:
+            self.panggilan += 1
+            langkah = self.skrip.pop(0) if self.skrip else True
+        if isinstance(langkah, BaseException):
+            raise langkah
+        if isinstance(langkah, bool):
+            return langkah
+        self.lepas.wait(langkah)
+        return True
+
+class JamPalsu:
+    def __init__(self):
+        self.sekarang = 0.0
+
+    def __call__(self) -> float:
+        return self.sekarang
+
+class TestResilientPaymentProcessor(unittest.TestCase):
+
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+        self.jumlah = Money.of(50000)
+        self.prosesor: list[ResilientPaymentProcessor] = []
+
+    def tearDown(self):
+        for p in self.prosesor:
+            p.inner.lepas.set()
+            p.close(wait=True)
+        logging.disable(logging.NOTSET)
+
+    def buat(self, inner: ProsesorPalsu, **kwargs) -> ResilientPaymentProcessor:
+        kwargs.setdefault("sleep", lambda detik: None)
+        p = ResilientPaymentProcessor(inner, **kwargs)
+        self.prosesor.append(p)
+        return p
+
+    def test_timeout_tidak_memblokir_kasir(self):
+        """
+        Tes 1: Terminal yang menggantung diputus setelah timeout tanpa retry. Fallback tidak dipakai
+        (tagihan utama mungkin tetap masuk) kecuali fallback_on_timeout diaktifkan.
+        """
+        mulai = time.monotonic()
+        self.assertFalse(self.buat(ProsesorPalsu(30), timeout=0.05).process(self.jumlah))
+        fallback = ProsesorPalsu()
+        self.assertFalse(self.buat(ProsesorPalsu(30), timeout=0.05, fallback=fallback).process(self.jumlah))
+        self.assertEqual(fallback.panggilan, 0)
+        inner = ProsesorPalsu(30)
+        p = self.buat(inner, timeout=0.05, fallback=CashPayment(), fallback_on_timeout=True)
+        self.assertTrue(p.process(self.jumlah))
+        self.assertLess(time.monotonic() - mulai, 2)
+        self.assertEqual(inner.panggilan, 1)
+
+    def test_retry_dengan_jitter(self):
+        """Tes 2: Error koneksi di-retry dengan jeda acak yang dibatasi backoff eksponensial; penolakan tidak di-retry."""
+        jeda = []
+        inner = ProsesorPalsu(ConnectionError("putus"), ConnectionError("putus"), True)
+        p = self.buat(inner, retries=2, backoff=0.1, sleep=jeda.append)
+        self.assertTrue(p.process(self.jumlah))
+        self.assertEqual(inner.panggilan, 3)
+        self.assertEqual(len(jeda), 2)
+        self.assertTrue(0 <= jeda[0] <= 0.1 and 0 <= jeda[1] <= 0.2)
+
+        ditolak = ProsesorPalsu(False)
+        self.assertFalse(self.buat(ditolak, retries=2).process(self.jumlah))
+        self.assertEqual(ditolak.panggilan, 1)
+
+        rusak = ProsesorPalsu(ValueError("data kartu rusak"))
+        self.assertFalse(self.buat(rusak, retries=2).process(self.jumlah))
+        self.assertEqual(rusak.panggilan, 1)
+
+    def test_circuit_breaker_fail_fast(self):
+        """Tes 3: Setelah ambang kegagalan, panggilan ditolak tanpa menyentuh backend sampai reset_timeout lewat."""
+        jam = JamPalsu()
+        inner = ProsesorPalsu(*[ConnectionError("down")] * 4)
+        p = self.buat(inner, retries=1, breaker=CircuitBreaker(failure_threshold=3, reset_timeout=10, clock=jam))
+        self.assertFalse(p.process(self.jumlah))
+        self.assertFalse(p.process(self.jumlah))  # Kegagalan ke-3 membuka sirkuit, retry berikutnya dibatalkan
+        self.assertEqual((inner.panggilan, p.breaker.state), (3, CircuitBreaker.OPEN))
+        self.assertFalse(p.process(self.jumlah))
+        self.assertEqual(inner.panggilan, 3)  # Fail fast
+
+        jam.sekarang = 11
+        self.assertEqual(p.breaker.state, CircuitBreaker.HALF_OPEN)
+        self.assertFalse(p.process(self.jumlah))  # Percobaan half-open gagal -> terbuka lagi
+        self.assertEqual((inner.panggilan, p.breaker.state), (4, CircuitBreaker.OPEN))
+        jam.sekarang = 22
+        self.assertTrue(p.process(self.jumlah))
+        self.assertEqual(p.breaker.state, CircuitBreaker.CLOSED)
+
+    def test_hedging_ke_fallback(self):
+        """Tes 4: Prosesor utama yang lambat di-hedge ke fallback; jawaban utama yang terlambat dicatat untuk rekonsiliasi."""
+        logging.disable(logging.NOTSET)
+        cepat = ProsesorPalsu(0.0)
+        fallback = ProsesorPalsu()
+        self.assertTrue(self.buat(cepat, hedge_after=0.5, fallback=fallback).process(self.jumlah))
+        self.assertEqual(fallback.panggilan, 0)
+
+        lambat = ProsesorPalsu(0.3)
+        p = self.buat(lambat, timeout=5, hedge_after=0.02, fallback=CashPayment())
+        with self.assertLogs("RESILIENCE", logging.WARNING) as log:
+            mulai = time.monotonic()
+            self.assertTrue(p.process(self.jumlah))
+            self.assertLess(time.monotonic() - mulai, 0.25)
+            batas = time.monotonic() + 5
+            while not any("rekonsiliasi" in baris for baris in log.output) and time.monotonic() < batas:
+                time.sleep(0.01)
+        self.assertTrue(any("rekonsiliasi" in baris for baris in log.output))
+
+    def test_half_open_dengan_hedging(self):
+        """Tes 5: Saat fallback menang di half-open, hasil terlambat prosesor utama tetap menutup sirkuit."""
+        jam = JamPalsu()
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10, clock=jam)
+        breaker.record_failure()
+        jam.sekarang = 11
+        inner = ProsesorPalsu(0.3)
+        p = self.buat(inner, timeout=5, hedge_after=0.02, fallback=CashPayment(), breaker=breaker)
+        self.assertTrue(p.process(self.jumlah))  # Fallback menang
+        batas = time.monotonic() + 5
+        while breaker.state != CircuitBreaker.CLOSED and time.monotonic() < batas:
+            time.sleep(0.01)
+        self.assertEqual(breaker.state, CircuitBreaker.CLOSED)
+        for _ in range(3):
+            self.assertTrue(p.process(self.jumlah))
+        self.assertEqual(inner.panggilan, 4)
+
+    def test_pool_penuh_tidak_menagih_belakangan(self):
+        """Tes 6: Pembayaran yang gagal karena semua slot menggantung tidak pernah dijalankan kemudian."""
+        inner = ProsesorPalsu(30, 30)
+        p = self.buat(inner, timeout=0.1, max_workers=1, retries=0)
+        self.assertFalse(p.process(self.jumlah))
+        self.assertFalse(p.process(self.jumlah))  # Slot masih dipakai panggilan pertama: gagal cepat
+        inner.lepas.set()
+        p.close(wait=True)
+        self.assertEqual(inner.panggilan, 1)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,73 @@
+import logging
+import unittest
+from models import Product
+from money import Money
+from repositories import CachingProductRepository, ProductRepository, SqliteProductRepository
+from search import ProductSearchIndex
+
+class TestProductSearchIndex(unittest.TestCase):
+
+    def setUp(self):
+        """Arrange: Indeks di atas repository simulasi (P001-P003)."""
+        logging.disable(logging.CRITICAL)
+        self.repo = ProductRepository()
+        self.index = ProductSearchIndex(self.repo)
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+
+    def ids(self, query: str) -> list[str]:
+        return [p.id for p in self.index.search(query)]
+
+    def test_prefix_id(self):
+        """Tes 1: Prefix ID tidak peka huruf besar/kecil dan urut."""
+        self.assertEqual(self.ids("p00"), ["P001", "P002", "P003"])
+
+    def test_kata_dan_prefix_kata(self):
+        """Tes 2: Semua kata harus cocok; kata terakhir boleh berupa prefix."""
+        self.assertEqual(self.ids("gaming lap"), ["P001"])
+        self.assertEqual(self.ids("mouse key"), [])
+
+    def test_hasil_berupa_generator_dan_halaman(self):
+        """Tes 3: search() lazy dan page() memotong hasil per halaman."""
+        hasil = self.index.search("p")
+        self.assertEqual(next(hasil).id, "P001")
+        self.assertEqual([p.id for p in self.index.page("p", nomor=2, ukuran=2)], ["P003"])
+
+    def test_update_inkremental(self):
+        """Tes 4: Produk baru dan perubahan nama langsung tercermin di indeks."""
+        self.repo._products["P004"] = Product("P004", "Mouse Pad", 50000)
+        self.index.upsert(self.repo._products["P004"])
+        self.assertEqual(self.ids("mouse"), ["P004", "P002"])
+        self.index.upsert(Product("P004", "Alas Meja", 50000))
+        self.assertEqual(self.ids("mouse"), ["P002"])
+        self.index.remove("P002")
+        self.assertEqual(self.ids("mouse"), [])
+
+    def test_harga_terbaru_dari_repository(self):
+        """Tes 5: Hasil pencarian memakai harga terbaru dari repository."""
+        self.repo.update_price("P003", 750000)
+        self.assertEqual(next(self.index.search("keyboard")).price, Money.of(750000))
+
+    def test_indeks_mengikuti_repository_sqlite_dengan_cache(self):
+        """Tes 6: Update harga lalu search, dan add_many/import langsung ke SQLite, tercermin tanpa rebuild manual."""
+        sqlite = SqliteProductRepository(":memory:")
+        self.addCleanup(sqlite.close)
+        sqlite.add_many(ProductRepository().get_all())
+        repo = CachingProductRepository(sqlite)
+        index = ProductSearchIndex(repo)
+        self.assertEqual(next(index.search("keyboard")).price, Money.of(800000))  # Masuk cache
+
+        repo.update_price("P003", 750000)
+        self.assertEqual(next(index.search("keyboard")).price, Money.of(750000))
+
+        # Penulisan langsung ke repository asli: produk baru, ganti nama, dan impor besar
+        sqlite.add_many([Product("P004", "Mouse Pad", 50000), Product("P003", "Keyboard Wireless", 900000)])
+        self.assertEqual([p.id for p in index.search("mouse")], ["P004", "P002"])
+        self.assertEqual([(p.id, p.price) for p in index.search("keyboard wire")], [("P003", Money.of(900000))])
+        self.assertEqual(len(repo.get_all()), 4)
+        sqlite.add_many(Product(f"Q{i:04d}", f"Kabel {i}", 1000) for i in range(ProductSearchIndex.BATAS_REBUILD))
+        self.assertEqual(next(index.search("kabel 999")).id, "Q0999")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+import logging
+import unittest
+from models import Product
+from money import Money
+from services import ShoppingCart
+
+class TestShoppingCart(unittest.TestCase):
+
+    def setUp(self):
+        """Arrange: Keranjang mode debug (total dicek ulang setiap diakses)."""
+        logging.disable(logging.CRITICAL)
+        self.cart = ShoppingCart(debug=True)
+        self.laptop = Product("P001", "Laptop Gaming", 15000000)
+        self.mouse = Product("P002", "Mouse Wireless", 250000)
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+
+    def test_running_total_add_item(self):
+        """Tes 1: Total bertambah saat item baru maupun item yang sama ditambahkan."""
+        self.cart.add_item(self.laptop)
+        self.cart.add_item(self.mouse, 2)
+        self.cart.add_item(self.mouse)
+        self.assertEqual(self.cart.total_price, Money.of(15750000))
+
+    def test_update_quantity_dan_remove(self):
+        """Tes 2: Ubah kuantitas dan hapus baris memperbarui total."""
+        self.cart.add_item(self.laptop)
+        self.cart.add_item(self.mouse, 4)
+        self.assertTrue(self.cart.update_quantity("P002", 1))
+        self.assertEqual(self.cart.total_price, Money.of(15250000))
+        self.assertTrue(self.cart.remove_item("P001"))
+        self.assertEqual(self.cart.total_price, Money.of(250000))
+        self.assertTrue(self.cart.update_quantity("P002", 0))
+        self.assertEqual(self.cart.total_price, Money.zero())
+        self.assertFalse(self.cart.remove_item("P999"))
+
+    def test_keranjang_grosir(self):
+        """Tes 3: Ribuan baris tetap konsisten dengan hitung penuh."""
+        for i in range(5000):
+            self.cart.add_item(Product(f"S{i}", f"Produk {i}", 1000 + i), 3)
+        for i in range(0, 5000, 2):
+            self.cart.update_quantity(f"S{i}", 1)
+        self.assertEqual(self.cart.total_price, self.cart.recompute_total())
+
+    def test_verify_total_mendeteksi_perubahan_langsung(self):
+        """Tes 4: Mengubah CartItem langsung (melewati method) terdeteksi di mode debug."""
+        self.cart.add_item(self.mouse)
+        self.cart.items["P002"].quantity = 10
+        with self.assertRaises(AssertionError):
+            self.cart.total_price
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,121 @@
+import logging
+import threading
+import unittest
+from main_app import PosApp
+from money import Money
+from repositories import ProductRepository
+from services import IPaymentProcessor
+from stok import StripedStockRepository
+
+class JamPalsu:
+    def __init__(self):
+        self.sekarang = 0.0
+
+    def __call__(self) -> float:
+        return self.sekarang
+
+class PembayaranTetap(IPaymentProcessor):
+    def __init__(self, hasil: bool):
+        self.hasil = hasil
+
+    def process(self, amount: Money) -> bool:
+        return self.hasil
+
+class TestStripedStockRepository(unittest.TestCase):
+
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+        self.jam = JamPalsu()
+        self.stok = StripedStockRepository({"P001": 5, "P002": 100}, stripes=4, ttl=60, clock=self.jam)
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+
+    def test_reserve_commit_release(self):
+        """Tes 1: Reservasi mengurangi stok tersedia; commit mengurangi stok fisik; release mengembalikan."""
+        self.assertTrue(self.stok.reserve("a", "P001", 3))
+        self.assertFalse(self.stok.reserve("b", "P001", 3))
+        self.assertEqual(self.stok.available("P001"), 2)
+        self.assertTrue(self.stok.commit("a", "P001", 3))
+        self.assertEqual((self.stok.on_hand("P001"), self.stok.available("P001")), (2, 2))
+        self.assertTrue(self.stok.reserve("b", "P001", 2))
+        self.assertEqual(self.stok.release("b", "P001"), 2)
+        self.assertEqual(self.stok.available("P001"), 2)
+        self.assertFalse(self.stok.reserve("c", "P999", 1))
+
+    def test_reservasi_kedaluwarsa(self):
+        """Tes 2: Reservasi keranjang yang ditinggal kedaluwarsa dan stoknya bisa dipakai kasir lain."""
+        self.assertTrue(self.stok.reserve("ditinggal", "P001", 5))
+        self.jam.sekarang = 30
+        self.assertFalse(self.stok.reserve("b", "P001", 1))
+        self.jam.sekarang = 61
+        self.assertTrue(self.stok.reserve("b", "P001", 1))
+        self.assertEqual(self.stok.expired, 1)
+        # Commit holder yang reservasinya kedaluwarsa tetap berhasil selama stok masih ada
+        self.assertTrue(self.stok.commit("ditinggal", "P001", 4))
+        self.assertFalse(self.stok.commit("lain", "P001", 1))
+
+    def test_tidak_oversell_dari_banyak_thread(self):
+        """Tes 3: 16 thread berebut 100 unit; terjual tepat 100, tidak lebih."""
+        terjual = []
+        def kasir(k: int):
+            n = 0
+            for i in range(20):
+                holder = f"{k}-{i}"
+                if self.stok.reserve(holder, "P002", 1) and self.stok.commit(holder, "P002", 1):
+                    n += 1
+            terjual.append(n)
+        threads = [threading.Thread(target=kasir, args=(k,)) for k in range(16)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(sum(terjual), 100)
+        self.assertEqual(self.stok.on_hand("P002"), 0)
+
+    def test_posapp_memakai_stok(self):
+        """Tes 4: PosApp menolak item melebihi stok; pembayaran gagal mengembalikan stok ke reservasi keranjangnya."""
+        stok = StripedStockRepository({"P001": 2, "P002": 1})
+        gagal = PosApp(ProductRepository(), PembayaranTetap(False), stock=stok)
+        self.assertTrue(gagal.add_item("P001", 2))
+        self.assertFalse(PosApp(ProductRepository(), PembayaranTetap(True), stock=stok).add_item("P001", 1))
+        self.assertFalse(gagal.checkout())
+        self.assertEqual((stok.on_hand("P001"), stok.available("P001")), (2, 0))
+        self.assertFalse(PosApp(ProductRepository(), PembayaranTetap(True), stock=stok).add_item("P001", 1))
+
+        gagal.payment_processor = PembayaranTetap(True)  # Checkout ulang dengan keranjang yang sama
+        self.assertTrue(gagal.checkout())
+        self.assertEqual((stok.on_hand("P001"), stok.available("P001")), (0, 0))
+
+    def test_reservasi_kedaluwarsa_kalah_dari_kasir_lain(self):
+        """Tes 5: Keranjang yang reservasinya kedaluwarsa gagal checkout jika stoknya sudah terjual."""
+        stok = StripedStockRepository({"P001": 2, "P002": 1}, ttl=60, clock=self.jam)
+        telat = PosApp(ProductRepository(), PembayaranTetap(True), stock=stok)
+        self.assertTrue(telat.add_item("P001", 2))
+        self.jam.sekarang = 61
+
+        app = PosApp(ProductRepository(), PembayaranTetap(True), stock=stok)
+        self.assertTrue(app.add_item("P001", 2))
+        self.assertTrue(app.add_item("P002", 1))
+        self.assertTrue(app.checkout())
+        self.assertEqual((stok.on_hand("P001"), stok.on_hand("P002")), (0, 0))
+        self.assertFalse(telat.checkout())  # Pembayaran akan disetujui, tapi stok sudah habis
+        self.assertEqual(telat.transaksi, 0)
+
+    def test_pembayaran_error_mengembalikan_stok(self):
+        """Tes 6: Exception dari prosesor pembayaran tidak menghabiskan stok; reservasi keranjang dipulihkan."""
+        class PembayaranRusak(IPaymentProcessor):
+            def process(self, amount: Money) -> bool:
+                raise ConnectionError("terminal mati")
+
+        stok = StripedStockRepository({"P001": 2})
+        app = PosApp(ProductRepository(), PembayaranRusak(), stock=stok)
+        self.assertTrue(app.add_item("P001", 2))
+        with self.assertRaises(ConnectionError):
+            app.checkout()
+        self.assertEqual((stok.on_hand("P001"), stok.available("P001")), (2, 0))
+        app.close()
+        self.assertEqual(stok.available("P001"), 2)
+
+if __name__ == "__main__":
+    unittest.main()
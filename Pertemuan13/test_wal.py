@@ -0,0 +1,92 @@
+import logging
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+from main_app import PosApp, ringkas_penjualan
+from repositories import ProductRepository
+from services import CashPayment
+from wal import TransactionJournal
+
+class TestTransactionJournal(unittest.TestCase):
+
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+        self.dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.dir, "transaksi.wal")
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+        logging.disable(logging.NOTSET)
+
+    def test_group_commit_bersamaan(self):
+        """Tes 1: Append dari banyak thread semuanya tercatat berurutan dengan fsync lebih sedikit."""
+        journal = TransactionJournal(self.path)
+        journal._fsync = lambda fd: time.sleep(0.001)  # fsync lambat agar penggabungan batch terlihat
+        def kasir(k: int):
+            for i in range(50):
+                journal.append({"type": "checkout", "kasir": k, "i": i})
+        threads = [threading.Thread(target=kasir, args=(k,)) for k in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        journal.close()
+        records = list(TransactionJournal.replay(self.path))
+        self.assertEqual([seq for seq, _ in records], list(range(1, 401)))
+        self.assertEqual(len({(p["kasir"], p["i"]) for _, p in records}), 400)
+        self.assertLess(journal.fsync_count, 200)
+
+    def test_pemulihan_ekor_terpotong(self):
+        """Tes 2: Record setengah tertulis (crash) dibuang; seq berlanjut setelah record utuh terakhir."""
+        journal = TransactionJournal(self.path, group_commit=False)
+        for i in range(3):
+            journal.append({"type": "checkout", "i": i})
+        journal.close()
+        with open(self.path, "ab") as f:
+            f.write(b"\x20\x00\x00\x00garbage")  # Header terpotong di tengah penulisan
+
+        journal = TransactionJournal(self.path)
+        self.assertEqual(journal.recovered, 3)
+        self.assertEqual(journal.append({"type": "checkout", "i": 3}), 4)
+        journal.close()
+        self.assertEqual([p["i"] for _, p in TransactionJournal.replay(self.path)], [0, 1, 2, 3])
+
+    def test_batch_gagal_tidak_merusak_append_berikutnya(self):
+        """Tes 3: Batch yang gagal fsync hanya menggagalkan append-nya sendiri dan byte-nya dibuang dari file."""
+        journal = TransactionJournal(self.path)
+        journal.append({"i": 0})
+        fsync_asli = journal._fsync
+        def fsync_gagal(fd):
+            journal._fsync = fsync_asli
+            raise OSError("disk penuh")
+        journal._fsync = fsync_gagal
+        with self.assertRaises(RuntimeError):
+            journal.append({"i": 1})
+        self.assertEqual(journal.append({"i": 2}), 3)
+        self.assertEqual(journal.append({"i": 3}), 4)
+        journal.close()
+        self.assertEqual([(seq, p["i"]) for seq, p in TransactionJournal.replay(self.path)], [(1, 0), (3, 2), (4, 3)])
+        self.assertEqual(TransactionJournal(self.path).recovered, 3)
+
+    def test_posapp_dan_kompaksi(self):
+        """Tes 4: Checkout PosApp tercatat di WAL; kompaksi meringkas tanpa kehilangan total."""
+        journal = TransactionJournal(self.path, snapshot_fn=ringkas_penjualan, compact_bytes=600)
+        app = PosApp(ProductRepository(), CashPayment(), transaction_journal=journal)
+        for _ in range(10):
+            app.add_item("P002", 2)
+            app.add_item("P003")
+            self.assertTrue(app.checkout())
+        journal.close()
+
+        records = [p for _, p in TransactionJournal.replay(self.path)]
+        self.assertEqual(records[0]["type"], "snapshot")  # Log sudah dikompaksi otomatis
+        ringkasan = ringkas_penjualan(records)
+        self.assertEqual(ringkasan["transaksi"], 10)
+        self.assertEqual(ringkasan["total_sen"], 10 * (2 * 25000000 + 80000000))
+        self.assertEqual(ringkasan["qty_per_produk"], {"P002": 20, "P003": 10})
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,55 @@
+import os
+import random
+import sys
+import time
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, os.pardir, "bersama"))  # modul bersama: money, wal, metrics, profiler
+from diskon_service import DiskonCalculator
+from money import Money
+from pricing_pipeline import DiskonBertingkatStage, DiskonPersenStage, PajakStage, PricingPipeline, VoucherStage
+
+def buat_katalog(jumlah: int, titik_harga: int, seed: int = 7) -> list[Money]:
+    """Katalog sintetis: banyak SKU berbagi sedikit titik harga (misalnya Rp9.900, Rp19.900)."""
+    rng = random.Random(seed)
+    harga = [Money.of(rng.randint(1, 5000) * 1000 - 100) for _ in range(titik_harga)]
+    return [rng.choice(harga) for _ in range(jumlah)]
+
+def ukur(nama: str, fungsi) -> float:
+    mulai = time.perf_counter()
+    fungsi()
+    durasi = time.perf_counter() - mulai
+    print(f"{nama:<28} {durasi * 1000:8.1f} ms")
+    return durasi
+
+if __name__ == "__main__":
+    katalog = buat_katalog(200_000, 500)
+    print(f"Reprice {len(katalog):,} SKU ({len(set(katalog))} titik harga), diskon 15%")
+
+    # 1. Beban yang sama (diskon persen + PPN 10%): DiskonCalculator vs pipeline standar
+    calc = DiskonCalculator()
+    standar_tanpa_memo = PricingPipeline.standar(memo_size=0)
+    standar_memo = PricingPipeline.standar(memo_size=4096)
+    print("\n[Diskon + PPN, tahap sama]")
+    t_calc = ukur("DiskonCalculator per SKU", lambda: [calc.hitung_diskon(h, 15) for h in katalog])
+    t_standar = ukur("Pipeline tanpa memo", lambda: standar_tanpa_memo.hitung_banyak(katalog, 15))
+    t_standar_memo = ukur("Pipeline dengan memo", lambda: standar_memo.hitung_banyak(katalog, 15))
+    print(f"Speedup memo vs DiskonCalculator: {t_calc / t_standar_memo:.1f}x "
+          f"(pipeline tanpa memo: {t_calc / t_standar:.1f}x)")
+    assert [calc.hitung_diskon(h, 15) for h in katalog] == standar_memo.hitung_banyak(katalog, 15)
+
+    # 2. Beban berbeda (tidak dibandingkan dengan DiskonCalculator): empat tahap termasuk
+    #    diskon bertingkat dan voucher, tanpa vs dengan memo
+    stages = [
+        DiskonBertingkatStage([(Money.of(100000), 5), (Money.of(1000000), 10)]),
+        DiskonPersenStage(),
+        VoucherStage(Money.of(5000)),
+        PajakStage(10),
+    ]
+    tanpa_memo = PricingPipeline(stages, memo_size=0)
+    dengan_memo = PricingPipeline(stages, memo_size=4096)
+    print("\n[Pipeline 4 tahap: bertingkat + diskon + voucher + PPN]")
+    t_tanpa = ukur("Pipeline tanpa memo", lambda: tanpa_memo.hitung_banyak(katalog, 15))
+    t_memo = ukur("Pipeline dengan memo", lambda: dengan_memo.hitung_banyak(katalog, 15))
+    info = dengan_memo.cache_info()
+    print(f"Hit rate memo: {info['hit_rate']:.1%} ({info['hits']:,} hit, {info['misses']:,} miss)")
+    print(f"Speedup memo: {t_tanpa / t_memo:.1f}x")
+    assert tanpa_memo.hitung_banyak(katalog, 15) == dengan_memo.hitung_banyak(katalog, 15)
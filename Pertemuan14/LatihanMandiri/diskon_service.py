@@ -25,11 +25,28 @@
 # ============ PROGRAM FINAL TANPA BUG DENGAN PDB  ==============
 
 import pdb
+from array import array
+from decimal import ROUND_HALF_UP
+from itertools import islice, repeat
+from typing import Iterable, Iterator
+from money import Money, bagi_bulat
 
 class DiskonCalculator:
     """Menghitung harga akhir setelah diskon."""
 
-    def hitung_diskon(self, harga_awal: float, persentase_diskon: int) -> float:
+    PPN_PERSEN = 10
+    # Mode pembulatan ke sen (konstanta modul decimal), dipakai jika harga berupa Money
+    PEMBULATAN_DISKON = ROUND_HALF_UP
+    PEMBULATAN_PPN = ROUND_HALF_UP
+
+    def hitung_diskon(self, harga_awal: float | Money, persentase_diskon: int) -> float | Money:
+        """
+        Menghitung harga akhir (diskon lalu PPN 10%).
+        Jika harga_awal berupa Money, hasilnya Money yang eksak (dibulatkan ke sen);
+        jika berupa angka, dihitung dengan float seperti sebelumnya.
+        """
+        if isinstance(harga_awal, Money):
+            return self._hitung_diskon_money(harga_awal, persentase_diskon)
 
         # Validasi boundary
         if harga_awal <= 0:
@@ -46,4 +63,95 @@ class DiskonCalculator:
         ppn = harga_setelah_diskon * 0.10
         harga_akhir = harga_setelah_diskon + ppn
 
-        return harga_akhir
\ No newline at end of file
+        return harga_akhir
+
+    def _hitung_diskon_money(self, harga_awal: Money, persentase_diskon: int) -> Money:
+        # Boundary sama dengan jalur float
+        if harga_awal.sen <= 0:
+            return Money.zero()
+        if persentase_diskon < 0:
+            return harga_awal
+        if persentase_diskon > 100:
+            persentase_diskon = 100
+
+        jumlah_diskon = harga_awal.persen(persentase_diskon, self.PEMBULATAN_DISKON)
+        harga_setelah_diskon = harga_awal - jumlah_diskon
+
+        # PPN dibulatkan sekali, lalu ditambahkan sekali
+        ppn = harga_setelah_diskon.persen(self.PPN_PERSEN, self.PEMBULATAN_PPN)
+        return harga_setelah_diskon + ppn
+
+    # --- Batch (reprice katalog) ---
+    def hitung_diskon_batch(self, harga: Iterable[float], persen: "int | Iterable[int]") -> array:
+        """
+        Versi batch hitung_diskon untuk satu chunk katalog.
+        Args:
+            harga: Harga per produk. array('q') dianggap harga dalam sen (hasil eksak seperti
+                Money, array('q')); selain itu dihitung float (hasil array('d')).
+            persen: Satu persentase untuk semua produk, atau satu per produk (panjangnya harus sama
+                dengan `harga`; ValueError jika berbeda).
+        Returns:
+            array: Harga akhir; hasil float identik bit-per-bit dengan hitung_diskon per produk.
+        """
+        # Persentase per produk harus sejajar dengan harga; repeat() untuk satu persentase tidak pernah habis
+        strict = not isinstance(persen, int)
+        if not strict:
+            persen = repeat(persen)
+        if isinstance(harga, array) and harga.typecode == 'q':
+            return self._hitung_diskon_batch_sen(harga, persen, strict)
+
+        # Urutan operasi sama persis dengan jalur skalar agar pembulatan float-nya identik
+        hasil = array('d')
+        for h, p in zip(map(float, harga), persen, strict=strict):
+            if h <= 0:
+                hasil.append(0.0)
+            elif p < 0:
+                hasil.append(h)
+            else:
+                if p > 100:
+                    p = 100
+                setelah = h - h * p / 100
+                hasil.append(setelah + setelah * 0.10)
+        return hasil
+
+    def _hitung_diskon_batch_sen(self, harga_sen: array, persen: Iterable[int], strict: bool) -> array:
+        pembulatan_diskon, pembulatan_ppn, ppn_persen = self.PEMBULATAN_DISKON, self.PEMBULATAN_PPN, self.PPN_PERSEN
+        hasil = array('q')
+        for h, p in zip(harga_sen, persen, strict=strict):
+            if h <= 0:
+                hasil.append(0)
+            elif p < 0:
+                hasil.append(h)
+            else:
+                if p > 100:
+                    p = 100
+                setelah = h - bagi_bulat(h * p, 100, pembulatan_diskon)
+                hasil.append(setelah + bagi_bulat(setelah * ppn_persen, 100, pembulatan_ppn))
+        return hasil
+
+    def hitung_diskon_stream(
+        self,
+        harga: Iterable[float],
+        persen: "int | Iterable[int]",
+        ukuran_chunk: int = 65536,
+        sen: bool = False,
+    ) -> Iterator[array]:
+        """
+        Reprice katalog yang lebih besar dari memori: membaca `harga` (dan `persen`) secara lazy
+        dan menghasilkan satu array hasil per chunk berisi paling banyak `ukuran_chunk` produk.
+        Jika sen=True, harga dibaca sebagai integer sen dan dihitung eksak.
+        ValueError jika `persen` per produk lebih pendek atau lebih panjang dari `harga`.
+        """
+        if ukuran_chunk <= 0:
+            raise ValueError("ukuran_chunk harus lebih dari 0.")
+        harga = iter(harga)
+        if not isinstance(persen, int):
+            persen = iter(persen)
+        while True:
+            chunk = array('q' if sen else 'd', islice(harga, ukuran_chunk))
+            if not chunk:
+                if not isinstance(persen, int) and next(persen, None) is not None:
+                    raise ValueError("persen lebih panjang dari harga.")
+                return
+            p = persen if isinstance(persen, int) else list(islice(persen, len(chunk)))
+            yield self.hitung_diskon_batch(chunk, p)
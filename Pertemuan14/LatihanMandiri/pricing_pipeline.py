@@ -0,0 +1,142 @@
+from abc import ABC, abstractmethod
+from decimal import ROUND_HALF_UP
+from functools import lru_cache
+from typing import Callable, Iterable, Sequence
+from money import Money, bagi_bulat
+
+# Fungsi hasil kompilasi: (harga dalam sen, persentase diskon input) -> harga dalam sen
+FungsiHarga = Callable[[int, int], int]
+
+# --- ABSTRAKSI TAHAP (Stage) ---
+class IPricingStage(ABC):
+    """Kontrak: Satu tahap pipeline harga yang bisa dikompilasi menjadi fungsi integer (sen)."""
+    @abstractmethod
+    def compile(self) -> FungsiHarga:
+        pass
+
+# --- IMPLEMENTASI TAHAP ---
+class DiskonPersenStage(IPricingStage):
+    """Diskon persentase dari input; di atas 100 dianggap 100."""
+    def __init__(self, rounding: str = ROUND_HALF_UP):
+        self.rounding = rounding
+
+    def compile(self) -> FungsiHarga:
+        rounding = self.rounding
+        def diskon_persen(sen: int, persen: int) -> int:
+            if persen <= 0:
+                return sen
+            if persen > 100:
+                persen = 100
+            return sen - bagi_bulat(sen * persen, 100, rounding)
+        return diskon_persen
+
+class VoucherStage(IPricingStage):
+    """Potongan nominal tetap; harga tidak pernah di bawah nol."""
+    def __init__(self, potongan: Money):
+        if potongan.sen < 0:
+            raise ValueError("Potongan voucher tidak boleh negatif.")
+        self.potongan = potongan
+
+    def compile(self) -> FungsiHarga:
+        potongan = self.potongan.sen
+        def voucher(sen: int, persen: int) -> int:
+            return sen - potongan if sen > potongan else 0
+        return voucher
+
+class DiskonBertingkatStage(IPricingStage):
+    """
+    Diskon berdasarkan harga: dipakai persentase dari tingkat dengan ambang tertinggi
+    yang <= harga. Contoh: [(Money.of(100000), 5), (Money.of(1000000), 10)].
+    """
+    def __init__(self, tingkat: Iterable[tuple[Money, int]], rounding: str = ROUND_HALF_UP):
+        self.tingkat = sorted(tingkat, key=lambda t: t[0])
+        if any(not 0 <= persen <= 100 for _, persen in self.tingkat):
+            raise ValueError("Persentase tingkat harus di antara 0 dan 100.")
+        self.rounding = rounding
+
+    def compile(self) -> FungsiHarga:
+        # Diperiksa dari ambang tertinggi agar tingkat pertama yang cocok langsung dipakai
+        tingkat = [(ambang.sen, persen) for ambang, persen in reversed(self.tingkat)]
+        rounding = self.rounding
+        def diskon_bertingkat(sen: int, persen_input: int) -> int:
+            for ambang, persen in tingkat:
+                if sen >= ambang:
+                    return sen - bagi_bulat(sen * persen, 100, rounding)
+            return sen
+        return diskon_bertingkat
+
+class PajakStage(IPricingStage):
+    """Pajak (default PPN 10%) ditambahkan sekali, dibulatkan ke sen."""
+    def __init__(self, persen: int = 10, rounding: str = ROUND_HALF_UP):
+        self.persen = persen
+        self.rounding = rounding
+
+    def compile(self) -> FungsiHarga:
+        tarif, rounding = self.persen, self.rounding
+        def pajak(sen: int, persen: int) -> int:
+            return sen + bagi_bulat(sen * tarif, 100, rounding)
+        return pajak
+
+# --- PIPELINE ---
+class PricingPipeline:
+    """
+    Menyusun tahap-tahap harga menjadi satu fungsi evaluasi dengan memo LRU per
+    (harga, persentase). Boundary sama seperti DiskonCalculator: harga <= 0 menghasilkan 0,
+    persentase negatif (tidak valid) mengembalikan harga tanpa perubahan.
+    """
+    def __init__(self, stages: Sequence[IPricingStage], memo_size: int | None = 4096):
+        self.stages = tuple(stages)
+        self.memo_size = memo_size
+        self._evaluasi = self._compile()
+
+    @classmethod
+    def standar(cls, memo_size: int | None = 4096) -> "PricingPipeline":
+        """Diskon persentase lalu PPN 10%, setara DiskonCalculator.hitung_diskon untuk Money."""
+        return cls([DiskonPersenStage(), PajakStage(10)], memo_size)
+
+    @classmethod
+    def tanpa_ppn(cls, memo_size: int | None = 4096) -> "PricingPipeline":
+        """Diskon persentase saja, seperti varian diskon_service.py di Pertemuan14."""
+        return cls([DiskonPersenStage()], memo_size)
+
+    def _compile(self) -> FungsiHarga:
+        fungsi = tuple(stage.compile() for stage in self.stages)
+
+        def evaluasi(sen: int, persen: int) -> int:
+            if sen <= 0:
+                return 0
+            if persen < 0:
+                return sen
+            for f in fungsi:
+                sen = f(sen, persen)
+            return sen
+
+        if self.memo_size == 0:
+            return evaluasi
+        # Kunci memo hanya dua int, jadi murah di-hash; sebagian besar SKU berbagi titik harga
+        return lru_cache(maxsize=self.memo_size)(evaluasi)
+
+    def hitung(self, harga: Money, persentase_diskon: int = 0) -> Money:
+        """Menghitung harga akhir satu produk."""
+        return Money(self._evaluasi(harga.sen, persentase_diskon))
+
+    def hitung_banyak(self, harga: Iterable[Money], persentase_diskon: int = 0) -> list[Money]:
+        evaluasi = self._evaluasi
+        return [Money(evaluasi(h.sen, persentase_diskon)) for h in harga]
+
+    # --- Statistik memo ---
+    def cache_info(self) -> dict:
+        if not hasattr(self._evaluasi, "cache_info"):
+            return {"hits": 0, "misses": 0, "size": 0, "hit_rate": 0.0}
+        info = self._evaluasi.cache_info()
+        total = info.hits + info.misses
+        return {
+            "hits": info.hits,
+            "misses": info.misses,
+            "size": info.currsize,
+            "hit_rate": info.hits / total if total else 0.0,
+        }
+
+    def clear_cache(self):
+        if hasattr(self._evaluasi, "cache_clear"):
+            self._evaluasi.cache_clear()
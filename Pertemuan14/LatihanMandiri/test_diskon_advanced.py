@@ -1,5 +1,8 @@
+import random
 import unittest
+from array import array
 from diskon_service import DiskonCalculator
+from money import Money
 
 class TestDiskonLanjut(unittest.TestCase):
 
@@ -22,5 +25,56 @@ class TestDiskonLanjut(unittest.TestCase):
         hasil = self.calc.hitung_diskon(0, 10)
         self.assertEqual(hasil, 0.0)
 
+    # Test 7 – Money (eksak)
+    def test_diskon_money_33_persen(self):
+        """
+        Diskon 33% dari Rp999,00 dalam sen:
+        Diskon = 329,67 (HALF_UP), setelah diskon = 669,33
+        PPN 10% = 66,933 -> 66,93
+        Total = 736,26 (tepat, tanpa assertAlmostEqual)
+        """
+        hasil = self.calc.hitung_diskon(Money.of(999), 33)
+        self.assertEqual(hasil, Money.of("736.26"))
+
+    # Test 8 – Money boundary & total besar
+    def test_money_boundary_dan_total_eksak(self):
+        self.assertEqual(self.calc.hitung_diskon(Money.zero(), 10), Money.zero())
+        self.assertEqual(self.calc.hitung_diskon(Money.of(1000), -5), Money.of(1000))
+        self.assertEqual(self.calc.hitung_diskon(Money.of(1000), 150), Money.zero())
+        # Penjumlahan satu juta harga tetap eksak (float akan menumpuk galat)
+        harga = [Money.of("0.10")] * 1_000_000
+        self.assertEqual(Money.total(harga), Money.of(100000))
+
+    # Test 9 – Batch identik dengan skalar
+    def test_batch_identik_dengan_skalar(self):
+        rng = random.Random(42)
+        harga = [0, -5, 999, 1000.5] + [rng.uniform(0, 1e7) for _ in range(5000)]
+        persen = [10, 10, 33, -1] + [rng.randint(-10, 120) for _ in range(5000)]
+        hasil = self.calc.hitung_diskon_batch(harga, persen)
+        for h, p, b in zip(harga, persen, hasil):
+            self.assertEqual(float(self.calc.hitung_diskon(h, p)).hex(), b.hex())
+
+    # Test 10 – Batch sen eksak & streaming per chunk
+    def test_batch_sen_dan_stream(self):
+        harga_sen = array('q', [99900, 0, 100000, 123456789])
+        hasil = self.calc.hitung_diskon_batch(harga_sen, 33)
+        self.assertEqual(list(hasil), [self.calc.hitung_diskon(Money(h), 33).sen for h in harga_sen])
+
+        chunks = list(self.calc.hitung_diskon_stream(iter(range(1, 10001)), 20, ukuran_chunk=4096))
+        self.assertEqual([len(c) for c in chunks], [4096, 4096, 1808])
+        self.assertEqual(chunks[2][-1], self.calc.hitung_diskon(10000, 20))
+
+    # Test 11 – Persentase per produk yang tidak sejajar dengan harga ditolak
+    def test_persen_tidak_sejajar(self):
+        with self.assertRaises(ValueError):
+            self.calc.hitung_diskon_batch([1000.0, 2000.0], [10])
+        with self.assertRaises(ValueError):
+            self.calc.hitung_diskon_batch(array('q', [100000]), [10, 20])
+        with self.assertRaises(ValueError):
+            list(self.calc.hitung_diskon_stream(range(1, 10), [10] * 5, ukuran_chunk=4))
+        with self.assertRaises(ValueError):
+            list(self.calc.hitung_diskon_stream(range(1, 10), [10] * 12, ukuran_chunk=4))
+        self.assertEqual(len(list(self.calc.hitung_diskon_stream(range(1, 10), [10] * 9, ukuran_chunk=4))), 3)
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,47 @@
+import random
+import unittest
+from diskon_service import DiskonCalculator
+from money import Money
+from pricing_pipeline import DiskonBertingkatStage, DiskonPersenStage, PajakStage, PricingPipeline, VoucherStage
+
+class TestPricingPipeline(unittest.TestCase):
+
+    def test_standar_setara_diskon_calculator(self):
+        """Tes 1: Pipeline standar (diskon lalu PPN) sama persis dengan DiskonCalculator untuk Money."""
+        calc = DiskonCalculator()
+        pipeline = PricingPipeline.standar()
+        rng = random.Random(3)
+        for _ in range(2000):
+            harga = Money(rng.randint(-100, 10**9))
+            persen = rng.randint(-10, 120)
+            self.assertEqual(pipeline.hitung(harga, persen), calc.hitung_diskon(harga, persen))
+        self.assertEqual(PricingPipeline.tanpa_ppn().hitung(Money.of(1000), 10), Money.of(900))
+
+    def test_voucher_dan_bertingkat(self):
+        """Tes 2: Tahap dijalankan berurutan; voucher tidak membuat harga negatif."""
+        pipeline = PricingPipeline([
+            DiskonBertingkatStage([(Money.of(100000), 5), (Money.of(1000000), 10)]),
+            VoucherStage(Money.of(10000)),
+            PajakStage(10),
+        ])
+        # 2.000.000 -10% = 1.800.000, -10.000 = 1.790.000, +PPN = 1.969.000
+        self.assertEqual(pipeline.hitung(Money.of(2000000)), Money.of(1969000))
+        # 200.000 -5% = 190.000, -10.000 = 180.000, +PPN = 198.000
+        self.assertEqual(pipeline.hitung(Money.of(200000)), Money.of(198000))
+        # Di bawah semua ambang: hanya voucher (habis) lalu PPN
+        self.assertEqual(pipeline.hitung(Money.of(5000)), Money.zero())
+
+    def test_memo_hit_rate(self):
+        """Tes 3: Harga yang berulang dihitung sekali; hasil sama dengan tanpa memo."""
+        stages = [DiskonPersenStage(), PajakStage(10)]
+        katalog = [Money.of(h) for h in (9900, 19900, 49900)] * 100
+        dengan_memo = PricingPipeline(stages, memo_size=16)
+        tanpa_memo = PricingPipeline(stages, memo_size=0)
+        self.assertEqual(dengan_memo.hitung_banyak(katalog, 20), tanpa_memo.hitung_banyak(katalog, 20))
+        info = dengan_memo.cache_info()
+        self.assertEqual((info["misses"], info["hits"]), (3, 297))
+        self.assertAlmostEqual(info["hit_rate"], 0.99)
+        self.assertEqual(tanpa_memo.cache_info()["hits"], 0)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,240 @@
+# -------------------------- Suite Benchmark Jalur Panas --------------------------
+# Mengukur service utama di semua Pertemuan pada beberapa skala input, menyimpan hasilnya
+# sebagai baseline JSON, dan membandingkan hasil baru dengan baseline.
+#
+# Cara menjalankan (dari root repository):
+#   python benchmarks/run.py run [--output hasil.json] [--filter cart] [--quick]
+#   python benchmarks/run.py compare benchmarks/baseline.json hasil.json [--threshold 0.2]
+#   python benchmarks/run.py run --compare benchmarks/baseline.json
+#
+# Setiap Pertemuan memakai import datar (misalnya `from models import ...`) dengan nama modul
+# yang sama di beberapa folder, jadi setiap kasus dijalankan dengan folder-nya sendiri di
+# sys.path dan modul folder tersebut dibuang dari sys.modules setelahnya. Modul bersama
+# (money, wal, metrics, profiler) ada di folder `bersama/` yang selalu ada di sys.path.
+import argparse
+import json
+import logging
+import os
+import platform
+import random
+import sys
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Callable
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "bersama"))
+
+# (fungsi yang menjalankan `ops` operasi, ops)
+Siapan = tuple[Callable[[], object], int]
+
+@dataclass(frozen=True)
+class Kasus:
+    nama: str
+    folder: str
+    skala: tuple[int, ...]
+    siapkan: Callable[[int], Siapan]
+
+@contextmanager
+def folder_pertemuan(folder: str):
+    """Mengimpor modul dari satu folder Pertemuan tanpa bentrok nama dengan folder lain."""
+    path = os.path.join(ROOT, folder)
+    sebelum = set(sys.modules)
+    sys.path.insert(0, path)
+    try:
+        yield
+    finally:
+        sys.path.remove(path)
+        for nama in set(sys.modules) - sebelum:
+            if (getattr(sys.modules[nama], "__file__", None) or "").startswith(path):
+                del sys.modules[nama]
+
+# --- GENERATOR DATA SINTETIS & KASUS ---
+def siapkan_register_mhs(n: int) -> Siapan:
+    from Latihan_mandiri import Mahasiswa, RegistrationService, SksLimitRule, PrerequisiteRule
+    rng = random.Random(42)
+    daftar = [Mahasiswa(f"{i:08d}", rng.randint(12, 30), rng.random() < 0.9) for i in range(n)]
+    service = RegistrationService([SksLimitRule(), PrerequisiteRule()])
+    register = service.register_mhs
+    return (lambda: [register(m) for m in daftar]), n
+
+def siapkan_run_checkout(n: int) -> Siapan:
+    from refactor_solid import Order, CheckoutService, IPaymentProcessor, INotificationService
+
+    class ProsesorDiam(IPaymentProcessor):
+        def process(self, order) -> bool:
+            return True
+
+    class NotifierDiam(INotificationService):
+        def send(self, order):
+            pass
+
+    rng = random.Random(7)
+    orders = [Order(f"Pelanggan-{i}", rng.randint(1, 10_000) * 1000) for i in range(n)]
+    service = CheckoutService(ProsesorDiam(), NotifierDiam())
+    return (lambda: [service.run_checkout(o) for o in orders]), n
+
+def _katalog(n: int, seed: int = 11):
+    from models import Product
+    rng = random.Random(seed)
+    return [Product(f"P{i:06d}", f"Produk {i}", rng.randint(10, 20000) * 1000) for i in range(n)]
+
+def siapkan_cart_add_item(n: int) -> Siapan:
+    from services import ShoppingCart
+    katalog = _katalog(max(1, n // 2))
+    rng = random.Random(3)
+    pilihan = [rng.choice(katalog) for _ in range(n)]  # Sebagian produk ditambahkan berulang
+
+    def jalankan():
+        cart = ShoppingCart(debug=False)
+        for p in pilihan:
+            cart.add_item(p, 1)
+        return cart.total_price
+    return jalankan, n
+
+def siapkan_cart_total_price(n: int) -> Siapan:
+    from services import ShoppingCart
+    cart = ShoppingCart(debug=False)
+    for p in _katalog(n):
+        cart.add_item(p, 2)
+    ulang = 10_000
+    return (lambda: [cart.total_price for _ in range(ulang)]), ulang
+
+def siapkan_get_by_id(n: int) -> Siapan:
+    from repositories import ProductRepository
+    repo = ProductRepository()
+    repo._products = {p.id: p for p in _katalog(n)}
+    rng = random.Random(5)
+    ids = [f"P{rng.randrange(n):06d}" for _ in range(100_000)]
+    get = repo.get_by_id
+    return (lambda: [get(i) for i in ids]), len(ids)
+
+def siapkan_hitung_diskon(n: int, pakai_money: bool = False) -> Siapan:
+    from diskon_service import DiskonCalculator
+    from money import Money
+    calc = DiskonCalculator()
+    rng = random.Random(9)
+    harga = [rng.randint(1, 5_000_000) for _ in range(n)]
+    if pakai_money:
+        harga = [Money.of(h) for h in harga]
+    persen = [rng.randint(0, 100) for _ in range(n)]
+    hitung = calc.hitung_diskon
+    return (lambda: [hitung(h, p) for h, p in zip(harga, persen)]), n
+
+KASUS = [
+    Kasus("registrasi.register_mhs", "Pertemuan12", (1_000, 10_000, 100_000), siapkan_register_mhs),
+    Kasus("checkout.run_checkout", "Pertemuan12", (1_000, 10_000), siapkan_run_checkout),
+    Kasus("cart.add_item", "Pertemuan13", (100, 10_000, 100_000), siapkan_cart_add_item),
+    Kasus("cart.total_price", "Pertemuan13", (10, 10_000), siapkan_cart_total_price),
+    Kasus("repository.get_by_id", "Pertemuan13", (1_000, 100_000), siapkan_get_by_id),
+    Kasus("diskon.hitung_diskon", "Pertemuan14/LatihanMandiri", (1_000, 100_000), siapkan_hitung_diskon),
+    Kasus("diskon.hitung_diskon_money", "Pertemuan14/LatihanMandiri", (1_000, 100_000),
+          lambda n: siapkan_hitung_diskon(n, pakai_money=True)),
+]
+
+# --- PENGUKURAN ---
+def ukur(siapan: Siapan, ulang: int) -> float:
+    """Nanodetik per operasi: minimum dari beberapa pengulangan (paling tahan noise)."""
+    fungsi, ops = siapan
+    terbaik = float("inf")
+    for _ in range(ulang):
+        mulai = time.perf_counter_ns()
+        fungsi()
+        terbaik = min(terbaik, time.perf_counter_ns() - mulai)
+    return terbaik / ops
+
+def jalankan_suite(filter_nama: str | None = None, quick: bool = False, ulang: int = 5) -> dict:
+    # Log per operasi dimatikan; yang diukur adalah biaya logika, bukan I/O logging
+    logging.disable(logging.CRITICAL)
+    hasil = {}
+    for kasus in KASUS:
+        if filter_nama and filter_nama not in kasus.nama:
+            continue
+        skala = kasus.skala[:1] if quick else kasus.skala
+        with folder_pertemuan(kasus.folder):
+            for n in skala:
+                kunci = f"{kasus.nama}@{n}"
+                hasil[kunci] = round(ukur(kasus.siapkan(n), 1 if quick else ulang), 1)
+                print(f"{kunci:<40} {hasil[kunci]:>12,.1f} ns/op", flush=True)
+    logging.disable(logging.NOTSET)
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "waktu": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "instrumentasi": os.environ.get("INSTRUMENTASI", "1"),
+        },
+        "results": hasil,
+    }
+
+def bandingkan(baseline: dict, sekarang: dict, threshold: float = 0.2) -> list[str]:
+    """
+    Mencetak perbandingan dan mengembalikan daftar kasus yang regresi (lebih lambat dari
+    baseline melebihi `threshold`, misalnya 0.2 = 20%). Kasus baru/hilang hanya dilaporkan.
+    """
+    lama, baru = baseline["results"], sekarang["results"]
+    regresi = []
+    for kunci in sorted(set(lama) | set(baru)):
+        if kunci not in lama or kunci not in baru:
+            print(f"{kunci:<40} {'(baru)' if kunci in baru else '(hilang)'}")
+            continue
+        rasio = baru[kunci] / lama[kunci] if lama[kunci] else float("inf")
+        tanda = ""
+        if rasio > 1 + threshold:
+            tanda = "  <-- REGRESI"
+            regresi.append(kunci)
+        elif rasio < 1 - threshold:
+            tanda = "  (lebih cepat)"
+        print(f"{kunci:<40} {lama[kunci]:>12,.1f} -> {baru[kunci]:>12,.1f} ns/op ({rasio - 1:+.0%}){tanda}")
+    return regresi
+
+def _baca(path: str) -> dict:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Suite benchmark jalur panas semua Pertemuan.")
+    sub = parser.add_subparsers(dest="perintah", required=True)
+    p_run = sub.add_parser("run", help="Menjalankan benchmark.")
+    p_run.add_argument("--output", help="Simpan hasil sebagai JSON (misalnya benchmarks/baseline.json).")
+    p_run.add_argument("--filter", help="Hanya kasus yang namanya memuat teks ini.")
+    p_run.add_argument("--quick", action="store_true",
+                       help="Skala terkecil dan satu pengulangan saja (smoke test; tidak bisa dipakai dengan --compare).")
+    p_run.add_argument("--repeat", type=int, default=5, help="Jumlah pengulangan per kasus (diambil minimum).")
+    p_run.add_argument("--compare", help="Baseline JSON untuk dibandingkan setelah run.")
+    p_run.add_argument("--threshold", type=float, default=0.2)
+    p_cmp = sub.add_parser("compare", help="Membandingkan dua file hasil.")
+    p_cmp.add_argument("baseline")
+    p_cmp.add_argument("current")
+    p_cmp.add_argument("--threshold", type=float, default=0.2, help="Batas regresi relatif (0.2 = 20%%).")
+    args = parser.parse_args(argv)
+    if args.perintah == "run" and args.quick and args.compare:
+        # Satu pengulangan tanpa minimum terlalu bising untuk dibandingkan dengan baseline 5x
+        parser.error("--quick tidak bisa digabung dengan --compare; pakai --filter untuk run parsial.")
+
+    if args.perintah == "run":
+        hasil = jalankan_suite(args.filter, args.quick, args.repeat)
+        if args.output:
+            with open(args.output, "w", encoding="utf-8") as f:
+                json.dump(hasil, f, indent=2, sort_keys=True)
+                f.write("\n")
+            print(f"Hasil disimpan ke {args.output}")
+        if not args.compare:
+            return 0
+        baseline, sekarang = _baca(args.compare), hasil
+        if args.filter:
+            # Run parsial: kasus yang sengaja tidak dijalankan jangan dilaporkan hilang
+            baseline = {**baseline, "results": {k: v for k, v in baseline["results"].items() if k in hasil["results"]}}
+    else:
+        baseline, sekarang = _baca(args.baseline), _baca(args.current)
+
+    regresi = bandingkan(baseline, sekarang, args.threshold)
+    if regresi:
+        print(f"\n{len(regresi)} kasus regresi > {args.threshold:.0%}: {', '.join(regresi)}")
+        return 1
+    print("\nTidak ada regresi.")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
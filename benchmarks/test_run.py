@@ -0,0 +1,40 @@
+import io
+import os
+import sys
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+from run import bandingkan, folder_pertemuan, main
+
+class TestBenchmarkSuite(unittest.TestCase):
+
+    def test_bandingkan_menandai_regresi(self):
+        """Tes 1: Hanya kasus yang melambat melebihi threshold dianggap regresi."""
+        baseline = {"results": {"a@1": 100.0, "b@1": 100.0, "c@1": 100.0, "lama@1": 1.0}}
+        sekarang = {"results": {"a@1": 119.0, "b@1": 150.0, "c@1": 50.0, "baru@1": 1.0}}
+        with redirect_stdout(io.StringIO()) as keluaran:
+            regresi = bandingkan(baseline, sekarang, threshold=0.2)
+        self.assertEqual(regresi, ["b@1"])
+        self.assertIn("(hilang)", keluaran.getvalue())
+        self.assertIn("(lebih cepat)", keluaran.getvalue())
+
+    def test_folder_pertemuan_terisolasi(self):
+        """Tes 2: Modul `diskon_service` dari dua folder berbeda tidak saling menimpa; modul bersama tetap satu."""
+        with folder_pertemuan("Pertemuan14"):
+            import diskon_service
+            asal_14 = diskon_service.__file__
+        self.assertNotIn("diskon_service", sys.modules)
+        with folder_pertemuan("Pertemuan14/LatihanMandiri"):
+            import diskon_service
+            import money
+            self.assertNotEqual(diskon_service.__file__, asal_14)
+        self.assertIn(os.path.join("bersama", "money.py"), money.__file__)
+
+    def test_quick_ditolak_untuk_compare(self):
+        """Tes 3: --quick bersama --compare ditolak sebelum benchmark dijalankan."""
+        with redirect_stderr(io.StringIO()) as keluaran, self.assertRaises(SystemExit) as ctx:
+            main(["run", "--quick", "--compare", "baseline.json"])
+        self.assertEqual(ctx.exception.code, 2)
+        self.assertIn("--quick", keluaran.getvalue())
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,298 @@
+# -------------------------- Registry Metrik (Counter & Histogram) --------------------------
+# Counter dan histogram latensi bergaya HDR, dengan ekspor format teks Prometheus ke file
+# atau endpoint HTTP lokal.
+# Setiap thread menulis ke sel (list int) miliknya sendiri dan sel-sel itu baru dijumlahkan
+# saat ekspor. observe/inc hanya memakai lock saat thread pertama kali membuat selnya;
+# pembuatan child label dan ekspor (menyalin daftar sel) tetap memakai lock.
+# Histogram memakai bucket log-linear (16 sub-bucket per pangkat dua, galat relatif <= 6,25%),
+# jadi persentil tetap akurat dari nanodetik sampai menit tanpa konfigurasi bucket.
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import os
+import threading
+import time
+
+_perf_counter_ns = time.perf_counter_ns
+
+# --- BUCKET HDR (nanodetik) ---
+_PRESISI = 4                      # bit sub-bucket
+_SUB = 1 << _PRESISI              # 16 sub-bucket per pangkat dua
+_JUMLAH_BUCKET = (41 << _PRESISI)  # Cukup untuk nilai sampai ~2^41 ns (~36 menit)
+
+def _indeks(ns: int) -> int:
+    if ns < _SUB:
+        return ns if ns > 0 else 0
+    geser = ns.bit_length() - _PRESISI - 1
+    indeks = ((geser + 1) << _PRESISI) + (ns >> geser) - _SUB
+    return indeks if indeks < _JUMLAH_BUCKET else _JUMLAH_BUCKET - 1
+
+def _batas_atas(indeks: int) -> int:
+    """Nilai ns terbesar (eksklusif) yang masuk bucket `indeks`."""
+    if indeks < 2 * _SUB:
+        return indeks + 1
+    geser = (indeks >> _PRESISI) - 1
+    return ((indeks & (_SUB - 1)) + _SUB + 1) << geser
+
+# Batas bucket ekspor Prometheus (detik); bucket HDR digabung ke batas-batas ini
+BUCKET_EKSPOR = (0.00001, 0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01,
+                 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+class _PerThread:
+    """Kumpulan sel per thread; hanya pembuatan sel baru yang memakai lock."""
+    def __init__(self, ukuran: int):
+        self._ukuran = ukuran
+        self._local = threading.local()
+        self._cells: list[list[int]] = []
+        self._lock = threading.Lock()
+
+    def cell(self) -> list[int]:
+        try:
+            return self._local.cell
+        except AttributeError:
+            cell = [0] * self._ukuran
+            with self._lock:
+                self._cells.append(cell)
+            self._local.cell = cell
+            return cell
+
+    def merged(self) -> list[int]:
+        total = [0] * self._ukuran
+        with self._lock:
+            cells = list(self._cells)
+        for cell in cells:
+            for i, v in enumerate(cell):
+                if v:
+                    total[i] += v
+        return total
+
+class Counter:
+    def __init__(self):
+        self._data = _PerThread(1)
+        self._local = self._data._local
+
+    def inc(self, jumlah: int = 1):
+        try:
+            self._local.cell[0] += jumlah
+        except AttributeError:
+            self._data.cell()[0] += jumlah
+
+    @property
+    def value(self) -> int:
+        return self._data.merged()[0]
+
+class Histogram:
+    """Histogram latensi dalam nanodetik; slot terakhir setiap sel menyimpan jumlah (sum)."""
+    def __init__(self):
+        self._data = _PerThread(_JUMLAH_BUCKET + 1)
+        self._local = self._data._local
+
+    def observe_ns(self, ns: int):
+        try:
+            cell = self._local.cell
+        except AttributeError:
+            cell = self._data.cell()
+        # _indeks() di-inline: jalur ini dipanggil sekali per transaksi
+        if ns < _SUB:
+            indeks = ns if ns > 0 else 0
+        else:
+            geser = ns.bit_length() - _PRESISI - 1
+            indeks = ((geser + 1) << _PRESISI) + (ns >> geser) - _SUB
+            if indeks >= _JUMLAH_BUCKET:
+                indeks = _JUMLAH_BUCKET - 1
+        cell[indeks] += 1
+        cell[_JUMLAH_BUCKET] += ns
+
+    def snapshot(self) -> tuple[list[int], int]:
+        """(jumlah per bucket HDR, total ns)."""
+        merged = self._data.merged()
+        return merged[:_JUMLAH_BUCKET], merged[_JUMLAH_BUCKET]
+
+    @property
+    def count(self) -> int:
+        return sum(self.snapshot()[0])
+
+    def quantile(self, q: float) -> int:
+        """Perkiraan persentil (0 < q <= 1) dalam ns: batas atas bucket tempat persentil jatuh."""
+        counts, _ = self.snapshot()
+        total = sum(counts)
+        if not total:
+            return 0
+        target = q * total
+        kumulatif = 0
+        for i, c in enumerate(counts):
+            kumulatif += c
+            if c and kumulatif >= target:
+                return _batas_atas(i) - 1
+        return _batas_atas(_JUMLAH_BUCKET - 1) - 1
+
+class _Family:
+    """Satu nama metrik dengan beberapa kombinasi label; labels() di-cache, panggil sekali di luar jalur panas."""
+    def __init__(self, nama: str, bantuan: str, jenis: str, label: tuple[str, ...], buat):
+        self.nama, self.bantuan, self.jenis, self.label = nama, bantuan, jenis, label
+        self._buat = buat
+        self._anak: dict[tuple[str, ...], object] = {}
+        self._lock = threading.Lock()
+
+    def labels(self, **nilai: str):
+        kunci = tuple(str(nilai[l]) for l in self.label)
+        anak = self._anak.get(kunci)
+        if anak is None:
+            with self._lock:
+                anak = self._anak.setdefault(kunci, self._buat())
+        return anak
+
+    def items(self):
+        with self._lock:
+            return list(self._anak.items())
+
+def _escape(nilai: str) -> str:
+    return nilai.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+def _format_label(nama: tuple[str, ...], nilai: tuple[str, ...], tambahan: str = "") -> str:
+    bagian = [f'{n}="{_escape(v)}"' for n, v in zip(nama, nilai)]
+    if tambahan:
+        bagian.append(tambahan)
+    return "{" + ",".join(bagian) + "}" if bagian else ""
+
+# --- REGISTRY ---
+class MetricsRegistry:
+    def __init__(self):
+        self._families: dict[str, _Family] = {}
+        self._lock = threading.Lock()
+
+    def _family(self, nama: str, bantuan: str, jenis: str, label: tuple[str, ...], buat) -> _Family:
+        with self._lock:
+            family = self._families.get(nama)
+            if family is None:
+                family = self._families[nama] = _Family(nama, bantuan, jenis, tuple(label), buat)
+            elif family.jenis != jenis or family.label != tuple(label):
+                raise ValueError(f"Metrik {nama} sudah terdaftar dengan jenis/label berbeda.")
+            return family
+
+    def counter(self, nama: str, bantuan: str, label: tuple[str, ...] = ()) -> _Family:
+        return self._family(nama, bantuan, "counter", label, Counter)
+
+    def histogram(self, nama: str, bantuan: str, label: tuple[str, ...] = ()) -> _Family:
+        """Histogram latensi; diobservasi dalam ns, diekspor dalam detik."""
+        return self._family(nama, bantuan, "histogram", label, Histogram)
+
+    # --- Ekspor ---
+    def render_prometheus(self) -> str:
+        baris = []
+        with self._lock:
+            families = list(self._families.values())
+        for f in families:
+            baris.append(f"# HELP {f.nama} {f.bantuan}")
+            baris.append(f"# TYPE {f.nama} {f.jenis}")
+            for nilai, anak in f.items():
+                if f.jenis == "counter":
+                    baris.append(f"{f.nama}{_format_label(f.label, nilai)} {anak.value}")
+                    continue
+                counts, total_ns = anak.snapshot()
+                kumulatif, i = 0, 0
+                for le in BUCKET_EKSPOR:
+                    batas_ns = le * 1e9
+                    while i < _JUMLAH_BUCKET and _batas_atas(i) <= batas_ns:
+                        kumulatif += counts[i]
+                        i += 1
+                    label_le = _format_label(f.label, nilai, 'le="%s"' % le)
+                    baris.append(f"{f.nama}_bucket{label_le} {kumulatif}")
+                jumlah = sum(counts)
+                label_le = _format_label(f.label, nilai, 'le="+Inf"')
+                baris.append(f"{f.nama}_bucket{label_le} {jumlah}")
+                baris.append(f"{f.nama}_sum{_format_label(f.label, nilai)} {total_ns / 1e9}")
+                baris.append(f"{f.nama}_count{_format_label(f.label, nilai)} {jumlah}")
+        return "\n".join(baris) + "\n"
+
+    def write_file(self, path: str):
+        """Menulis snapshot secara atomik (cocok untuk textfile collector node_exporter)."""
+        sementara = f"{path}.{os.getpid()}.tmp"
+        with open(sementara, "w", encoding="utf-8") as f:
+            f.write(self.render_prometheus())
+        os.replace(sementara, path)
+
+    def serve_http(self, port: int = 9464, host: str = "127.0.0.1") -> ThreadingHTTPServer:
+        """Menjalankan endpoint GET /metrics di thread daemon; hentikan dengan server.shutdown()."""
+        registry = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?")[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                isi = registry.render_prometheus().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(isi)))
+                self.end_headers()
+                self.wfile.write(isi)
+
+            def log_message(self, format, *args):
+                pass  # Scrape berkala tidak perlu masuk log
+
+        server = ThreadingHTTPServer((host, port), Handler)
+        threading.Thread(target=server.serve_forever, name="metrics-http", daemon=True).start()
+        return server
+
+# Registry bawaan untuk aplikasi
+REGISTRY = MetricsRegistry()
+
+# --- PENGUKUR OPERASI BOOLEAN ---
+class MeteredCall:
+    """
+    Mengukur satu operasi yang mengembalikan bool (pembayaran, checkout, ...):
+    `<nama>_duration_seconds` (histogram) dan `<nama>_total{result=ok|<gagal>|error}` (counter).
+    Dipakai bersama oleh semua decorator metrik agar nama dan arti label tetap seragam.
+    Args:
+        registry (MetricsRegistry): Tujuan metrik.
+        nama (str): Prefix nama metrik.
+        bantuan_durasi (str): Teks HELP histogram.
+        bantuan_hasil (str): Teks HELP counter.
+        label (dict[str, str] | None): Label tetap untuk kedua metrik.
+        gagal (str): Nilai label `result` jika operasi mengembalikan False.
+    """
+    def __init__(self, registry: MetricsRegistry, nama: str, bantuan_durasi: str, bantuan_hasil: str,
+                 label: dict[str, str] | None = None, gagal: str = "failed"):
+        label = label or {}
+        durasi = registry.histogram(f"{nama}_duration_seconds", bantuan_durasi, tuple(label))
+        hasil = registry.counter(f"{nama}_total", bantuan_hasil, tuple(label) + ("result",))
+        # Child metrik di-resolve sekali di sini, bukan di setiap panggilan
+        self._durasi = durasi.labels(**label)
+        self._ok = hasil.labels(**label, result="ok")
+        self._gagal = hasil.labels(**label, result=gagal)
+        self._error = hasil.labels(**label, result="error")
+        # Sel per thread keempat child diambil sekali per thread: satu lookup thread-local per panggilan
+        self._lokal = threading.local()
+
+    def _sel(self) -> tuple[list[int], list[int], list[int]]:
+        sel = self._durasi._data.cell(), self._ok._data.cell(), self._gagal._data.cell()
+        self._lokal.sel = sel
+        return sel
+
+    def __call__(self, fungsi, *args) -> bool:
+        mulai = _perf_counter_ns()
+        try:
+            sukses = fungsi(*args)
+        except BaseException:
+            self._durasi.observe_ns(_perf_counter_ns() - mulai)
+            self._error.inc()
+            raise
+        ns = _perf_counter_ns() - mulai
+        try:
+            durasi, ok, gagal = self._lokal.sel
+        except AttributeError:
+            durasi, ok, gagal = self._sel()
+        # Sama dengan Histogram.observe_ns dan Counter.inc, di-inline untuk jalur per transaksi
+        if ns < _SUB:
+            indeks = ns if ns > 0 else 0
+        else:
+            geser = ns.bit_length() - _PRESISI - 1
+            indeks = ((geser + 1) << _PRESISI) + (ns >> geser) - _SUB
+            if indeks >= _JUMLAH_BUCKET:
+                indeks = _JUMLAH_BUCKET - 1
+        durasi[indeks] += 1
+        durasi[_JUMLAH_BUCKET] += ns
+        if sukses:
+            ok[0] += 1
+        else:
+            gagal[0] += 1
+        return sukses
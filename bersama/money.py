@@ -0,0 +1,127 @@
+from array import array
+from dataclasses import dataclass
+from decimal import Decimal, ROUND_CEILING, ROUND_DOWN, ROUND_FLOOR, ROUND_HALF_EVEN, ROUND_HALF_UP, ROUND_UP
+from fractions import Fraction
+from typing import Iterable
+
+SEN_PER_RUPIAH = 100
+
+def bagi_bulat(pembilang: int, penyebut: int, rounding: str = ROUND_HALF_UP) -> int:
+    """
+    Pembagian integer dengan mode pembulatan eksplisit (konstanta dari modul decimal).
+    Args:
+        pembilang (int), penyebut (int): Operan pembagian; penyebut harus > 0.
+        rounding (str): ROUND_HALF_UP, ROUND_HALF_EVEN, ROUND_DOWN, ROUND_UP, ROUND_FLOOR, atau ROUND_CEILING.
+    """
+    hasil_bawah, sisa = divmod(pembilang, penyebut)  # hasil_bawah = floor, 0 <= sisa < penyebut
+    if sisa == 0 or rounding == ROUND_FLOOR:
+        return hasil_bawah
+    if rounding == ROUND_CEILING:
+        return hasil_bawah + 1
+    positif = pembilang > 0
+    if rounding == ROUND_DOWN:
+        return hasil_bawah if positif else hasil_bawah + 1
+    if rounding == ROUND_UP:
+        return hasil_bawah + 1 if positif else hasil_bawah
+    if rounding in (ROUND_HALF_UP, ROUND_HALF_EVEN):
+        if 2 * sisa > penyebut:
+            return hasil_bawah + 1
+        if 2 * sisa < penyebut:
+            return hasil_bawah
+        if rounding == ROUND_HALF_UP:
+            return hasil_bawah + 1 if positif else hasil_bawah
+        return hasil_bawah if hasil_bawah % 2 == 0 else hasil_bawah + 1
+    raise ValueError(f"Mode pembulatan tidak didukung: {rounding}")
+
+@dataclass(frozen=True, slots=True, order=True)
+class Money:
+    """
+    Nilai uang Rupiah dalam satuan terkecil (sen, 1/100 Rupiah) sebagai integer.
+    Penjumlahan dan pengurangan selalu eksak; pembulatan hanya terjadi pada operasi
+    persentase dan selalu memakai mode pembulatan yang eksplisit.
+    """
+    sen: int
+
+    def __post_init__(self):
+        if not isinstance(self.sen, int) or isinstance(self.sen, bool):
+            raise TypeError(f"Money.sen harus int, bukan {type(self.sen).__name__}.")
+
+    @classmethod
+    def of(cls, nilai: "int | float | str | Decimal | Money", rounding: str = ROUND_HALF_UP) -> "Money":
+        """Membuat Money dari nilai Rupiah (misalnya 15000000, "2500.50", atau 999.99)."""
+        if isinstance(nilai, Money):
+            return nilai
+        if isinstance(nilai, int) and not isinstance(nilai, bool):
+            return cls(nilai * SEN_PER_RUPIAH)
+        if isinstance(nilai, float):
+            nilai = repr(nilai)  # Representasi desimal terpendek, bukan nilai biner float
+        desimal = Decimal(nilai) * SEN_PER_RUPIAH
+        return cls(int(desimal.quantize(Decimal(1), rounding=rounding)))
+
+    @classmethod
+    def zero(cls) -> "Money":
+        return cls(0)
+
+    # --- Aritmetika eksak ---
+    def __add__(self, other: "Money") -> "Money":
+        if not isinstance(other, Money):
+            return NotImplemented
+        return Money(self.sen + other.sen)
+
+    def __radd__(self, other) -> "Money":
+        # Mendukung sum(...) yang dimulai dari 0
+        if other == 0:
+            return self
+        return NotImplemented
+
+    def __sub__(self, other: "Money") -> "Money":
+        if not isinstance(other, Money):
+            return NotImplemented
+        return Money(self.sen - other.sen)
+
+    def __neg__(self) -> "Money":
+        return Money(-self.sen)
+
+    def __mul__(self, faktor: int) -> "Money":
+        if not isinstance(faktor, int) or isinstance(faktor, bool):
+            return NotImplemented  # Perkalian pecahan harus lewat persen() agar pembulatannya eksplisit
+        return Money(self.sen * faktor)
+
+    __rmul__ = __mul__
+
+    def __bool__(self) -> bool:
+        return self.sen != 0
+
+    def persen(self, persentase: "int | str | Decimal | Fraction", rounding: str = ROUND_HALF_UP) -> "Money":
+        """Mengembalikan `persentase`% dari nilai ini, dibulatkan ke sen dengan mode `rounding`."""
+        p = Fraction(persentase)
+        return Money(bagi_bulat(self.sen * p.numerator, 100 * p.denominator, rounding))
+
+    # --- Konversi & tampilan ---
+    def to_decimal(self) -> Decimal:
+        return Decimal(self.sen) / SEN_PER_RUPIAH
+
+    def __float__(self) -> float:
+        return self.sen / SEN_PER_RUPIAH
+
+    def __format__(self, spec: str) -> str:
+        """Format seperti angka Rupiah, misalnya f"Rp{harga:,.0f}"."""
+        return format(self.to_decimal(), spec)
+
+    def __str__(self) -> str:
+        return f"Rp{self:,.2f}"
+
+    # --- Operasi batch (int64) ---
+    @staticmethod
+    def total(nilai: Iterable["Money"]) -> "Money":
+        """Jumlah eksak banyak Money."""
+        return Money(sum(m.sen for m in nilai))
+
+    @staticmethod
+    def to_array(nilai: Iterable["Money"]) -> array:
+        """Mengubah Money menjadi array int64 (sen), siap untuk aritmetika batch/vektor."""
+        return array('q', (m.sen for m in nilai))
+
+    @staticmethod
+    def from_array(sen: Iterable[int]) -> list["Money"]:
+        return [Money(s) for s in sen]
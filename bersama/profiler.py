@@ -0,0 +1,244 @@
+# -------------------------- Mode Profiling On-Demand --------------------------
+# Profiling proses yang sedang berjalan tanpa restart dan tanpa menyisipkan pdb.set_trace():
+# satu "jendela" profiling dimulai lewat flag CLI atau sinyal (SIGUSR1), berjalan selama
+# `durasi` detik (atau sampai dihentikan), lalu menulis:
+#   <prefix>.pstats     : data cProfile (pstats / snakeviz)
+#   <prefix>.txt        : ringkasan fungsi termahal (cumulative time)
+#   <prefix>.collapsed  : stack hasil sampling dalam format collapsed (flamegraph.pl, speedscope)
+#   <prefix>.alloc.txt  : alokasi memori terbesar selama jendela (tracemalloc)
+# cProfile hanya aktif di dalam Profiler.jalankan() (pekerjaan yang dibungkus), sedangkan
+# sampler stack dan tracemalloc aktif untuk seluruh proses selama jendela terbuka.
+# Di luar jendela, biaya jalankan() hanya satu pengecekan atribut. Bungkus pekerjaan
+# non-interaktif saja (bukan handler yang menunggu input()), agar waktu menunggu pengguna
+# tidak ikut terekam sebagai biaya.
+import argparse
+import cProfile
+import io
+import logging
+import os
+import pstats
+import signal
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+
+LOGGER = logging.getLogger('PROFILER')
+
+class _Sampler(threading.Thread):
+    """Mengambil stack semua thread setiap `interval` detik dan menghitung kemunculan tiap stack."""
+    def __init__(self, interval: float):
+        super().__init__(name="profiler-sampler", daemon=True)
+        self.interval = interval
+        self.stacks: Counter[str] = Counter()
+        self._berhenti = threading.Event()
+
+    def run(self):
+        sendiri = threading.get_ident()
+        label: dict[object, str] = {}  # Cache nama frame per code object
+        while not self._berhenti.wait(self.interval):
+            nama_thread = {t.ident: t.name for t in threading.enumerate()}
+            for ident, frame in sys._current_frames().items():
+                if ident == sendiri:
+                    continue
+                bagian = []
+                while frame is not None:
+                    code = frame.f_code
+                    nama = label.get(code)
+                    if nama is None:
+                        nama = label[code] = f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+                    bagian.append(nama)
+                    frame = frame.f_back
+                bagian.append(nama_thread.get(ident, str(ident)))
+                self.stacks[";".join(reversed(bagian))] += 1
+
+    def stop(self):
+        self._berhenti.set()
+        self.join()
+
+class _Sesi:
+    __slots__ = ("prefix", "profile", "sampler", "timer", "alokasi_awal", "tracemalloc_sendiri", "mulai",
+                 "pemilik", "bebas")
+
+class Profiler:
+    """
+    Pengendali jendela profiling.
+    Args:
+        output_dir (str): Folder tujuan laporan.
+        durasi (float): Panjang jendela default dalam detik; 0 berarti sampai stop() dipanggil.
+        interval (float): Jeda sampling stack dalam detik.
+        top (int): Jumlah baris pada laporan fungsi dan alokasi.
+        tracemalloc_frames (int): Kedalaman traceback yang disimpan tracemalloc.
+    """
+    def __init__(self, output_dir: str, durasi: float = 30.0, interval: float = 0.005, top: int = 25,
+                 tracemalloc_frames: int = 10):
+        self.output_dir = output_dir
+        self.durasi = durasi
+        self.interval = interval
+        self.top = top
+        self.tracemalloc_frames = tracemalloc_frames
+        self.laporan: list[dict[str, str]] = []  # Path laporan setiap jendela yang sudah selesai
+        self._sesi: _Sesi | None = None
+        # Lock hanya melindungi perubahan state (tidak pernah dipegang selama fungsi yang diprofil
+        # berjalan). RLock: stop() bisa dipanggil handler sinyal di thread yang sedang memegangnya.
+        self._lock = threading.RLock()
+        self._menutup = False  # Laporan jendela terakhir masih ditulis
+
+    @property
+    def aktif(self) -> bool:
+        """True selama jendela terbuka atau laporannya belum selesai ditulis."""
+        return self._sesi is not None or self._menutup
+
+    def start(self, durasi: float | None = None) -> bool:
+        """Membuka jendela profiling; False jika sudah ada jendela yang aktif."""
+        with self._lock:
+            if self._sesi is not None or self._menutup:
+                return False
+            os.makedirs(self.output_dir, exist_ok=True)
+            sesi = _Sesi()
+            sesi.prefix = os.path.join(self.output_dir, f"profil-{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}")
+            sesi.profile = cProfile.Profile()
+            sesi.tracemalloc_sendiri = not tracemalloc.is_tracing()
+            if sesi.tracemalloc_sendiri:
+                tracemalloc.start(self.tracemalloc_frames)
+            sesi.alokasi_awal = tracemalloc.take_snapshot()
+            sesi.sampler = _Sampler(self.interval)
+            sesi.sampler.start()
+            durasi = self.durasi if durasi is None else durasi
+            sesi.timer = None
+            if durasi > 0:
+                sesi.timer = threading.Timer(durasi, self.stop)
+                sesi.timer.daemon = True
+                sesi.timer.start()
+            sesi.pemilik = None  # Thread yang sedang menjalankan panggilan terprofil
+            sesi.bebas = threading.Event()  # Set selama tidak ada panggilan terprofil
+            sesi.bebas.set()
+            sesi.mulai = time.perf_counter()
+            self._sesi = sesi
+        LOGGER.info("Profiling dimulai (%s), laporan: %s.*", f"{durasi:g} detik" if durasi > 0 else "sampai dihentikan", sesi.prefix)
+        return True
+
+    def stop(self) -> dict[str, str] | None:
+        """
+        Menutup jendela aktif dan menulis laporan; mengembalikan path per jenis laporan.
+        Sampler dan tracemalloc berhenti saat itu juga. cProfile hanya bisa dimatikan dari thread
+        yang merekamnya, jadi jika ada panggilan terprofil di thread lain, laporan ditulis setelah
+        panggilan itu keluar (selisihnya dicatat di laporan). Sampai laporan selesai, aktif tetap
+        True dan start() ditolak.
+        """
+        with self._lock:
+            sesi, self._sesi = self._sesi, None
+            if sesi is None:
+                return None
+            self._menutup = True
+        try:
+            detik = time.perf_counter() - sesi.mulai
+            if sesi.timer is not None:
+                sesi.timer.cancel()
+            sesi.sampler.stop()
+            alokasi = tracemalloc.take_snapshot()
+            if sesi.tracemalloc_sendiri:
+                tracemalloc.stop()
+            if sesi.pemilik == threading.get_ident():
+                sesi.profile.disable()  # Dipanggil dari dalam panggilan terprofil (handler sinyal)
+            else:
+                sesi.bebas.wait()
+            tambahan = time.perf_counter() - sesi.mulai - detik
+            laporan = self._tulis_laporan(sesi, alokasi, detik, tambahan)
+            with self._lock:
+                self.laporan.append(laporan)
+        finally:
+            with self._lock:
+                self._menutup = False
+        LOGGER.info("Profiling selesai: %s", ", ".join(laporan.values()))
+        return laporan
+
+    def toggle(self):
+        """Memulai jendela jika belum aktif, atau menutupnya jika sedang aktif."""
+        if self.stop() is None and not self._menutup:
+            self.start()
+
+    def install_signal(self, signum: int | None = None) -> bool:
+        """Memasang toggle() pada sinyal (default SIGUSR1); False jika platform tidak mendukung."""
+        signum = signum if signum is not None else getattr(signal, "SIGUSR1", None)
+        if signum is None:
+            return False
+        signal.signal(signum, lambda *_: self.toggle())
+        return True
+
+    def jalankan(self, fungsi, *args, **kwargs):
+        """
+        Memanggil `fungsi`; jika jendela aktif, panggilan tersebut direkam cProfile.
+        Satu objek cProfile hanya boleh aktif di satu thread: panggilan lain yang datang
+        bersamaan (atau bersarang) tetap berjalan, hanya tanpa direkam.
+        """
+        if self._sesi is None:
+            return fungsi(*args, **kwargs)
+        with self._lock:
+            sesi = self._sesi
+            if sesi is None or sesi.pemilik is not None:
+                sesi = None
+            else:
+                sesi.pemilik = threading.get_ident()
+                sesi.bebas.clear()
+                sesi.profile.enable()
+        if sesi is None:
+            return fungsi(*args, **kwargs)
+        try:
+            return fungsi(*args, **kwargs)
+        finally:
+            sesi.profile.disable()
+            with self._lock:
+                sesi.pemilik = None
+                sesi.bebas.set()
+
+    # --- Laporan ---
+    def _tulis_laporan(self, sesi: _Sesi, alokasi: tracemalloc.Snapshot, detik: float, tambahan: float) -> dict[str, str]:
+        laporan = {key: sesi.prefix + ext for key, ext in
+                   (("pstats", ".pstats"), ("ringkasan", ".txt"), ("collapsed", ".collapsed"), ("alokasi", ".alloc.txt"))}
+        sesi.profile.create_stats()
+        sesi.profile.dump_stats(laporan["pstats"])
+        buffer = io.StringIO()
+        buffer.write(f"Jendela profiling {detik:.2f} detik\n")
+        if tambahan >= 0.01:
+            buffer.write(f"cProfile menunggu panggilan yang sedang berjalan selesai (+{tambahan:.2f} detik)\n")
+        if sesi.profile.stats:
+            pstats.Stats(sesi.profile, stream=buffer).sort_stats("cumulative").print_stats(self.top)
+        else:
+            buffer.write("Tidak ada handler yang dipanggil selama jendela ini.\n")
+        with open(laporan["ringkasan"], "w", encoding="utf-8") as f:
+            f.write(buffer.getvalue())
+
+        with open(laporan["collapsed"], "w", encoding="utf-8") as f:
+            for stack, jumlah in sesi.sampler.stacks.most_common():
+                f.write(f"{stack} {jumlah}\n")
+
+        abaikan = (tracemalloc.Filter(False, tracemalloc.__file__), tracemalloc.Filter(False, __file__))
+        selisih = alokasi.filter_traces(abaikan).compare_to(sesi.alokasi_awal.filter_traces(abaikan), "lineno")
+        with open(laporan["alokasi"], "w", encoding="utf-8") as f:
+            total = sum(s.size_diff for s in selisih)
+            f.write(f"Pertambahan memori selama jendela: {total / 1024:,.1f} KiB\n")
+            for stat in selisih[:self.top]:
+                f.write(f"{stat}\n")
+        return laporan
+
+# --- INTEGRASI CLI ---
+def tambah_argumen(parser: argparse.ArgumentParser):
+    """Menambahkan opsi --profile-* ke parser titik masuk."""
+    parser.add_argument("--profile-dir", help="Aktifkan mode profiling; laporan ditulis ke folder ini. "
+                                              "Kirim SIGUSR1 untuk memulai/menghentikan jendela.")
+    parser.add_argument("--profile-start", action="store_true", help="Langsung buka jendela profiling saat start.")
+    parser.add_argument("--profile-seconds", type=float, default=30.0,
+                        help="Panjang jendela profiling dalam detik (0 = sampai dihentikan/keluar).")
+
+def dari_argumen(args: argparse.Namespace) -> Profiler | None:
+    """Membuat Profiler dari opsi CLI; None jika --profile-dir tidak diberikan."""
+    if not args.profile_dir:
+        return None
+    profiler = Profiler(args.profile_dir, durasi=args.profile_seconds)
+    if profiler.install_signal():
+        LOGGER.info("Mode profiling siap: kirim SIGUSR1 ke PID %d untuk memulai/menghentikan.", os.getpid())
+    if args.profile_start:
+        profiler.start()
+    return profiler
@@ -0,0 +1,257 @@
+from typing import Callable, Iterable, Iterator
+import json
+import logging
+import os
+import struct
+import threading
+import time
+import zlib
+
+LOGGER = logging.getLogger('WAL')
+
+# Record: panjang payload (I) | crc32 seq+payload (I) | seq (Q) | payload JSON (utf-8)
+_HEADER = struct.Struct("<IIQ")
+_SEQ = struct.Struct("<Q")
+
+def _encode(seq: int, payload: dict) -> bytes:
+    data = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return _HEADER.pack(len(data), zlib.crc32(_SEQ.pack(seq) + data), seq) + data
+
+def _scan(path: str) -> Iterator[tuple[int, int, dict]]:
+    """Menghasilkan (offset akhir record, seq, payload) sampai record terakhir yang utuh."""
+    if not os.path.exists(path):
+        return
+    with open(path, "rb") as f:
+        offset = 0
+        while True:
+            header = f.read(_HEADER.size)
+            if len(header) < _HEADER.size:
+                return
+            panjang, crc, seq = _HEADER.unpack(header)
+            data = f.read(panjang)
+            if len(data) < panjang or zlib.crc32(_SEQ.pack(seq) + data) != crc:
+                return  # Ekor yang terpotong/rusak karena crash di tengah penulisan
+            offset += _HEADER.size + panjang
+            yield offset, seq, json.loads(data)
+
+class _Tunggu:
+    """Penanda selesai satu append di antrean group commit, beserta error batch-nya (jika ada)."""
+    __slots__ = ("selesai", "error")
+
+    def __init__(self):
+        self.selesai = threading.Event()
+        self.error: BaseException | None = None
+
+class TransactionJournal:
+    """
+    Write-ahead log append-only untuk transaksi yang sudah dibayar.
+
+    append() baru kembali setelah record benar-benar di-fsync. Dengan group commit, semua
+    append yang datang bersamaan dikumpulkan oleh satu thread penulis dan di-fsync sekali,
+    sehingga biaya fsync dibagi ke banyak transaksi. Tanpa group commit, setiap append
+    melakukan write + fsync sendiri.
+
+    Saat dibuka, log dipulihkan: ekor yang terpotong akibat crash dibuang. Jika ukuran log
+    melewati `compact_bytes` dan `snapshot_fn` diberikan, semua record diringkas menjadi
+    satu record snapshot (ditulis ke file sementara lalu os.replace, jadi atomik).
+
+    Args:
+        path (str): Lokasi file log.
+        group_commit (bool): Aktifkan group commit (default True).
+        commit_delay (float): Jeda maksimum (detik) menunggu append lain sebelum fsync.
+        max_batch (int): Jumlah record maksimum per fsync.
+        snapshot_fn: Fungsi yang meringkas payload-payload lama menjadi satu payload snapshot.
+        compact_bytes (int | None): Ambang ukuran file untuk kompaksi otomatis.
+        fsync (bool): Matikan hanya untuk tes; tanpa fsync log tidak tahan crash OS.
+    """
+    def __init__(
+        self,
+        path: str,
+        group_commit: bool = True,
+        commit_delay: float = 0.0,
+        max_batch: int = 1024,
+        snapshot_fn: Callable[[Iterable[dict]], dict] | None = None,
+        compact_bytes: int | None = None,
+        fsync: bool = True,
+    ):
+        self.path = path
+        self.group_commit = group_commit
+        self.commit_delay = commit_delay
+        self.max_batch = max_batch
+        self.snapshot_fn = snapshot_fn
+        self.compact_bytes = compact_bytes
+        self._fsync = os.fsync if fsync else (lambda fd: None)
+        self.fsync_count = 0
+
+        self.recovered, self._size, terakhir = self._recover()
+        self._next_seq = terakhir + 1
+        self._file = open(path, "ab")
+        self._io_lock = threading.Lock()
+
+        # Antrean group commit: list (data, _Tunggu) + kondisi untuk membangunkan penulis
+        self._pending: list[tuple[bytes, _Tunggu]] = []
+        self._cond = threading.Condition()
+        self._closed = False
+        self._rusak: BaseException | None = None  # File tidak bisa dipulihkan; jurnal tidak dipakai lagi
+        self._writer = None
+        if group_commit:
+            self._writer = threading.Thread(target=self._writer_loop, name="wal-writer", daemon=True)
+            self._writer.start()
+
+    # --- Pemulihan & replay ---
+    def _recover(self) -> tuple[int, int, int]:
+        jumlah, offset, seq = 0, 0, 0
+        for offset, seq, _ in _scan(self.path):
+            jumlah += 1
+        if os.path.exists(self.path) and os.path.getsize(self.path) > offset:
+            LOGGER.warning("WAL %s: membuang %d byte ekor rusak.", self.path, os.path.getsize(self.path) - offset)
+            with open(self.path, "r+b") as f:
+                f.truncate(offset)
+                os.fsync(f.fileno())
+        if jumlah:
+            LOGGER.info("WAL %s: %d record dipulihkan (seq terakhir %d).", self.path, jumlah, seq)
+        return jumlah, offset, seq
+
+    @staticmethod
+    def replay(path: str) -> Iterator[tuple[int, dict]]:
+        """Membaca ulang (seq, payload) yang sudah committed, berurutan."""
+        for _, seq, payload in _scan(path):
+            yield seq, payload
+
+    # --- Append ---
+    def append(self, payload: dict) -> int:
+        """Menulis satu record secara durable dan mengembalikan nomor seq-nya."""
+        if self._rusak is not None:
+            raise RuntimeError("WAL rusak dan sudah ditutup.") from self._rusak
+        if not self.group_commit:
+            with self._io_lock:
+                seq = self._next_seq
+                self._next_seq += 1
+                self._write_batch([_encode(seq, payload)])
+            return seq
+
+        tunggu = _Tunggu()
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("TransactionJournal sudah ditutup.")
+            seq = self._next_seq
+            self._next_seq += 1
+            # Di-encode di dalam lock agar urutan di antrean sama dengan urutan seq
+            self._pending.append((_encode(seq, payload), tunggu))
+            self._cond.notify()
+        tunggu.selesai.wait()
+        if tunggu.error is not None:
+            raise RuntimeError("Gagal menulis WAL.") from tunggu.error
+        return seq
+
+    def _write_batch(self, records: list[bytes]):
+        """Menulis dan fsync satu batch; jika gagal, file dikembalikan ke ukuran terakhir yang utuh."""
+        if self._rusak is not None:
+            raise self._rusak
+        data = b"".join(records)
+        try:
+            self._file.write(data)
+            self._file.flush()
+            self._fsync(self._file.fileno())
+        except BaseException:
+            self._pulihkan_ekor()
+            raise
+        self.fsync_count += 1
+        self._size += len(data)
+        if self.compact_bytes and self.snapshot_fn and self._size > self.compact_bytes:
+            try:
+                self._compact_locked()
+            except Exception as e:
+                # Batch sudah durable; kompaksi dicoba lagi pada batch berikutnya
+                LOGGER.error("WAL %s: kompaksi gagal: %s", self.path, e)
+                if self._file.closed:
+                    self._file = open(self.path, "ab")
+                    self._size = os.path.getsize(self.path)
+
+    def _pulihkan_ekor(self):
+        """
+        Membuang byte batch yang gagal (mungkin tertulis sebagian) agar record berikutnya tidak
+        terletak setelah ekor rusak, yang akan ikut terbuang saat pemulihan. Jika file tidak bisa
+        dipulihkan, jurnal ditandai rusak dan append berikutnya langsung gagal.
+        """
+        try:
+            self._file.close()  # Buffer yang gagal di-flush ikut dibuang
+        except OSError:
+            pass
+        try:
+            with open(self.path, "r+b") as f:
+                f.truncate(self._size)
+                os.fsync(f.fileno())
+            self._file = open(self.path, "ab")
+        except OSError as e:
+            self._rusak = e
+            LOGGER.critical("WAL %s tidak bisa dipulihkan setelah penulisan gagal; jurnal ditutup: %s", self.path, e)
+
+    def _writer_loop(self):
+        while True:
+            with self._cond:
+                while not self._pending and not self._closed:
+                    self._cond.wait()
+                if not self._pending and self._closed:
+                    return
+                # Beri kesempatan append lain bergabung sebelum fsync (opsional; tanpa jeda pun
+                # append yang datang selama fsync sebelumnya otomatis masuk batch berikutnya)
+                batas = time.monotonic() + self.commit_delay
+                while len(self._pending) < self.max_batch and not self._closed:
+                    sisa = batas - time.monotonic()
+                    if sisa <= 0:
+                        break
+                    self._cond.wait(sisa)
+                batch = self._pending[:self.max_batch]
+                del self._pending[:self.max_batch]
+            error = None
+            try:
+                with self._io_lock:
+                    self._write_batch([data for data, _ in batch])
+            except BaseException as e:
+                LOGGER.error("WAL %s: penulisan batch gagal: %s", self.path, e)
+                error = e
+            # Error hanya dilaporkan ke penunggu batch ini, bukan ke append berikutnya
+            for _, tunggu in batch:
+                tunggu.error = error
+                tunggu.selesai.set()
+
+    # --- Kompaksi ---
+    def compact(self, snapshot_fn: Callable[[Iterable[dict]], dict] | None = None):
+        """Meringkas seluruh log menjadi satu record snapshot secara atomik."""
+        with self._io_lock:
+            self._compact_locked(snapshot_fn)
+
+    def _compact_locked(self, snapshot_fn: Callable[[Iterable[dict]], dict] | None = None):
+        snapshot_fn = snapshot_fn or self.snapshot_fn
+        if snapshot_fn is None:
+            raise ValueError("snapshot_fn diperlukan untuk kompaksi.")
+        self._file.flush()
+        terakhir = 0
+        def payloads():
+            nonlocal terakhir
+            for seq, payload in self.replay(self.path):
+                terakhir = seq
+                yield payload
+        snapshot = snapshot_fn(payloads())
+        sementara = self.path + ".compact"
+        data = _encode(terakhir, snapshot)  # Snapshot memakai seq terakhir yang diringkas
+        with open(sementara, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        self._file.close()
+        os.replace(sementara, self.path)
+        self._file = open(self.path, "ab")
+        self._size = len(data)
+        LOGGER.info("WAL %s dikompaksi sampai seq %d.", self.path, terakhir)
+
+    def close(self):
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        if self._writer is not None:
+            self._writer.join()
+        with self._io_lock:
+            if not self._file.closed:
+                self._file.close()
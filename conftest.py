@@ -0,0 +1,8 @@
+# Modul bersama (money, wal, metrics, profiler) dipakai beberapa folder Pertemuan yang
+# diimpor secara datar, jadi folder-nya ditambahkan ke sys.path sebelum tes dikumpulkan.
+import os
+import sys
+
+BERSAMA = os.path.join(os.path.dirname(os.path.abspath(__file__)), "bersama")
+if BERSAMA not in sys.path:
+    sys.path.insert(0, BERSAMA)